@@ -0,0 +1,158 @@
+# Funnel counts for the beta reader Sankey (chart_script.py).
+#
+# One streaming pass over the applications counts how many applicants reached
+# each stage, how many were disqualified at each stage's min_score_required
+# and how the rest were classified. Input is either raw applications (scored
+# here chunk by chunk with beta_reader_scoring) or already scored results
+# (beta_reader_scoring.py --output), as JSON Lines; only one chunk is held in
+# memory.
+#
+# The counts are cached under the repository's .build_cache/ (git-ignored and
+# outside Vite's public/ dir, so applicant aggregates are never deployed), keyed
+# by the input file's path, size and mtime plus the scoring table digest, so
+# re-rendering the dashboard does not rescan the applications unless they or
+# the config changed. The latest
+# counts are also written to beta_reader_funnel.json, which chart_script.py
+# reads. Until that file exists (e.g. on a clean checkout), load_counts()
+# returns SAMPLE_COUNTS, the illustrative widths the chart used before it had
+# real data, marked "sample" so the chart can say so.
+#
+# Usage:
+#   python beta_reader_funnel.py applications.jsonl
+#   python beta_reader_funnel.py scores.jsonl --no-cache
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from itertools import islice
+
+import beta_reader_scoring as scoring
+from beta_reader_table import CLASSIFICATIONS, compile_table
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FUNNEL_PATH = os.path.join(BASE_DIR, "beta_reader_funnel.json")
+REPO_ROOT = os.path.abspath(os.path.join(BASE_DIR, "..", "..", "..", "..", "..", ".."))
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".build_cache", "beta_reader_funnel")
+DEFAULT_CHUNK_SIZE = 5000
+
+SAMPLE_COUNTS = {
+    "applications": 40,
+    "sample": True,
+    "stages": ["Stage 1", "Stage 2", "Stage 3", "Stage 4"],
+    "entered": [40, 30, 30, 30],
+    "disqualified": [10, 0, 0, 0],
+    "outcomes": {"auto_accept": 8, "strong_candidate": 8, "interview_required": 7, "auto_reject": 7},
+}
+
+
+def empty_counts(stage_names):
+    return {
+        "applications": 0,
+        "stages": list(stage_names),
+        "entered": [0] * len(stage_names),
+        "disqualified": [0] * len(stage_names),
+        "outcomes": {classification: 0 for classification in CLASSIFICATIONS},
+    }
+
+
+def add_record(counts, record):
+    """Count one scored result (as produced by beta_reader_scoring.iter_results)."""
+    counts["applications"] += 1
+    for index in range(len(record["stage_scores"])):
+        counts["entered"][index] += 1
+    if record.get("failed_stage"):
+        counts["disqualified"][counts["stages"].index(record["failed_stage"])] += 1
+    else:
+        counts["outcomes"][record["classification"]] += 1
+
+
+def iter_records(path, config, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Scored results from a JSON Lines file of applications or of results."""
+    with open(path, "r", encoding="utf-8") as f:
+        rows = (json.loads(line) for line in f if line.strip())
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            if "classification" in chunk[0]:
+                yield from chunk
+            else:
+                yield from scoring.iter_results(chunk, scoring.score_applications(chunk, config))
+
+
+def aggregate(path, config, chunk_size=DEFAULT_CHUNK_SIZE):
+    counts = empty_counts([stage["name"] for stage in compile_table(config)["stages"]])
+    for record in iter_records(path, config, chunk_size):
+        add_record(counts, record)
+    return counts
+
+
+def cache_key(path, config):
+    stat = os.stat(path)
+    identity = f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}\0{compile_table(config)['source_digest']}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+
+
+def cached_counts(path, config, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """Funnel counts for `path`, reusing the on-disk aggregate when still valid."""
+    cache_path = os.path.join(cache_dir, f"beta_reader_funnel-{cache_key(path, config)}.json")
+    if use_cache and os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    counts = aggregate(path, config)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(counts, f)
+    os.replace(tmp_path, cache_path)
+    return counts
+
+
+def load_counts(path=FUNNEL_PATH):
+    """The latest aggregate, or SAMPLE_COUNTS when none has been written yet."""
+    if not os.path.exists(path):
+        print(f"{os.path.basename(path)} not found, using sample counts; "
+              f"run python beta_reader_funnel.py <applications.jsonl>", file=sys.stderr)
+        return SAMPLE_COUNTS
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def sankey_links(counts):
+    """[(source, target, value, kind)] over nodes: stages, one disqualified node
+    per stage, then the outcomes; zero-width links are dropped."""
+    stage_count = len(counts["stages"])
+    links = []
+    for index in range(stage_count - 1):
+        links.append((index, index + 1, counts["entered"][index + 1], "advance"))
+    for index in range(stage_count):
+        links.append((index, stage_count + index, counts["disqualified"][index], "disqualified"))
+    for offset, classification in enumerate(CLASSIFICATIONS):
+        links.append((stage_count - 1, 2 * stage_count + offset, counts["outcomes"][classification], classification))
+    return [link for link in links if link[2] > 0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate beta reader funnel counts for the Sankey chart")
+    parser.add_argument("path", help="JSON Lines of applications or of scored results")
+    parser.add_argument("--config", default=scoring.CONFIG_PATH)
+    parser.add_argument("--output", default=FUNNEL_PATH)
+    parser.add_argument("--no-cache", action="store_true", help="Rescan even if a cached aggregate exists")
+    args = parser.parse_args(argv)
+
+    counts = cached_counts(args.path, scoring.load_config(args.config), use_cache=not args.no_cache)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(counts, f, indent=2)
+
+    print(f"✅ {counts['applications']} applications -> {os.path.basename(args.output)}")
+    for name, entered, disqualified in zip(counts["stages"], counts["entered"], counts["disqualified"]):
+        print(f"- {name}: {entered} entered, {disqualified} disqualified")
+    for classification, count in counts["outcomes"].items():
+        print(f"- {classification}: {count}")
+
+
+if __name__ == "__main__":
+    main()
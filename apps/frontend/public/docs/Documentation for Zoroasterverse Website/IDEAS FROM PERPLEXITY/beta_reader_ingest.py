@@ -0,0 +1,313 @@
+# Streaming ingest of beta reader applications from partner exports.
+#
+# Reads CSV or JSON Lines from a file or stdin one row at a time, applies the
+# same checks as validateStage() in the browser (required answers,
+# min_words/max_words, max_selections) plus the ones the form gets for free
+# (known options, no option picked twice, slider range, valid date ranges),
+# scores each batch of valid rows with beta_reader_scoring and upserts it into
+# the `beta_reader_applications` table
+# (supabase/migrations/20251018010000_create_beta_reader_applications_table.sql).
+# Only one batch is held in memory at a time.
+#
+# Rejected rows are written to a JSON Lines side file with their row number,
+# id, reasons and the original row; that includes lines that are not JSON
+# objects and objects whose `responses` is not one. When an id appears more
+# than once in a batch, the last row wins, as it would across batches.
+#
+# Rows: JSON Lines objects are either {"id": ..., "responses": {...}} or flat
+# {"id": ..., question_id: value}. CSV files have an `id` column and one column
+# per question; checkbox answers are separated by "|" and date ranges use
+# `<question id>_start` / `<question id>_end` columns.
+#
+# Usage:
+#   python beta_reader_ingest.py partner.csv --rejects rejects.jsonl --dsn postgresql://localhost/zoroastervers
+#   cat export.jsonl | python beta_reader_ingest.py - --format jsonl --rejects rejects.jsonl --dry-run
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from datetime import date
+
+import beta_reader_scoring as scoring
+from beta_reader_table import compile_table
+
+DEFAULT_BATCH_SIZE = 1000
+CHECKBOX_SEPARATOR = "|"
+
+UPSERT_SQL = """
+    INSERT INTO beta_reader_applications
+        (id, source, responses, stage_scores, bonuses, total_score, failed_stage, classification, scoring_digest)
+    VALUES %s
+    ON CONFLICT (id) DO UPDATE SET
+        source = EXCLUDED.source,
+        responses = EXCLUDED.responses,
+        stage_scores = EXCLUDED.stage_scores,
+        bonuses = EXCLUDED.bonuses,
+        total_score = EXCLUDED.total_score,
+        failed_stage = EXCLUDED.failed_stage,
+        classification = EXCLUDED.classification,
+        scoring_digest = EXCLUDED.scoring_digest,
+        updated_at = NOW()
+"""
+UPSERT_TEMPLATE = "(%s, %s, %s::jsonb, %s::jsonb, %s, %s, %s, %s, %s)"
+
+
+def config_questions(config):
+    return [question for stage in config["application_stages"].values() for question in stage["questions"]]
+
+
+def _open(path):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def iter_jsonl_rows(stream):
+    """Yield (row number, row or None, error) per non-empty line."""
+    number = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            yield number, json.loads(line), None
+        except json.JSONDecodeError as exc:
+            yield number, {"raw": line.rstrip("\n")}, f"invalid JSON: {exc.msg}"
+
+
+def iter_csv_rows(stream, questions):
+    for number, row in enumerate(csv.DictReader(stream), start=1):
+        yield number, _from_csv(row, questions), None
+
+
+def _from_csv(row, questions):
+    responses = {}
+    for question in questions:
+        question_id = question["id"]
+        if question["type"] == "date_range":
+            start, end = row.get(f"{question_id}_start"), row.get(f"{question_id}_end")
+            if start or end:
+                responses[question_id] = {"start": start, "end": end}
+            continue
+        value = row.get(question_id)
+        if value in (None, ""):
+            continue
+        if question["type"] == "checkbox_multiple":
+            value = [item.strip() for item in value.split(CHECKBOX_SEPARATOR) if item.strip()]
+        responses[question_id] = value
+    return {"id": row.get("id"), "responses": responses}
+
+
+def normalize(row):
+    if not isinstance(row, dict):
+        return {"id": None, "responses": row}
+    if "responses" in row:
+        return {"id": row.get("id"), "responses": row["responses"] or {}}
+    return {"id": row.get("id"), "responses": {key: value for key, value in row.items() if key != "id"}}
+
+
+def _is_number(value):
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _picks_an_option_twice(question, value):
+    """Whether a checkbox answer selects some option more than once.
+
+    Scoring sums the items, so a repeated option would count as several picks.
+    The form sends option scores, which several options can share, so a score
+    may repeat as often as there are options with that score.
+    """
+    options = question.get("options", [])
+    known = {option["text"] for option in options} | {str(option["score"]) for option in options}
+    remaining = list(options)
+    texts = {option["text"] for option in options}
+    # Options named by text first, so a bare score only claims one not named
+    for item in sorted((str(item) for item in value if str(item) in known), key=lambda item: item not in texts):
+        match = next((option for option in remaining if item in (option["text"], str(option["score"]))), None)
+        if match is None:
+            return True
+        remaining.remove(match)
+    return False
+
+
+def validate(application, questions):
+    """Reasons `application` cannot be accepted; empty when it is valid."""
+    reasons = []
+    if application["id"] in (None, ""):
+        reasons.append("missing id")
+
+    responses = application["responses"]
+    if not isinstance(responses, dict):
+        return reasons + ["expected an object of responses"]
+    for question in questions:
+        question_id, kind = question["id"], question["type"]
+        value = responses.get(question_id)
+        if value is None or value == "" or value == []:
+            if question.get("required"):
+                reasons.append(f"{question_id}: required")
+            continue
+
+        options = {str(option["score"]) for option in question.get("options", [])}
+        options.update(option["text"] for option in question.get("options", []))
+
+        if kind == "multiple_choice":
+            if str(value) not in options:
+                reasons.append(f"{question_id}: unknown option {value!r}")
+        elif kind == "checkbox_multiple":
+            if not isinstance(value, list):
+                reasons.append(f"{question_id}: expected a list of options")
+                continue
+            unknown = [item for item in value if str(item) not in options]
+            if unknown:
+                reasons.append(f"{question_id}: unknown options {unknown!r}")
+            if _picks_an_option_twice(question, value):
+                reasons.append(f"{question_id}: duplicate options")
+            if len(value) > question.get("max_selections", len(value)):
+                reasons.append(f"{question_id}: at most {question['max_selections']} selections allowed")
+        elif kind == "slider":
+            if not _is_number(value):
+                reasons.append(f"{question_id}: not a number")
+            elif not question.get("min", float("-inf")) <= float(value) <= question.get("max", float("inf")):
+                reasons.append(f"{question_id}: outside {question['min']}-{question['max']}")
+        elif kind == "textarea":
+            if not isinstance(value, str):
+                reasons.append(f"{question_id}: expected text")
+                continue
+            words = scoring.count_words(value)
+            if words < question.get("min_words", 0):
+                reasons.append(f"{question_id}: minimum {question['min_words']} words required")
+            elif words > question.get("max_words", words):
+                reasons.append(f"{question_id}: maximum {question['max_words']} words allowed")
+        elif kind == "date_range":
+            try:
+                if date.fromisoformat(value["start"]) > date.fromisoformat(value["end"]):
+                    reasons.append(f"{question_id}: start is after end")
+            except (KeyError, TypeError, ValueError):
+                reasons.append(f"{question_id}: expected ISO start and end dates")
+    return reasons
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def connect(dsn):
+    try:
+        import psycopg2
+        from psycopg2.extras import execute_values
+    except ImportError as exc:
+        raise RuntimeError("Loading into Postgres requires psycopg2 (pip install psycopg2-binary)") from exc
+    return psycopg2.connect(dsn), execute_values
+
+
+def ingest(rows, config, rejects, dsn=None, source="form", batch_size=DEFAULT_BATCH_SIZE):
+    """Validate, score and upsert `rows` [(row number, row, error)] batch by batch.
+
+    Rejected rows are written to the `rejects` stream. Without a `dsn` nothing
+    is written to Postgres (dry run). Returns counts of accepted and rejected
+    rows, of rows replaced by a later row with the same id in their batch, and
+    the classifications of the accepted ones.
+    """
+    questions = config_questions(config)
+    digest = compile_table(config)["source_digest"]
+    counts = {"accepted": 0, "rejected": 0, "duplicates": 0, "classifications": {}}
+    connection, execute_values = connect(dsn) if dsn else (None, None)
+
+    try:
+        for batch in batched(rows, batch_size):
+            # ON CONFLICT DO UPDATE cannot touch one row twice in a statement, so
+            # a later row with the same id replaces the earlier one in the batch
+            valid = {}
+            for number, row, error in batch:
+                application = normalize(row) if error is None else {"id": None, "responses": {}}
+                if error is None and not isinstance(row, dict):
+                    error = "expected a JSON object"
+                reasons = [error] if error else validate(application, questions)
+                if reasons:
+                    rejects.write(json.dumps({"row": number, "id": application["id"], "reasons": reasons,
+                                              "data": row}) + "\n")
+                    counts["rejected"] += 1
+                else:
+                    key = str(application["id"])
+                    counts["duplicates"] += key in valid
+                    valid.pop(key, None)
+                    valid[key] = application
+            if not valid:
+                continue
+            valid = list(valid.values())
+
+            values = []
+            result = scoring.score_applications(valid, config)
+            for application, record in zip(valid, scoring.iter_results(valid, result)):
+                values.append((
+                    str(application["id"]), source, json.dumps(application["responses"]),
+                    json.dumps(record["stage_scores"]), record.get("bonuses", 0), record.get("total_score"),
+                    record.get("failed_stage"), record["classification"], digest,
+                ))
+                classifications = counts["classifications"]
+                classifications[record["classification"]] = classifications.get(record["classification"], 0) + 1
+            counts["accepted"] += len(values)
+
+            if connection is not None:
+                with connection.cursor() as cursor:
+                    execute_values(cursor, UPSERT_SQL, values, template=UPSERT_TEMPLATE, page_size=batch_size)
+                connection.commit()
+    finally:
+        if connection is not None:
+            connection.close()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate, score and load beta reader applications")
+    parser.add_argument("path", help="CSV or JSON Lines input (- for stdin)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Input format (default: from the extension)")
+    parser.add_argument("--rejects", required=True, help="JSON Lines file for rejected rows")
+    parser.add_argument("--config", default=scoring.CONFIG_PATH)
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--source", default="form", help="Recorded in the `source` column")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Validate and score without loading")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or ("csv" if args.path.endswith(".csv") else "jsonl")
+    if args.path == "-" and not args.format:
+        parser.error("--format is required when reading from stdin")
+    if not args.dry_run and not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required (or use --dry-run)")
+
+    config = scoring.load_config(args.config)
+    start = time.perf_counter()
+    with _open(args.path) as stream, open(args.rejects, "w", encoding="utf-8") as rejects:
+        if input_format == "csv":
+            rows = iter_csv_rows(stream, config_questions(config))
+        else:
+            rows = iter_jsonl_rows(stream)
+        counts = ingest(rows, config, rejects, None if args.dry_run else args.dsn, args.source, args.batch_size)
+
+    elapsed = time.perf_counter() - start
+    total = counts["accepted"] + counts["rejected"] + counts["duplicates"]
+    duplicates = f", {counts['duplicates']} superseded by a later row" if counts["duplicates"] else ""
+    print(f"✅ {counts['accepted']} accepted, {counts['rejected']} rejected ({args.rejects}){duplicates} "
+          f"in {elapsed:.2f}s ({total / elapsed * 60 if elapsed else 0:,.0f} rows/min)", file=sys.stderr)
+    for classification, count in sorted(counts["classifications"].items()):
+        print(f"- {classification}: {count}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# Incremental re-scoring of stored beta reader applications.
+#
+# `build` scores applications once with beta_reader_scoring and persists the
+# per-question partial scores (raw, unweighted, one matrix per stage), the
+# bonus flags and the resulting stage scores, totals and classifications in a
+# compressed .npz store, together with the config they were scored with.
+#
+# `rescore` compares the scoring tables (beta_reader_table.py) of a new config
+# and the stored one. Only stages whose weights or max_possible_score changed
+# are recomputed from the partial scores, and only applicants whose scores
+# changed or who sit between an old and a new cut-off (stage_requirements /
+# overall_thresholds) are reclassified. The change report lists every
+# applicant who moved between auto_accept, strong_candidate,
+# interview_required, auto_reject (and disqualified).
+#
+# Changing questions or option scores changes the partial scores themselves;
+# that needs a fresh `build` from the raw answers.
+#
+# Usage:
+#   python beta_reader_rescore.py build applications.jsonl --store scores.npz
+#   python beta_reader_rescore.py rescore --store scores.npz --config new_config.json --report changes.json
+#   python beta_reader_rescore.py rescore --store scores.npz --config new_config.json --dry-run
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import numpy as np
+
+import beta_reader_scoring as scoring
+
+
+def build_store(applications, config):
+    result = scoring.score_applications(applications, config)
+    return {
+        "ids": [str(application.get("id")) for application in applications],
+        "config": config,
+        "raw_scores": result["raw_scores"],
+        "bonus_flags": result["bonus_flags"],
+        "stage_scores": result["stage_scores"],
+        "bonuses": result["bonuses"],
+        "total": result["total"],
+        "classification": result["classification"].astype(str),
+    }
+
+
+def save_store(store, path):
+    arrays = {f"raw_{index}": raw for index, raw in enumerate(store["raw_scores"])}
+    tmp_path = path + ".tmp.npz"
+    np.savez_compressed(
+        tmp_path,
+        ids=np.array(store["ids"], dtype=str),
+        config=np.array(json.dumps(store["config"])),
+        bonus_flags=store["bonus_flags"],
+        stage_scores=store["stage_scores"],
+        bonuses=store["bonuses"],
+        total=store["total"],
+        classification=np.asarray(store["classification"], dtype=str),
+        **arrays,
+    )
+    os.replace(tmp_path, path)
+
+
+def load_store(path):
+    with np.load(path, allow_pickle=False) as data:
+        config = json.loads(str(data["config"]))
+        stage_count = len(config["application_stages"])
+        return {
+            "ids": data["ids"].tolist(),
+            "config": config,
+            "raw_scores": [data[f"raw_{index}"].astype(np.int64) for index in range(stage_count)],
+            "bonus_flags": data["bonus_flags"],
+            "stage_scores": data["stage_scores"],
+            "bonuses": data["bonuses"],
+            "total": data["total"],
+            "classification": data["classification"],
+        }
+
+
+def _structure(table):
+    # What the raw scores depend on: the questions and their option scores
+    return [
+        [(question["id"], question["type"], sorted(question.get("options", {}).items()))
+         for question in stage["questions"]]
+        for stage in table["stages"]
+    ]
+
+
+def _normalisation(stage):
+    return stage["scale"], stage["divisor"], [question["points"] for question in stage["questions"]]
+
+
+def _thresholds(table):
+    return {threshold["classification"]: threshold["minimum"] for threshold in table["thresholds"]}
+
+
+def _changed_cutoffs(old, new):
+    """[(low, high)] half-open score ranges in which a changed cut-off flips the outcome."""
+    return [tuple(sorted((old[key], new[key]))) for key in new if key in old and old[key] != new[key]]
+
+
+def rescore(store, new_config):
+    """Apply `new_config` to `store`; returns (updated store, change report)."""
+    old_table = scoring.compile_table(store["config"])
+    new_table = scoring.compile_table(new_config)
+    if _structure(old_table) != _structure(new_table):
+        raise ValueError("Questions or option scores changed; rebuild the store from the raw answers")
+
+    scores = store["stage_scores"].copy()
+    changed_stages = []
+    for index, (old_stage, new_stage) in enumerate(zip(old_table["stages"], new_table["stages"])):
+        if _normalisation(old_stage) == _normalisation(new_stage):
+            continue
+        scores[:, index] = scoring.stage_scores(store["raw_scores"][index], new_stage)
+        changed_stages.append(new_stage["name"])
+
+    bonus = scoring.bonuses(store["bonus_flags"], new_table)
+    total = scores.sum(axis=1) + bonus
+
+    candidates = (scores != store["stage_scores"]).any(axis=1) | (total != store["total"])
+    for index, (old_stage, new_stage) in enumerate(zip(old_table["stages"], new_table["stages"])):
+        if old_stage["minimum"] != new_stage["minimum"]:
+            low, high = sorted((old_stage["minimum"], new_stage["minimum"]))
+            candidates |= (scores[:, index] >= low) & (scores[:, index] < high)
+    for low, high in _changed_cutoffs(_thresholds(old_table), _thresholds(new_table)):
+        candidates |= (total >= low) & (total < high)
+
+    rows = np.flatnonzero(candidates)
+    classification = store["classification"].astype(object)
+    failed = scoring.failed_stages(scores[rows], [stage["minimum"] for stage in new_table["stages"]])
+    reclassified = scoring.classify(total[rows], new_table).astype(object)
+    reclassified[failed > 0] = scoring.DISQUALIFIED
+    classification[rows] = reclassified
+
+    moves = []
+    for row in rows[classification[rows] != store["classification"][rows]]:
+        moves.append({
+            "id": store["ids"][row],
+            "from": str(store["classification"][row]),
+            "to": classification[row],
+            "old_total": int(store["total"][row]),
+            "new_total": int(total[row]),
+        })
+
+    report = {
+        "changed_stages": changed_stages,
+        "reclassified": int(rows.size),
+        "moved": len(moves),
+        "transitions": dict(Counter(f"{move['from']} -> {move['to']}" for move in moves)),
+        "moves": moves,
+    }
+    updated = dict(store, config=new_config, stage_scores=scores, bonuses=bonus, total=total,
+                   classification=classification.astype(str))
+    return updated, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Persist and incrementally re-score beta reader applications")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Score applications and persist partial scores")
+    build.add_argument("applications", help="Applications as a JSON array or JSON Lines")
+    build.add_argument("--store", required=True)
+    build.add_argument("--config", default=scoring.CONFIG_PATH)
+
+    update = subparsers.add_parser("rescore", help="Apply a changed config to a store")
+    update.add_argument("--store", required=True)
+    update.add_argument("--config", default=scoring.CONFIG_PATH)
+    update.add_argument("--report", help="Write the change report as JSON to this path")
+    update.add_argument("--dry-run", action="store_true", help="Report only; keep the store as it is")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        applications = scoring.read_applications(args.applications)
+        save_store(build_store(applications, scoring.load_config(args.config)), args.store)
+        print(f"✅ Stored partial scores for {len(applications)} applications in {args.store}")
+        return
+
+    store, report = rescore(load_store(args.store), scoring.load_config(args.config))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if not args.dry_run:
+        save_store(store, args.store)
+
+    print(f"Recomputed stages: {', '.join(report['changed_stages']) or 'none'}")
+    print(f"Reclassified {report['reclassified']} of {len(store['ids'])} applicants, {report['moved']} moved")
+    for transition, count in sorted(report["transitions"].items()):
+        print(f"- {transition}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# Server-side batch scoring for beta reader applications.
+#
+# Mirrors scoreStage(), scoreTextResponse(), calculateBonuses() and
+# classifyApplicant() from the browser implementation (`js_implementation` in
+# script 2.py) but scores every applicant at once. Both read the flat table
+# compiled by beta_reader_table.py: each answer is reduced to its raw score,
+# which indexes the question's pre-weighted `points`; each question becomes a
+# column of those lookups and stages are reduced across all applicants in one
+# pass with NumPy.
+#
+# Results are identical to the JS rules, down to floating point: question
+# points are added in question order exactly like the JS accumulator, and
+# stage scores use Math.round semantics (halves round up), not Python's
+# banker's rounding.
+#
+# Applications are JSON objects {"id": ..., "responses": {question_id: value}}
+# where values are what the form submits: the option score (or option text)
+# for multiple_choice, a list of those for checkbox_multiple, a number for
+# sliders and the raw text for textareas. date_range answers score 0, as in JS.
+#
+# `--check` scores the best application the form accepts (top options, full
+# sliders, keyword-rich answers at each textarea's max_words) and fails unless
+# it passes every stage and is auto-accepted, which catches configs whose
+# weights or minimums no applicant can meet.
+#
+# Usage:
+#   python beta_reader_scoring.py applications.jsonl
+#   python beta_reader_scoring.py applications.json --output scores.jsonl
+#   python beta_reader_scoring.py --check
+
+import argparse
+import json
+import re
+import sys
+
+import numpy as np
+
+from beta_reader_table import CONFIG_PATH, compile_table, load_config
+
+DISQUALIFIED = "disqualified"
+
+_HAS_EXAMPLES = re.compile(r"example|instance|such as|for example|specifically", re.IGNORECASE)
+_HAS_ANALYSIS = re.compile(r"because|therefore|analysis|technique|effective", re.IGNORECASE)
+DETAILED_WORDS = 150
+# Slider value that reaches the top bucket when the config sets no max
+SLIDER_TOP = 100
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def score_text_response(text):
+    """Automated textarea score on the 0-10 scale, as scoreTextResponse()."""
+    score = 5
+    if _HAS_EXAMPLES.search(text):
+        score += 1
+    if _HAS_ANALYSIS.search(text):
+        score += 2
+    if count_words(text) > DETAILED_WORDS:
+        score += 1
+    return min(10, score)
+
+
+def js_round(values):
+    """Math.round: nearest integer, halves towards +infinity."""
+    floor = np.floor(values)
+    return np.where(values - floor >= 0.5, floor + 1, floor).astype(np.int64)
+
+
+def _option_score(question, value):
+    if isinstance(value, str) and value in question.get("options", {}):
+        return question["options"][value]
+    return int(value)
+
+
+def raw_question_score(question, value):
+    """Raw score of one answer: the index into the question's `points`."""
+    kind = question["type"]
+    if kind == "multiple_choice":
+        raw = _option_score(question, value)
+    elif kind == "checkbox_multiple":
+        raw = sum(_option_score(question, item) for item in value)
+    elif kind == "slider":
+        raw = min(question["max_bucket"], int(float(value)) // question["bucket_size"])
+    elif kind == "textarea":
+        raw = score_text_response(value)
+    else:
+        raw = 0
+    if not 0 <= raw < len(question["points"]):
+        raise ValueError(f"Answer {value!r} to {question['id']!r} is outside its scoring table")
+    return raw
+
+
+def raw_score_matrix(applications, questions):
+    """(applicants x questions) array of raw answer scores."""
+    matrix = np.zeros((len(applications), len(questions)), dtype=np.int64)
+    for row, application in enumerate(applications):
+        responses = application["responses"]
+        for column, question in enumerate(questions):
+            value = responses.get(question["id"])
+            if value is None:
+                if question["required"] and question["type"] != "date_range":
+                    raise ValueError(f"Application {application.get('id')!r} is missing {question['id']!r}")
+                continue
+            matrix[row, column] = raw_question_score(question, value)
+    return matrix
+
+
+def stage_scores(raw, stage):
+    """Normalised scores of one table stage for every applicant at once."""
+    total = np.zeros(raw.shape[0], dtype=np.float64)
+    # Accumulate column by column: the JS adds points in question order, and a
+    # pairwise np.sum could differ from it in the last bit
+    for column, question in enumerate(stage["questions"]):
+        total = total + np.asarray(question["points"], dtype=np.float64)[raw[:, column]]
+    return js_round(total * stage["scale"] / stage["divisor"])
+
+
+def bonus_flags(applications, table):
+    """(applicants x bonuses) booleans: which table bonuses each applicant earned."""
+    flags = np.zeros((len(applications), len(table["bonuses"])), dtype=bool)
+    for column, bonus in enumerate(table["bonuses"]):
+        answers = np.array([_bonus_answer(application, bonus["question"]) for application in applications],
+                           dtype=np.float64)
+        flags[:, column] = answers >= bonus["minimum"]
+    return flags
+
+
+def bonuses(flags, table):
+    values = np.array([bonus["points"] for bonus in table["bonuses"]], dtype=np.int64)
+    return flags.astype(np.int64) @ values
+
+
+def _bonus_answer(application, question_id):
+    value = application["responses"].get(question_id)
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def failed_stages(scores, minimums):
+    """1-based index of the first stage below its minimum, 0 when all passed."""
+    below = scores < np.asarray(minimums)
+    return np.where(below.any(axis=1), below.argmax(axis=1) + 1, 0)
+
+
+def classify(totals, table):
+    totals = np.asarray(totals)
+    return np.select(
+        [totals >= threshold["minimum"] for threshold in table["thresholds"]],
+        [threshold["classification"] for threshold in table["thresholds"]],
+        default=table["default_classification"],
+    )
+
+
+def score_applications(applications, config=None):
+    """Score and classify `applications` in bulk.
+
+    Returns a dict of arrays aligned with `applications`: `raw_scores` (one
+    applicants x questions matrix per stage), `stage_scores` (applicants x
+    stages), `failed_stage` (1-based, 0 when every stage passed),
+    `bonus_flags`, `bonuses`, `total` and `classification`. Applicants who
+    fail a stage minimum are classified as "disqualified", since the form
+    stops there.
+    """
+    table = compile_table(load_config() if config is None else config)
+    stages = table["stages"]
+
+    raw_scores = []
+    scores = np.zeros((len(applications), len(stages)), dtype=np.int64)
+    for index, stage in enumerate(stages):
+        raw_scores.append(raw_score_matrix(applications, stage["questions"]))
+        scores[:, index] = stage_scores(raw_scores[-1], stage)
+
+    failed_stage = failed_stages(scores, [stage["minimum"] for stage in stages])
+    flags = bonus_flags(applications, table)
+    bonus = bonuses(flags, table)
+    total = scores.sum(axis=1) + bonus
+    classification = classify(total, table).astype(object)
+    classification[failed_stage > 0] = DISQUALIFIED
+
+    return {
+        "stage_names": [stage["name"] for stage in stages],
+        "raw_scores": raw_scores,
+        "bonus_flags": flags,
+        "stage_scores": scores,
+        "failed_stage": failed_stage,
+        "bonuses": bonus,
+        "total": total,
+        "classification": classification,
+    }
+
+
+def iter_results(applications, result):
+    """One JSON-ready record per applicant; stages after a failed one are omitted."""
+    names = result["stage_names"]
+    for row, application in enumerate(applications):
+        failed = int(result["failed_stage"][row])
+        scored = failed or len(names)
+        record = {
+            "id": application.get("id"),
+            "stage_scores": {names[i]: int(result["stage_scores"][row, i]) for i in range(scored)},
+            "classification": result["classification"][row],
+        }
+        if failed:
+            record["failed_stage"] = names[failed - 1]
+        else:
+            record["bonuses"] = int(result["bonuses"][row])
+            record["total_score"] = int(result["total"][row])
+        yield record
+
+
+def best_application(config):
+    """The highest-scoring application the form accepts for `config`."""
+    responses = {}
+    for stage in config["application_stages"].values():
+        for question in stage["questions"]:
+            kind = question["type"]
+            scores = [option["score"] for option in question.get("options", [])]
+            if kind == "multiple_choice":
+                responses[question["id"]] = max(scores)
+            elif kind == "checkbox_multiple":
+                ranked = sorted(scores, reverse=True)
+                responses[question["id"]] = ranked[:question.get("max_selections", len(ranked))]
+            elif kind == "slider":
+                responses[question["id"]] = question.get("max", SLIDER_TOP)
+            elif kind == "textarea":
+                words = question.get("max_words", DETAILED_WORDS + 1)
+                opening = "For example this works because".split()
+                responses[question["id"]] = " ".join(opening + ["word"] * (words - len(opening)))
+            elif kind == "date_range":
+                responses[question["id"]] = {"start": "2026-01-01", "end": "2026-03-31"}
+    return {"id": "best", "responses": responses}
+
+
+def check_config(config):
+    """Reasons the best possible application is not auto-accepted; empty when it is."""
+    table = compile_table(config)
+    application = best_application(config)
+    result = score_applications([application], config)
+    reasons = []
+    for index, stage in enumerate(table["stages"]):
+        score = int(result["stage_scores"][0, index])
+        if score < stage["minimum"]:
+            reasons.append(f"{stage['name']}: best score {score} is below the minimum {stage['minimum']}")
+    if result["classification"][0] != table["thresholds"][0]["classification"]:
+        reasons.append(f"best application is classified {result['classification'][0]} "
+                       f"(total {int(result['total'][0])})")
+    return reasons
+
+
+def read_applications(path):
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score beta reader applications in bulk")
+    parser.add_argument("applications", nargs="?", help="Applications as a JSON array or JSON Lines")
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--output", help="Write one JSON result per line to this path")
+    parser.add_argument("--check", action="store_true",
+                        help="Fail unless the best application within the form's limits is auto-accepted")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        reasons = check_config(load_config(args.config))
+        if reasons:
+            for reason in reasons:
+                print(reason, file=sys.stderr)
+            sys.exit(1)
+        print("✅ The best application within the form's limits is auto-accepted")
+        return
+    if not args.applications:
+        parser.error("the applications path is required (or use --check)")
+
+    applications = read_applications(args.applications)
+    result = score_applications(applications, load_config(args.config))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for record in iter_results(applications, result):
+                f.write(json.dumps(record) + "\n")
+
+    labels, counts = np.unique(result["classification"].astype(str), return_counts=True)
+    print(f"✅ Scored {len(applications)} applications")
+    for label, count in zip(labels, counts):
+        print(f"- {label}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,736 @@
+// Generated by beta_reader_table.py from beta_reader_application_system.json; do not edit.
+// Source digest: 832933d0358f7a3c
+
+const BETA_READER_CONFIG = {
+  "stages": {
+    "1": {
+      "title": "Basic Information & Pre-Screening",
+      "description": "Initial qualification and basic details",
+      "autoDisqualify": true,
+      "minScoreRequired": 15,
+      "maxPossibleScore": 30,
+      "questions": [
+        {
+          "id": "reading_frequency",
+          "type": "multiple_choice",
+          "question": "How many books do you typically read per year?",
+          "options": [
+            {
+              "text": "0-5 books",
+              "score": 1
+            },
+            {
+              "text": "6-11 books",
+              "score": 3
+            },
+            {
+              "text": "12-24 books",
+              "score": 5
+            },
+            {
+              "text": "25-49 books",
+              "score": 7
+            },
+            {
+              "text": "50+ books",
+              "score": 10
+            }
+          ],
+          "weight": 0.33,
+          "required": true
+        },
+        {
+          "id": "genre_familiarity",
+          "type": "multiple_choice",
+          "question": "How familiar are you with [YOUR GENRE] fiction?",
+          "options": [
+            {
+              "text": "Never read it",
+              "score": 1
+            },
+            {
+              "text": "Read a few books",
+              "score": 3
+            },
+            {
+              "text": "Read occasionally",
+              "score": 5
+            },
+            {
+              "text": "Read regularly",
+              "score": 7
+            },
+            {
+              "text": "Expert knowledge",
+              "score": 10
+            }
+          ],
+          "weight": 0.33,
+          "required": true
+        },
+        {
+          "id": "time_commitment",
+          "type": "multiple_choice",
+          "question": "How many hours per week can you dedicate to beta reading?",
+          "options": [
+            {
+              "text": "1-2 hours",
+              "score": 2
+            },
+            {
+              "text": "3-5 hours",
+              "score": 5
+            },
+            {
+              "text": "6-9 hours",
+              "score": 7
+            },
+            {
+              "text": "10-14 hours",
+              "score": 9
+            },
+            {
+              "text": "15+ hours",
+              "score": 10
+            }
+          ],
+          "weight": 0.34,
+          "required": true
+        }
+      ]
+    },
+    "2": {
+      "title": "Experience & Skills Assessment",
+      "description": "Detailed evaluation of reading and feedback experience",
+      "conditionalDisplay": true,
+      "minScoreRequired": 25,
+      "maxPossibleScore": 40,
+      "questions": [
+        {
+          "id": "beta_experience",
+          "type": "multiple_choice",
+          "question": "How many beta reading projects have you completed?",
+          "options": [
+            {
+              "text": "None",
+              "score": 2
+            },
+            {
+              "text": "1 project",
+              "score": 4
+            },
+            {
+              "text": "2-4 projects",
+              "score": 6
+            },
+            {
+              "text": "5-9 projects",
+              "score": 8
+            },
+            {
+              "text": "10+ projects",
+              "score": 10
+            }
+          ],
+          "weight": 0.25,
+          "required": true
+        },
+        {
+          "id": "feedback_strengths",
+          "type": "checkbox_multiple",
+          "question": "What are your strongest areas for providing feedback? (Select all that apply)",
+          "options": [
+            {
+              "text": "Plot structure and pacing",
+              "score": 3
+            },
+            {
+              "text": "Character development",
+              "score": 3
+            },
+            {
+              "text": "Dialogue authenticity",
+              "score": 2
+            },
+            {
+              "text": "World-building consistency",
+              "score": 2
+            },
+            {
+              "text": "Grammar and style",
+              "score": 2
+            },
+            {
+              "text": "Emotional impact",
+              "score": 2
+            }
+          ],
+          "weight": 0.3,
+          "maxSelections": 4,
+          "required": true
+        },
+        {
+          "id": "writing_background",
+          "type": "multiple_choice",
+          "question": "What best describes your writing/editing background?",
+          "options": [
+            {
+              "text": "No writing experience",
+              "score": 2
+            },
+            {
+              "text": "Casual writer",
+              "score": 4
+            },
+            {
+              "text": "Serious writer (unpublished)",
+              "score": 6
+            },
+            {
+              "text": "Published author",
+              "score": 8
+            },
+            {
+              "text": "Professional editor/reviewer",
+              "score": 10
+            }
+          ],
+          "weight": 0.25,
+          "required": true
+        },
+        {
+          "id": "reading_speed",
+          "type": "slider",
+          "question": "Approximately how many pages can you read per hour?",
+          "min": 10,
+          "max": 100,
+          "step": 5,
+          "scoringFormula": "Math.min(10, Math.floor(value / 10))",
+          "weight": 0.2,
+          "required": true
+        }
+      ]
+    },
+    "3": {
+      "title": "Sample Feedback Analysis",
+      "description": "Evaluate analytical skills through sample text review",
+      "minScoreRequired": 30,
+      "maxPossibleScore": 50,
+      "questions": [
+        {
+          "id": "excerpt_analysis",
+          "type": "textarea",
+          "question": "Read this excerpt and identify what works well (100-300 words):",
+          "sampleText": "The obsidian gates groaned, not with the weight of stone, but with the sorrow of ages. Kaelen watched from the shadows, his breath a ghost in the frigid air, as the sigil on the archway pulsed with a faint, sickly green light. It was a warning. It was an invitation.",
+          "scoringCriteria": [
+            {
+              "aspect": "Identifies specific literary techniques",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Provides concrete examples from text",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Shows genre awareness",
+              "maxScore": 2
+            },
+            {
+              "aspect": "Demonstrates emotional engagement",
+              "maxScore": 2
+            }
+          ],
+          "minWords": 100,
+          "maxWords": 300,
+          "weight": 0.3,
+          "required": true
+        },
+        {
+          "id": "problem_identification",
+          "type": "textarea",
+          "question": "What, if anything, was confusing or unclear? How could it be improved? (100-300 words)",
+          "scoringCriteria": [
+            {
+              "aspect": "Identifies genuine readability issues",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Distinguishes objective vs subjective concerns",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Explains reasoning clearly",
+              "maxScore": 2
+            },
+            {
+              "aspect": "Provides constructive context",
+              "maxScore": 2
+            }
+          ],
+          "minWords": 100,
+          "maxWords": 300,
+          "weight": 0.3,
+          "required": true
+        },
+        {
+          "id": "actionable_suggestion",
+          "type": "textarea",
+          "question": "Provide one specific, actionable suggestion to enhance this scene (60-200 words)",
+          "scoringCriteria": [
+            {
+              "aspect": "Offers specific, implementable solution",
+              "maxScore": 4
+            },
+            {
+              "aspect": "Shows understanding of author's intent",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Suggests enhancement rather than just fixes",
+              "maxScore": 3
+            }
+          ],
+          "minWords": 60,
+          "maxWords": 200,
+          "weight": 0.4,
+          "required": true
+        }
+      ]
+    },
+    "4": {
+      "title": "Final Assessment & Preferences",
+      "description": "Communication style and final compatibility check",
+      "minScoreRequired": 20,
+      "maxPossibleScore": 30,
+      "questions": [
+        {
+          "id": "communication_style",
+          "type": "multiple_choice",
+          "question": "How would you describe your feedback style?",
+          "options": [
+            {
+              "text": "Direct and detailed",
+              "score": 8
+            },
+            {
+              "text": "Gentle but thorough",
+              "score": 10
+            },
+            {
+              "text": "Focused on major issues",
+              "score": 6
+            },
+            {
+              "text": "Encouraging with suggestions",
+              "score": 9
+            },
+            {
+              "text": "Technical and analytical",
+              "score": 7
+            }
+          ],
+          "weight": 0.4,
+          "required": true
+        },
+        {
+          "id": "availability_window",
+          "type": "date_range",
+          "question": "What is your availability window for this project?",
+          "scoringCriteria": [
+            {
+              "aspect": "Matches project timeline",
+              "maxScore": 5
+            },
+            {
+              "aspect": "Provides realistic timeframe",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Shows flexibility",
+              "maxScore": 2
+            }
+          ],
+          "weight": 0.0,
+          "required": true
+        },
+        {
+          "id": "motivation",
+          "type": "textarea",
+          "question": "Why do you want to be a beta reader for this project? (50-150 words)",
+          "scoringCriteria": [
+            {
+              "aspect": "Shows genuine interest in the work",
+              "maxScore": 4
+            },
+            {
+              "aspect": "Demonstrates understanding of role",
+              "maxScore": 3
+            },
+            {
+              "aspect": "Articulates value they can provide",
+              "maxScore": 3
+            }
+          ],
+          "minWords": 50,
+          "maxWords": 150,
+          "weight": 0.6,
+          "required": true
+        }
+      ]
+    }
+  },
+  "thresholds": {
+    "autoAccept": 90,
+    "strongCandidate": 75,
+    "interviewRequired": 60,
+    "autoReject": 0
+  }
+};
+
+const BETA_READER_SCORING_TABLE = {
+  "source_digest": "832933d0358f7a3c",
+  "max_total": 150,
+  "stages": [
+    {
+      "name": "Stage 1",
+      "minimum": 15,
+      "scale": 30,
+      "divisor": 10,
+      "questions": [
+        {
+          "id": "reading_frequency",
+          "type": "multiple_choice",
+          "required": true,
+          "points": [
+            0.0,
+            0.33,
+            0.66,
+            0.99,
+            1.32,
+            1.6500000000000001,
+            1.98,
+            2.31,
+            2.64,
+            2.97,
+            3.3000000000000003
+          ],
+          "options": {
+            "0-5 books": 1,
+            "6-11 books": 3,
+            "12-24 books": 5,
+            "25-49 books": 7,
+            "50+ books": 10
+          }
+        },
+        {
+          "id": "genre_familiarity",
+          "type": "multiple_choice",
+          "required": true,
+          "points": [
+            0.0,
+            0.33,
+            0.66,
+            0.99,
+            1.32,
+            1.6500000000000001,
+            1.98,
+            2.31,
+            2.64,
+            2.97,
+            3.3000000000000003
+          ],
+          "options": {
+            "Never read it": 1,
+            "Read a few books": 3,
+            "Read occasionally": 5,
+            "Read regularly": 7,
+            "Expert knowledge": 10
+          }
+        },
+        {
+          "id": "time_commitment",
+          "type": "multiple_choice",
+          "required": true,
+          "points": [
+            0.0,
+            0.34,
+            0.68,
+            1.02,
+            1.36,
+            1.7000000000000002,
+            2.04,
+            2.3800000000000003,
+            2.72,
+            3.06,
+            3.4000000000000004
+          ],
+          "options": {
+            "1-2 hours": 2,
+            "3-5 hours": 5,
+            "6-9 hours": 7,
+            "10-14 hours": 9,
+            "15+ hours": 10
+          }
+        }
+      ]
+    },
+    {
+      "name": "Stage 2",
+      "minimum": 25,
+      "scale": 40,
+      "divisor": 10,
+      "questions": [
+        {
+          "id": "beta_experience",
+          "type": "multiple_choice",
+          "required": true,
+          "points": [
+            0.0,
+            0.25,
+            0.5,
+            0.75,
+            1.0,
+            1.25,
+            1.5,
+            1.75,
+            2.0,
+            2.25,
+            2.5
+          ],
+          "options": {
+            "None": 2,
+            "1 project": 4,
+            "2-4 projects": 6,
+            "5-9 projects": 8,
+            "10+ projects": 10
+          }
+        },
+        {
+          "id": "feedback_strengths",
+          "type": "checkbox_multiple",
+          "required": true,
+          "points": [
+            0.0,
+            0.3,
+            0.6,
+            0.8999999999999999,
+            1.2,
+            1.5,
+            1.7999999999999998,
+            2.1,
+            2.4,
+            2.6999999999999997,
+            3.0,
+            3.3,
+            3.5999999999999996,
+            3.9,
+            4.2
+          ],
+          "options": {
+            "Plot structure and pacing": 3,
+            "Character development": 3,
+            "Dialogue authenticity": 2,
+            "World-building consistency": 2,
+            "Grammar and style": 2,
+            "Emotional impact": 2
+          }
+        },
+        {
+          "id": "writing_background",
+          "type": "multiple_choice",
+          "required": true,
+          "points": [
+            0.0,
+            0.25,
+            0.5,
+            0.75,
+            1.0,
+            1.25,
+            1.5,
+            1.75,
+            2.0,
+            2.25,
+            2.5
+          ],
+          "options": {
+            "No writing experience": 2,
+            "Casual writer": 4,
+            "Serious writer (unpublished)": 6,
+            "Published author": 8,
+            "Professional editor/reviewer": 10
+          }
+        },
+        {
+          "id": "reading_speed",
+          "type": "slider",
+          "required": true,
+          "points": [
+            0.0,
+            0.2,
+            0.4,
+            0.6000000000000001,
+            0.8,
+            1.0,
+            1.2000000000000002,
+            1.4000000000000001,
+            1.6,
+            1.8,
+            2.0
+          ],
+          "bucket_size": 10,
+          "max_bucket": 10
+        }
+      ]
+    },
+    {
+      "name": "Stage 3",
+      "minimum": 30,
+      "scale": 50,
+      "divisor": 10,
+      "questions": [
+        {
+          "id": "excerpt_analysis",
+          "type": "textarea",
+          "required": true,
+          "points": [
+            0.0,
+            0.3,
+            0.6,
+            0.8999999999999999,
+            1.2,
+            1.5,
+            1.7999999999999998,
+            2.1,
+            2.4,
+            2.6999999999999997,
+            3.0
+          ]
+        },
+        {
+          "id": "problem_identification",
+          "type": "textarea",
+          "required": true,
+          "points": [
+            0.0,
+            0.3,
+            0.6,
+            0.8999999999999999,
+            1.2,
+            1.5,
+            1.7999999999999998,
+            2.1,
+            2.4,
+            2.6999999999999997,
+            3.0
+          ]
+        },
+        {
+          "id": "actionable_suggestion",
+          "type": "textarea",
+          "required": true,
+          "points": [
+            0.0,
+            0.4,
+            0.8,
+            1.2000000000000002,
+            1.6,
+            2.0,
+            2.4000000000000004,
+            2.8000000000000003,
+            3.2,
+            3.6,
+            4.0
+          ]
+        }
+      ]
+    },
+    {
+      "name": "Stage 4",
+      "minimum": 20,
+      "scale": 30,
+      "divisor": 10,
+      "questions": [
+        {
+          "id": "communication_style",
+          "type": "multiple_choice",
+          "required": true,
+          "points": [
+            0.0,
+            0.4,
+            0.8,
+            1.2000000000000002,
+            1.6,
+            2.0,
+            2.4000000000000004,
+            2.8000000000000003,
+            3.2,
+            3.6,
+            4.0
+          ],
+          "options": {
+            "Direct and detailed": 8,
+            "Gentle but thorough": 10,
+            "Focused on major issues": 6,
+            "Encouraging with suggestions": 9,
+            "Technical and analytical": 7
+          }
+        },
+        {
+          "id": "availability_window",
+          "type": "date_range",
+          "required": true,
+          "points": [
+            0.0
+          ]
+        },
+        {
+          "id": "motivation",
+          "type": "textarea",
+          "required": true,
+          "points": [
+            0.0,
+            0.6,
+            1.2,
+            1.7999999999999998,
+            2.4,
+            3.0,
+            3.5999999999999996,
+            4.2,
+            4.8,
+            5.3999999999999995,
+            6.0
+          ]
+        }
+      ]
+    }
+  ],
+  "thresholds": [
+    {
+      "classification": "auto_accept",
+      "minimum": 90
+    },
+    {
+      "classification": "strong_candidate",
+      "minimum": 75
+    },
+    {
+      "classification": "interview_required",
+      "minimum": 60
+    }
+  ],
+  "default_classification": "auto_reject",
+  "bonuses": [
+    {
+      "name": "genre_expert_bonus",
+      "question": "genre_familiarity",
+      "minimum": 9,
+      "points": 5
+    },
+    {
+      "name": "professional_experience_bonus",
+      "question": "writing_background",
+      "minimum": 8,
+      "points": 10
+    }
+  ]
+};
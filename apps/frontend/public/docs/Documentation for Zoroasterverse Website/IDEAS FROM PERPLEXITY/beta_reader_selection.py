@@ -0,0 +1,207 @@
+# Capacity-limited selection of beta readers for each beta round.
+#
+# classifyApplicant() only buckets applicants by threshold; a round still has
+# a fixed number of reader slots. Each round keeps its best K applicants in a
+# bounded min-heap whose root is the weakest selected applicant, so a new
+# application costs one comparison with the root (and O(log K) when it gets
+# in); the pool is never re-sorted, and selection can run while applications
+# stream in.
+#
+# Applicants are ranked by total score, then Stage 3 (the feedback sample)
+# score, then how many days their availability_window overlaps the round's
+# window, then arrival order. Disqualified and auto_reject applicants are not
+# eligible.
+#
+# A reader takes at most one slot. Rounds are filled in the order given, and
+# a round skips applicants already selected by an earlier round. To make that
+# possible without re-scanning the pool, each round's heap also keeps as many
+# reserve candidates as all earlier rounds have slots: however the earlier
+# rounds turn out, a round's own top `slots` among the applicants they left
+# are always inside its heap.
+#
+# Rounds are a JSON list such as
+#   [{"name": "Round 1", "slots": 25, "window": {"start": "2026-01-05", "end": "2026-02-15"}}]
+#
+# Usage:
+#   python beta_reader_selection.py applications.jsonl --rounds rounds.json
+#   python beta_reader_selection.py applications.jsonl --rounds rounds.json --output selected.json
+
+import argparse
+import heapq
+import json
+import time
+from datetime import date
+
+import beta_reader_scoring as scoring
+
+ELIGIBLE = {"auto_accept", "strong_candidate", "interview_required"}
+FEEDBACK_STAGE = "Stage 3"
+AVAILABILITY_QUESTION = "availability_window"
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _parse_window(window):
+    if not window or not window.get("start") or not window.get("end"):
+        return None
+    return date.fromisoformat(window["start"]), date.fromisoformat(window["end"])
+
+
+def overlap_days(window, other):
+    """Days shared by two inclusive (start, end) date windows."""
+    if window is None or other is None:
+        return 0
+    days = (min(window[1], other[1]) - max(window[0], other[0])).days + 1
+    return max(0, days)
+
+
+class RoundSelector:
+    """Top-`slots` applicants of one round, maintained incrementally.
+
+    `reserve` extra candidates are kept so that applicants taken by earlier
+    rounds can be skipped in selected().
+    """
+
+    def __init__(self, name, slots, window=None, reserve=0):
+        self.name = name
+        self.slots = slots
+        self.capacity = slots + reserve if slots > 0 else 0
+        self.window = _parse_window(window)
+        self._heap = []
+        self._arrivals = 0
+
+    def rank(self, candidate):
+        return (
+            candidate["total_score"],
+            candidate["feedback_score"],
+            overlap_days(self.window, candidate["availability"]),
+        )
+
+    def add(self, candidate):
+        """Offer one candidate; returns True when it is kept (for now)."""
+        if self.capacity <= 0:
+            return False
+        # Earlier arrivals win ties, and the arrival number keeps keys unique so
+        # candidates themselves are never compared
+        self._arrivals += 1
+        entry = (self.rank(candidate), -self._arrivals, candidate)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] <= self._heap[0][:2]:
+            return False
+        heapq.heapreplace(self._heap, entry)
+        return True
+
+    def _selected_entries(self, exclude=frozenset()):
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [entry for entry in ranked if entry[2]["id"] not in exclude][:self.slots]
+
+    def cutoff(self, exclude=frozenset()):
+        """Rank of the weakest selected applicant once the round is full."""
+        entries = self._selected_entries(exclude)
+        return entries[-1][0] if entries and len(entries) == self.slots else None
+
+    def selected(self, exclude=frozenset()):
+        """Selected candidates, best first, skipping the ids in `exclude`."""
+        return [entry[2] for entry in self._selected_entries(exclude)]
+
+
+def assign(selectors):
+    """{round name: selected candidates}, filling rounds in order so that no
+    applicant is selected for more than one round."""
+    taken = set()
+    selection = {}
+    for selector in selectors:
+        selection[selector.name] = selector.selected(frozenset(taken))
+        taken.update(candidate["id"] for candidate in selection[selector.name])
+    return selection
+
+
+def iter_candidates(applications, result):
+    """Eligible candidates from a beta_reader_scoring result."""
+    feedback_column = result["stage_names"].index(FEEDBACK_STAGE)
+    for row, application in enumerate(applications):
+        if result["classification"][row] not in ELIGIBLE:
+            continue
+        yield {
+            "id": application.get("id"),
+            "classification": result["classification"][row],
+            "total_score": int(result["total"][row]),
+            "feedback_score": int(result["stage_scores"][row, feedback_column]),
+            "availability": _parse_window(application["responses"].get(AVAILABILITY_QUESTION)),
+        }
+
+
+def select_stream(application_chunks, rounds, config=None):
+    """Score each chunk of applications as it arrives and offer it to every round."""
+    config = scoring.load_config() if config is None else config
+    selectors = []
+    reserve = 0
+    for round_ in rounds:
+        selectors.append(RoundSelector(round_["name"], round_["slots"], round_.get("window"), reserve))
+        reserve += max(0, round_["slots"])
+    for chunk in application_chunks:
+        result = scoring.score_applications(chunk, config)
+        for candidate in iter_candidates(chunk, result):
+            for selector in selectors:
+                selector.add(candidate)
+    return selectors
+
+
+def read_chunks(path, size=DEFAULT_CHUNK_SIZE):
+    if not path.endswith(".jsonl"):
+        applications = scoring.read_applications(path)
+        for start in range(0, len(applications), size):
+            yield applications[start:start + size]
+        return
+    chunk = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                chunk.append(json.loads(line))
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Select the top applicants for each beta round")
+    parser.add_argument("applications", help="Applications as a JSON array or JSON Lines")
+    parser.add_argument("--rounds", required=True, help="JSON list of {name, slots, window}")
+    parser.add_argument("--config", default=scoring.CONFIG_PATH)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", help="Write the selection per round as JSON to this path")
+    args = parser.parse_args(argv)
+
+    with open(args.rounds, "r", encoding="utf-8") as f:
+        rounds = json.load(f)
+
+    start = time.perf_counter()
+    selectors = select_stream(read_chunks(args.applications, args.chunk_size), rounds,
+                              scoring.load_config(args.config))
+    assigned = assign(selectors)
+    selection = {
+        selector.name: [
+            {"id": candidate["id"], "total_score": candidate["total_score"],
+             "feedback_score": candidate["feedback_score"],
+             "overlap_days": overlap_days(selector.window, candidate["availability"])}
+            for candidate in assigned[selector.name]
+        ]
+        for selector in selectors
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(selection, f, indent=2)
+    taken = set()
+    for selector in selectors:
+        print(f"✅ {selector.name}: {len(selection[selector.name])}/{selector.slots} slots filled, "
+              f"cut-off {selector.cutoff(frozenset(taken))}")
+        taken.update(candidate["id"] for candidate in assigned[selector.name])
+    print(f"Selected in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
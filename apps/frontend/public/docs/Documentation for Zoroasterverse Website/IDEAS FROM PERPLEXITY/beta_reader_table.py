@@ -0,0 +1,188 @@
+# Compile the beta reader config into a flat scoring table.
+#
+# beta_reader_application_system.json is the only source of the stages,
+# questions, weights and cut-offs. This compiler turns it into a table that
+# both scorers read, so scoring is a lookup per answer instead of a branch on
+# question.type, and the Python and browser copies cannot drift apart:
+#
+# - every question gets a `points` list indexed by its raw answer score (the
+#   option score, the sum of checked option scores, the slider bucket or the
+#   automated text score), with the weight already multiplied in;
+# - sliders carry their bucket size and top bucket;
+# - every stage carries its minimum and the normalisation constants
+#   (stage score = round(sum of points * scale / divisor));
+# - thresholds and bonuses are ordered lists.
+#
+# Points are computed as raw * weight, the same IEEE product the JS computed
+# at runtime, so table scores are identical to the old per-type branches.
+#
+# The browser reads the generated beta_reader_scoring_table.js, which defines
+# BETA_READER_CONFIG (the form definition, camelCased for the renderer) and
+# BETA_READER_SCORING_TABLE. beta_reader_scoring.py compiles the same table
+# in-process. scripts/docs_build.py regenerates the module right after the
+# config (generator "beta-reader-config") and rebuilds it when it goes stale.
+#
+# Usage:
+#   python beta_reader_table.py            # regenerate beta_reader_scoring_table.js
+#   python beta_reader_table.py --check    # exit 1 if the generated module is stale
+#   python beta_reader_table.py --json table.json
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "beta_reader_application_system.json")
+JS_MODULE_PATH = os.path.join(BASE_DIR, "beta_reader_scoring_table.js")
+
+# Slider scoring in the JS form: Math.min(10, Math.floor(value / 10))
+SLIDER_BUCKET_SIZE = 10
+SLIDER_MAX_BUCKET = 10
+# scoreTextResponse() returns at most 10
+TEXT_MAX_SCORE = 10
+NORMALISATION_DIVISOR = 10
+
+CLASSIFICATIONS = ["auto_accept", "strong_candidate", "interview_required", "auto_reject"]
+
+# bonus name in scoring_system["bonus_criteria"] -> (question id, minimum raw score)
+BONUS_RULES = {
+    "genre_expert_bonus": ("genre_familiarity", 9),
+    "professional_experience_bonus": ("writing_background", 8),
+}
+
+
+def load_config(path=CONFIG_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def config_digest(config):
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def max_raw_score(question):
+    kind = question["type"]
+    scores = [option["score"] for option in question.get("options", [])]
+    if kind == "multiple_choice":
+        return max(scores)
+    if kind == "checkbox_multiple":
+        return sum(scores)
+    if kind == "slider":
+        return SLIDER_MAX_BUCKET
+    if kind == "textarea":
+        return TEXT_MAX_SCORE
+    return 0
+
+
+def compile_question(question):
+    compiled = {
+        "id": question["id"],
+        "type": question["type"],
+        "required": question.get("required", False),
+        "points": [raw * question["weight"] for raw in range(max_raw_score(question) + 1)],
+    }
+    if question.get("options"):
+        compiled["options"] = {option["text"]: option["score"] for option in question["options"]}
+    if question["type"] == "slider":
+        compiled["bucket_size"] = SLIDER_BUCKET_SIZE
+        compiled["max_bucket"] = SLIDER_MAX_BUCKET
+    return compiled
+
+
+def stage_minimum(config, stage_number, stage):
+    requirements = config.get("scoring_system", {}).get("stage_requirements", {})
+    return requirements.get(f"stage_{stage_number}_minimum", stage["min_score_required"])
+
+
+def compile_table(config):
+    """Flat scoring table for `config`; see the module comment for its layout."""
+    stages = []
+    for number, (name, stage) in enumerate(config["application_stages"].items(), start=1):
+        stages.append({
+            "name": name,
+            "minimum": stage_minimum(config, number, stage),
+            "scale": stage["max_possible_score"],
+            "divisor": NORMALISATION_DIVISOR,
+            "questions": [compile_question(question) for question in stage["questions"]],
+        })
+
+    scoring_system = config["scoring_system"]
+    thresholds = scoring_system["overall_thresholds"]
+    criteria = scoring_system.get("bonus_criteria", {})
+    return {
+        "source_digest": config_digest(config),
+        "max_total": sum(stage["scale"] for stage in stages),
+        "stages": stages,
+        "thresholds": [{"classification": name, "minimum": thresholds[name]} for name in CLASSIFICATIONS[:3]],
+        "default_classification": CLASSIFICATIONS[3],
+        "bonuses": [
+            {"name": name, "question": question_id, "minimum": minimum, "points": criteria.get(name, 0)}
+            for name, (question_id, minimum) in BONUS_RULES.items()
+        ],
+    }
+
+
+def _camel(key):
+    return re.sub(r"_([a-z])", lambda match: match.group(1).upper(), key)
+
+
+def _camel_keys(value):
+    if isinstance(value, dict):
+        return {_camel(key): _camel_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_camel_keys(item) for item in value]
+    return value
+
+
+def client_config(config):
+    """The form definition in the shape the browser renderer reads."""
+    stages = {
+        number: _camel_keys(stage)
+        for number, stage in enumerate(config["application_stages"].values(), start=1)
+    }
+    return {"stages": stages, "thresholds": _camel_keys(config["scoring_system"]["overall_thresholds"])}
+
+
+def render_js_module(config):
+    table = compile_table(config)
+    return (
+        "// Generated by beta_reader_table.py from beta_reader_application_system.json; do not edit.\n"
+        f"// Source digest: {table['source_digest']}\n\n"
+        f"const BETA_READER_CONFIG = {json.dumps(client_config(config), indent=2, ensure_ascii=False)};\n\n"
+        f"const BETA_READER_SCORING_TABLE = {json.dumps(table, indent=2, ensure_ascii=False)};\n"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the beta reader config into a scoring table")
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--output", default=JS_MODULE_PATH, help="Generated JS module path")
+    parser.add_argument("--json", help="Also write the bare table as JSON to this path")
+    parser.add_argument("--check", action="store_true", help="Fail if the generated module is out of date")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    module = render_js_module(config)
+
+    if args.check:
+        current = open(args.output, "r", encoding="utf-8").read() if os.path.exists(args.output) else None
+        if current != module:
+            print(f"{args.output} is out of date; run python beta_reader_table.py", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ {os.path.basename(args.output)} matches the config")
+        return
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(module)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(compile_table(config), f, indent=2)
+    print(f"✅ Wrote {os.path.basename(args.output)} (source digest {config_digest(config)})")
+
+
+if __name__ == "__main__":
+    main()
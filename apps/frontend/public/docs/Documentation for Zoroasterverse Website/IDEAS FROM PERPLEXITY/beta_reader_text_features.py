@@ -0,0 +1,293 @@
+# Batch feature extraction for the Stage 3 and Stage 4 textarea answers.
+#
+# scoreTextResponse() in the browser runs three regexes and a word count per
+# answer and ignores the `scoring_criteria` aspects entirely. This pipeline
+# scores every aspect of excerpt_analysis, problem_identification,
+# actionable_suggestion and motivation instead:
+#
+# - each answer is tokenized once (lowercased words, light suffix stemming);
+# - the cue phrases of every aspect are compiled into one token-level
+#   Aho-Corasick automaton, so a single pass over the tokens finds all cues of
+#   all aspects at once;
+# - an aspect scores one point per distinct cue found, capped at its
+#   `max_score`, and the answer score is the sum over its aspects;
+# - answers are processed in batches across a process pool; each worker
+#   compiles the automaton once in its initializer and results come back in
+#   input order, so the output is identical whatever the worker count.
+#
+# The JS-compatible automated score used by beta_reader_scoring is unchanged;
+# these features are for reviewers and for replacing that heuristic later.
+#
+# Usage:
+#   python beta_reader_text_features.py applications.jsonl --output features.jsonl
+#   python beta_reader_text_features.py applications.jsonl --workers 8 --batch-size 1000
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import beta_reader_scoring as scoring
+
+TEXT_QUESTIONS = ["excerpt_analysis", "problem_identification", "actionable_suggestion", "motivation"]
+DEFAULT_BATCH_SIZE = 500
+
+# Cue phrases per scoring_criteria aspect; stemmed with the answers, so
+# "technique" also matches "techniques"
+ASPECT_CUES = {
+    # excerpt_analysis
+    "Identifies specific literary techniques": [
+        "imagery", "metaphor", "simile", "personification", "foreshadowing", "juxtaposition",
+        "contrast", "repetition", "sensory", "symbolism", "alliteration", "technique", "sentence rhythm",
+    ],
+    "Provides concrete examples from text": [
+        "for example", "for instance", "such as", "the line", "the phrase", "the sentence", "quote",
+        "obsidian", "sigil", "gates", "archway", "ghost in the frigid air", "specifically",
+    ],
+    "Shows genre awareness": [
+        "fantasy", "dark fantasy", "epic", "genre", "worldbuilding", "world building", "magic", "trope",
+        "atmosphere", "gothic",
+    ],
+    "Demonstrates emotional engagement": [
+        "i felt", "made me", "chill", "dread", "tension", "sorrow", "emotional", "haunting", "drawn in",
+        "moved",
+    ],
+    # problem_identification
+    "Identifies genuine readability issues": [
+        "confusing", "unclear", "ambiguous", "hard to follow", "pacing", "too long", "repetitive",
+        "point of view", "clarity", "abrupt",
+    ],
+    "Distinguishes objective vs subjective concerns": [
+        "personally", "subjective", "objectively", "my preference", "some readers", "might be just me",
+        "in my opinion", "matter of taste", "i prefer",
+    ],
+    "Explains reasoning clearly": [
+        "because", "therefore", "which means", "as a result", "so that", "since", "this causes",
+        "the reason",
+    ],
+    "Provides constructive context": [
+        "could", "might", "consider", "perhaps", "instead", "would help", "earlier in the", "context",
+    ],
+    # actionable_suggestion
+    "Offers specific, implementable solution": [
+        "add", "cut", "replace", "move", "rewrite", "one sentence", "a line", "show rather than tell",
+        "dialogue", "reorder",
+    ],
+    "Shows understanding of author's intent": [
+        "intent", "you want", "the author", "the goal", "aiming for", "tone", "mood", "purpose",
+        "keep the",
+    ],
+    "Suggests enhancement rather than just fixes": [
+        "enhance", "heighten", "deepen", "strengthen", "build on", "amplify", "enrich", "elevate",
+        "more vivid",
+    ],
+    # motivation
+    "Shows genuine interest in the work": [
+        "excited", "love", "passion", "fascinated", "zoroastrian", "mythology", "this story", "this world",
+        "intrigued",
+    ],
+    "Demonstrates understanding of role": [
+        "beta reader", "beta reading", "feedback", "deadline", "honest", "constructive", "reader experience",
+        "before publication",
+    ],
+    "Articulates value they can provide": [
+        "experience", "background", "editing", "i can", "my skills", "attention to detail", "fresh eyes",
+        "years",
+    ],
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_SUFFIXES = ("ingly", "edly", "ing", "ed", "ly", "s")
+
+
+# Essay vocabularies are small and repetitive, so stems are memoized
+@lru_cache(maxsize=1 << 16)
+def stem(token):
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [stem(token) for token in _TOKEN.findall(text.lower())]
+
+
+class CueAutomaton:
+    """Aho-Corasick over token sequences: one pass reports every cue of every aspect."""
+
+    def __init__(self, patterns):
+        # patterns: {label: [phrase, ...]}; labels are reported as (label, phrase)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for label, phrases in patterns.items():
+            for phrase in phrases:
+                self._add(tuple(tokenize(phrase)), (label, phrase))
+        self._link()
+
+    def _add(self, tokens, match):
+        state = 0
+        for token in tokens:
+            if token not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][token] = len(self.goto) - 1
+            state = self.goto[state][token]
+        self.output[state].append(match)
+
+    def _link(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(token, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def matches(self, tokens):
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                yield from output[state]
+
+
+def text_questions(config):
+    """{question id: question} for the textarea questions with scoring_criteria."""
+    questions = {}
+    for stage in config["application_stages"].values():
+        for question in stage["questions"]:
+            if question["id"] in TEXT_QUESTIONS:
+                questions[question["id"]] = question
+    return questions
+
+
+def compile_automaton(config):
+    patterns = {}
+    for question in text_questions(config).values():
+        for criterion in question.get("scoring_criteria", []):
+            aspect = criterion["aspect"]
+            if aspect not in ASPECT_CUES:
+                raise ValueError(f"No cue phrases for scoring aspect {aspect!r}")
+            patterns[aspect] = ASPECT_CUES[aspect]
+    return CueAutomaton(patterns)
+
+
+def extract_features(text, question, automaton):
+    tokens = tokenize(text)
+    found = {}
+    for aspect, phrase in automaton.matches(tokens):
+        found.setdefault(aspect, set()).add(phrase)
+
+    aspects = {}
+    for criterion in question.get("scoring_criteria", []):
+        cues = sorted(found.get(criterion["aspect"], ()))
+        aspects[criterion["aspect"]] = {"cues": cues, "score": min(criterion["max_score"], len(cues))}
+
+    # Words as the form counts them (whitespace split), so within_length agrees
+    # with min_words/max_words; the stemmed tokens are only for cue matching
+    words = text.split()
+    word_count = scoring.count_words(text)
+    return {
+        "word_count": word_count,
+        "unique_words": len({word.lower() for word in words}),
+        "within_length": question.get("min_words", 0) <= word_count <= question.get("max_words", word_count),
+        "aspects": aspects,
+        "score": sum(aspect["score"] for aspect in aspects.values()),
+    }
+
+
+# Per-worker state, filled once by _init_worker
+_shared = {}
+
+
+def _init_worker(config):
+    _shared["questions"] = text_questions(config)
+    _shared["automaton"] = compile_automaton(config)
+
+
+def extract_batch(batch):
+    """[(application id, question id, text)] -> [feature records]; runs inside a worker."""
+    questions, automaton = _shared["questions"], _shared["automaton"]
+    return [
+        dict(id=application_id, question_id=question_id,
+             **extract_features(text, questions[question_id], automaton))
+        for application_id, question_id, text in batch
+    ]
+
+
+def iter_answers(applications, question_ids):
+    for application in applications:
+        for question_id in question_ids:
+            text = application["responses"].get(question_id)
+            if isinstance(text, str):
+                yield application.get("id"), question_id, text
+
+
+def batched(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def extract_all(applications, config=None, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Feature records for every text answer, in application then question order."""
+    config = scoring.load_config() if config is None else config
+    question_ids = [question_id for question_id in TEXT_QUESTIONS if question_id in text_questions(config)]
+    batches = batched(iter_answers(applications, question_ids), batch_size)
+
+    if workers == 1:
+        _init_worker(config)
+        return [record for batch in batches for record in extract_batch(batch)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as pool:
+        return [record for records in pool.map(extract_batch, batches) for record in records]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract aspect features from beta reader text answers")
+    parser.add_argument("applications", help="Applications as a JSON array or JSON Lines")
+    parser.add_argument("--config", default=scoring.CONFIG_PATH)
+    parser.add_argument("--output", default="-", help="JSON Lines output path (- for stdout)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    applications = scoring.read_applications(args.applications)
+    records = extract_all(applications, scoring.load_config(args.config), args.workers, args.batch_size)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"✅ Extracted features for {len(records)} answers in {time.perf_counter() - start:.2f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,44 @@
 import plotly.graph_objects as go
 
+from beta_reader_funnel import load_counts, sankey_links
+from beta_reader_table import compile_table, load_config
+
+# Link widths come from real applicant flows (python beta_reader_funnel.py <applications.jsonl>)
+counts = load_counts()
+# Stage minimums/maximums and the outcome bands come from the scoring config
+table = compile_table(load_config())
+
 # Data setup
 stage_data = [
-    {"name": "Stage 1: Basic Information", "label": "Basic Info\nChoice,Slide", "min_score": 15, "max_score": 30, "questions": ["Reading Frequency", "Genre Familiarity", "Time Commit"], "auto_disqualify": True, "interact": "🔘🔲"},
-    {"name": "Stage 2: Experience Assessment", "label": "Experience\nChoice,Box", "min_score": 25, "max_score": 40, "questions": ["Beta Exp", "FB Str.", "Writing Bgd", "Read Speed"], "auto_disqualify": False, "interact": "🔘☑️"},
-    {"name": "Stage 3: Sample Feedback", "label": "Sample FB\nTxt,Choice", "min_score": 30, "max_score": 50, "questions": ["Excerpt Anal.", "Problem ID", "Actions Sugg."], "auto_disqualify": False, "interact": "✏️🔘"},
-    {"name": "Stage 4: Final Assess", "label": "Final Assess\nChoice,Txt", "min_score": 20, "max_score": 30, "questions": ["Comm Style", "Motivation"], "auto_disqualify": False, "interact": "🔘✏️"},
+    {"name": "Stage 1: Basic Information", "label": "Basic Info\nChoice,Slide", "questions": ["Reading Frequency", "Genre Familiarity", "Time Commit"], "auto_disqualify": True, "interact": "🔘🔲"},
+    {"name": "Stage 2: Experience Assessment", "label": "Experience\nChoice,Box", "questions": ["Beta Exp", "FB Str.", "Writing Bgd", "Read Speed"], "auto_disqualify": False, "interact": "🔘☑️"},
+    {"name": "Stage 3: Sample Feedback", "label": "Sample FB\nTxt,Choice", "questions": ["Excerpt Anal.", "Problem ID", "Actions Sugg."], "auto_disqualify": False, "interact": "✏️🔘"},
+    {"name": "Stage 4: Final Assess", "label": "Final Assess\nChoice,Txt", "questions": ["Comm Style", "Motivation"], "auto_disqualify": False, "interact": "🔘✏️"},
 ]
+for stage, compiled in zip(stage_data, table["stages"]):
+    stage["min_score"] = compiled["minimum"]
+    stage["max_score"] = compiled["scale"]
 
-thresholds = {"Auto-Accept": 90, "Strong Cand.": 75, "Interview": 60, "Auto-Reject": 0}
+accept, strong, interview = (threshold["minimum"] for threshold in table["thresholds"])
 labels = []
-node_colors = ["#1FB8CD", "#DB4545", "#2E8B57", "#5D878F", "#D2BA4C"]
+# One color per stage node
+node_colors = ["#1FB8CD", "#2E8B57", "#5D878F", "#D2BA4C"]
 
 # Stage nodes (0-3)
 labels = [
     f"{s['label']}\n[{s['min_score']}-{s['max_score']}]" for s in stage_data
 ]
 
-# Disqualify at stage 1
-labels.append("Disqualify") # node 4
-node_colors.append("#DB4545")
+# Disqualified at each stage's minimum (nodes 4-7)
+labels += [f"Disqualified\n<{s['min_score']}" for s in stage_data]
+node_colors += ["#DB4545"] * len(stage_data)
 
-# Final outcome nodes (5-8)
+# Final outcome nodes (8-11)
 outcome_labels = [
-    f"Auto-Accept\n90+",
-    f"Strong Cand.\n75-89",
-    f"Interview\n60-74",
-    f"Reject\n<60"
+    f"Auto-Accept\n{accept}+",
+    f"Strong Cand.\n{strong}-{accept - 1}",
+    f"Interview\n{interview}-{strong - 1}",
+    f"Reject\n<{interview}"
 ]
 labels += outcome_labels
 node_colors += ["#2E8B57", "#D2BA4C", "#5D878F", "#DB4545"]
@@ -39,39 +51,31 @@ interact_hover = [
     "Multiple Choice, Text",     # 4
 ]
 
-# Sankey links
-src = []
-tgt = []
-val = []
-link_colors = []
-
-# Proceed to next stages
-for i in range(len(stage_data)-1):
-    src.append(i)
-    tgt.append(i+1)
-    val.append(30)
-    link_colors.append(node_colors[i])
-
-# Disqualify at stage 1 for low score
-src.append(0)
-tgt.append(4)
-val.append(10)
-link_colors.append("#DB4545")
-
-# At the end, score based outcome
-src.extend([3,3,3,3])
-tgt.extend([5,6,7,8])
-val.extend([20,20,20,20])
-link_colors += ["#2E8B57", "#D2BA4C", "#5D878F", "#DB4545"]
+# Sankey links: stage -> next stage, stage -> disqualified, last stage -> outcome
+link_palette = {
+    "disqualified": "#DB4545",
+    "auto_accept": "#2E8B57",
+    "strong_candidate": "#D2BA4C",
+    "interview_required": "#5D878F",
+    "auto_reject": "#DB4545",
+}
+links = sankey_links(counts)
+src = [source for source, _, _, _ in links]
+tgt = [target for _, target, _, _ in links]
+val = [value for _, _, value, _ in links]
+link_colors = [link_palette.get(kind, node_colors[source]) for source, _, _, kind in links]
 
 # Hover text for each node
 stage_ranges = [f"Stage {i+1}: {d['min_score']}-{d['max_score']}\nQuestions: {', '.join(d['questions'])}\nInput: {interact_hover[i]}" for i, d in enumerate(stage_data)]
+stage_ranges = [f"{hover}\nEntered: {entered}" for hover, entered in zip(stage_ranges, counts["entered"])]
 note_hovers = stage_ranges + [
-    "Auto-Disqualify: Incomplete Basic Info", # disqualify node
-    "Score >=90: Auto-Accept",
-    "75-89: Strong Candidate",
-    "60-74: Interview Req.",
-    "<60: Auto-Reject",
+    f"Below Stage {i+1} minimum ({d['min_score']}): {count}"
+    for i, (d, count) in enumerate(zip(stage_data, counts["disqualified"]))
+] + [
+    f"Score >={accept}: Auto-Accept",
+    f"{strong}-{accept - 1}: Strong Candidate",
+    f"{interview}-{strong - 1}: Interview Req.",
+    f"<{interview}: Auto-Reject",
 ]
 
 
@@ -95,7 +99,8 @@ fig = go.Figure(go.Sankey(
 ))
 
 fig.update_layout(
-    title_text="Beta Reader Flow and Scoring Bands",
+    title_text=f"Beta Reader Flow and Scoring Bands ({counts['applications']} "
+               f"{'sample ' if counts.get('sample') else ''}applications)",
     legend=dict(orientation='h', yanchor='bottom', y=1.05, xanchor='center', x=0.5),
 )
 
@@ -20,219 +20,11 @@ class BetaReaderApplication {
     }
     
     loadConfiguration() {
-        // Application stages configuration (would typically come from JSON file)
-        this.config = {
-            stages: {
-                1: {
-                    title: "Basic Information & Pre-Screening",
-                    description: "Initial qualification and basic details",
-                    autoDisqualify: true,
-                    minScoreRequired: 15,
-                    maxPossibleScore: 30,
-                    questions: [
-                        {
-                            id: "reading_frequency",
-                            type: "multiple_choice",
-                            question: "How many books do you typically read per year?",
-                            options: [
-                                {text: "0-5 books", score: 1},
-                                {text: "6-11 books", score: 3},
-                                {text: "12-24 books", score: 5},
-                                {text: "25-49 books", score: 7},
-                                {text: "50+ books", score: 10}
-                            ],
-                            weight: 0.33,
-                            required: true
-                        },
-                        {
-                            id: "genre_familiarity", 
-                            type: "multiple_choice",
-                            question: "How familiar are you with fantasy fiction?",
-                            options: [
-                                {text: "Never read it", score: 1},
-                                {text: "Read a few books", score: 3},
-                                {text: "Read occasionally", score: 5},
-                                {text: "Read regularly", score: 7},
-                                {text: "Expert knowledge", score: 10}
-                            ],
-                            weight: 0.33,
-                            required: true
-                        },
-                        {
-                            id: "time_commitment",
-                            type: "multiple_choice", 
-                            question: "How many hours per week can you dedicate to beta reading?",
-                            options: [
-                                {text: "1-2 hours", score: 2},
-                                {text: "3-5 hours", score: 5},
-                                {text: "6-9 hours", score: 7},
-                                {text: "10-14 hours", score: 9},
-                                {text: "15+ hours", score: 10}
-                            ],
-                            weight: 0.34,
-                            required: true
-                        }
-                    ]
-                },
-                2: {
-                    title: "Experience & Skills Assessment",
-                    description: "Detailed evaluation of reading and feedback experience",
-                    minScoreRequired: 25,
-                    maxPossibleScore: 40,
-                    questions: [
-                        {
-                            id: "beta_experience",
-                            type: "multiple_choice",
-                            question: "How many beta reading projects have you completed?",
-                            options: [
-                                {text: "None", score: 2},
-                                {text: "1 project", score: 4},
-                                {text: "2-4 projects", score: 6}, 
-                                {text: "5-9 projects", score: 8},
-                                {text: "10+ projects", score: 10}
-                            ],
-                            weight: 0.25,
-                            required: true
-                        },
-                        {
-                            id: "feedback_strengths",
-                            type: "checkbox_multiple",
-                            question: "What are your strongest areas for providing feedback? (Select up to 4)",
-                            options: [
-                                {text: "Plot structure and pacing", score: 3},
-                                {text: "Character development", score: 3},
-                                {text: "Dialogue authenticity", score: 2},
-                                {text: "World-building consistency", score: 2},
-                                {text: "Grammar and style", score: 2},
-                                {text: "Emotional impact", score: 2}
-                            ],
-                            weight: 0.30,
-                            maxSelections: 4,
-                            required: true
-                        },
-                        {
-                            id: "writing_background",
-                            type: "multiple_choice",
-                            question: "What best describes your writing/editing background?",
-                            options: [
-                                {text: "No writing experience", score: 2},
-                                {text: "Casual writer", score: 4},
-                                {text: "Serious writer (unpublished)", score: 6},
-                                {text: "Published author", score: 8},
-                                {text: "Professional editor/reviewer", score: 10}
-                            ],
-                            weight: 0.25,
-                            required: true
-                        },
-                        {
-                            id: "reading_speed",
-                            type: "slider",
-                            question: "Approximately how many pages can you read per hour?",
-                            min: 10,
-                            max: 100,
-                            step: 5,
-                            weight: 0.20,
-                            required: true
-                        }
-                    ]
-                },
-                3: {
-                    title: "Sample Feedback Analysis", 
-                    description: "Evaluate analytical skills through sample text review",
-                    minScoreRequired: 30,
-                    maxPossibleScore: 50,
-                    sampleText: "The obsidian gates groaned, not with the weight of stone, but with the sorrow of ages. Kaelen watched from the shadows, his breath a ghost in the frigid air, as the sigil on the archway pulsed with a faint, sickly green light. It was a warning. It was an invitation.",
-                    questions: [
-                        {
-                            id: "excerpt_analysis",
-                            type: "textarea",
-                            question: "Read this excerpt and identify what works well (100-300 words):",
-                            minWords: 100,
-                            maxWords: 300,
-                            weight: 0.30,
-                            required: true,
-                            scoringCriteria: [
-                                {aspect: "Identifies specific literary techniques", maxScore: 3},
-                                {aspect: "Provides concrete examples from text", maxScore: 3},
-                                {aspect: "Shows genre awareness", maxScore: 2},
-                                {aspect: "Demonstrates emotional engagement", maxScore: 2}
-                            ]
-                        },
-                        {
-                            id: "problem_identification",
-                            type: "textarea", 
-                            question: "What, if anything, was confusing or unclear? How could it be improved? (100-300 words)",
-                            minWords: 100,
-                            maxWords: 300,
-                            weight: 0.30,
-                            required: true,
-                            scoringCriteria: [
-                                {aspect: "Identifies genuine readability issues", maxScore: 3},
-                                {aspect: "Distinguishes objective vs subjective concerns", maxScore: 3},
-                                {aspect: "Explains reasoning clearly", maxScore: 2},
-                                {aspect: "Provides constructive context", maxScore: 2}
-                            ]
-                        },
-                        {
-                            id: "actionable_suggestion",
-                            type: "textarea",
-                            question: "Provide one specific, actionable suggestion to enhance this scene (60-200 words)",
-                            minWords: 60,
-                            maxWords: 200,
-                            weight: 0.40,
-                            required: true,
-                            scoringCriteria: [
-                                {aspect: "Offers specific, implementable solution", maxScore: 4},
-                                {aspect: "Shows understanding of author's intent", maxScore: 3},
-                                {aspect: "Suggests enhancement rather than just fixes", maxScore: 3}
-                            ]
-                        }
-                    ]
-                },
-                4: {
-                    title: "Final Assessment & Preferences",
-                    description: "Communication style and final compatibility check",
-                    minScoreRequired: 20,
-                    maxPossibleScore: 30,
-                    questions: [
-                        {
-                            id: "communication_style",
-                            type: "multiple_choice",
-                            question: "How would you describe your feedback style?",
-                            options: [
-                                {text: "Direct and detailed", score: 8},
-                                {text: "Gentle but thorough", score: 10},
-                                {text: "Focused on major issues", score: 6},
-                                {text: "Encouraging with suggestions", score: 9},
-                                {text: "Technical and analytical", score: 7}
-                            ],
-                            weight: 0.40,
-                            required: true
-                        },
-                        {
-                            id: "motivation",
-                            type: "textarea",
-                            question: "Why do you want to be a beta reader for this project? (50-150 words)",
-                            minWords: 50,
-                            maxWords: 150,
-                            weight: 0.60,
-                            required: true,
-                            scoringCriteria: [
-                                {aspect: "Shows genuine interest in the work", maxScore: 4},
-                                {aspect: "Demonstrates understanding of role", maxScore: 3},
-                                {aspect: "Articulates value they can provide", maxScore: 3}
-                            ]
-                        }
-                    ]
-                }
-            },
-            thresholds: {
-                autoAccept: 90,
-                strongCandidate: 75,
-                interviewRequired: 60,
-                autoReject: 0
-            }
-        };
+        // Form definition and scoring table generated from beta_reader_application_system.json
+        // by beta_reader_table.py (loaded from beta_reader_scoring_table.js)
+        this.config = BETA_READER_CONFIG;
+        this.scoringTable = BETA_READER_SCORING_TABLE;
+        this.totalStages = this.scoringTable.stages.length;
     }
     
     initializeApplication() {
@@ -281,6 +73,8 @@ class BetaReaderApplication {
                     return this.renderTextarea(question, stageNum);
                 case 'slider':
                     return this.renderSlider(question);
+                case 'date_range':
+                    return this.renderDateRange(question);
                 default:
                     return '';
             }
@@ -323,7 +117,7 @@ class BetaReaderApplication {
     }
     
     renderTextarea(question, stageNum) {
-        const sampleText = stageNum === 3 ? `<div class="sample-text"><h4>Sample Text:</h4><p class="excerpt">${this.config.stages[3].sampleText}</p></div>` : '';
+        const sampleText = question.sampleText ? `<div class="sample-text"><h4>Sample Text:</h4><p class="excerpt">${question.sampleText}</p></div>` : '';
         
         return `
             <div class="question-container">
@@ -372,6 +166,19 @@ class BetaReaderApplication {
         `;
     }
     
+    renderDateRange(question) {
+        return `
+            <div class="question-container">
+                <h3 class="question-title">${question.question}</h3>
+                <div class="date-range-container" id="${question.id}">
+                    <input type="date" id="${question.id}-start" name="${question.id}-start">
+                    <span>to</span>
+                    <input type="date" id="${question.id}-end" name="${question.id}-end">
+                </div>
+            </div>
+        `;
+    }
+    
     handleStageSubmission(stageNum) {
         if (!this.validateStage(stageNum)) {
             return;
@@ -382,7 +189,7 @@ class BetaReaderApplication {
         this.stageScores[stageNum] = stageScore;
         
         // Check if they meet minimum requirements for this stage
-        const minRequired = this.config.stages[stageNum].minScoreRequired;
+        const minRequired = this.scoringTable.stages[stageNum - 1].minimum;
         if (stageScore < minRequired) {
             this.isQualified = false;
             this.showDisqualificationMessage(stageNum, stageScore, minRequired);
@@ -425,30 +232,31 @@ class BetaReaderApplication {
     }
     
     scoreStage(stageNum) {
-        const stage = this.config.stages[stageNum];
+        // Each answer reduces to a raw score that indexes the question's pre-weighted points
+        const stage = this.scoringTable.stages[stageNum - 1];
         let stageScore = 0;
         
         stage.questions.forEach(question => {
-            const value = this.getQuestionValue(question);
-            let questionScore = 0;
-            
-            if (question.type === 'multiple_choice') {
-                questionScore = parseInt(value) * question.weight;
-            } else if (question.type === 'checkbox_multiple') {
-                questionScore = value.reduce((sum, score) => sum + parseInt(score), 0) * question.weight;
-            } else if (question.type === 'slider') {
-                // Convert slider value to score (1-10 scale)
-                questionScore = Math.min(10, Math.floor(parseInt(value) / 10)) * question.weight;
-            } else if (question.type === 'textarea') {
-                // Textarea scoring would need manual review or NLP analysis
-                // For now, assign base score - in real implementation, this would be scored manually
-                questionScore = this.scoreTextResponse(value, question.scoringCriteria) * question.weight;
-            }
-            
-            stageScore += questionScore;
+            const rawScore = this.rawQuestionScore(question, this.getQuestionValue(question));
+            this.responses[question.id] = rawScore;
+            stageScore += question.points[rawScore];
         });
         
-        return Math.round(stageScore * stage.maxPossibleScore / 10); // Normalize to stage max score
+        return Math.round(stageScore * stage.scale / stage.divisor); // Normalize to stage max score
+    }
+    
+    rawQuestionScore(question, value) {
+        if (question.type === 'multiple_choice') {
+            return parseInt(value);
+        } else if (question.type === 'checkbox_multiple') {
+            return value.reduce((sum, score) => sum + parseInt(score), 0);
+        } else if (question.type === 'slider') {
+            return Math.min(question.max_bucket, Math.floor(parseInt(value) / question.bucket_size));
+        } else if (question.type === 'textarea') {
+            // Automated heuristic - in practice text answers would need human review
+            return this.scoreTextResponse(value);
+        }
+        return 0;
     }
     
     scoreTextResponse(text, criteria) {
@@ -476,6 +284,10 @@ class BetaReaderApplication {
         } else if (question.type === 'textarea' || question.type === 'slider') {
             const element = document.getElementById(question.id);
             return element ? element.value : null;
+        } else if (question.type === 'date_range') {
+            const start = document.getElementById(question.id + '-start');
+            const end = document.getElementById(question.id + '-end');
+            return start && end && start.value && end.value ? {start: start.value, end: end.value} : null;
         }
         return null;
     }
@@ -495,26 +307,15 @@ class BetaReaderApplication {
     }
     
     calculateBonuses() {
-        let bonuses = 0;
-        
-        // Genre expert bonus
-        const genreScore = this.responses['genre_familiarity'];
-        if (genreScore >= 9) bonuses += 5;
-        
-        // Professional experience bonus
-        const writingScore = this.responses['writing_background'];
-        if (writingScore >= 8) bonuses += 10;
-        
-        return bonuses;
+        // responses hold raw scores, i.e. the selected option score for multiple choice
+        return this.scoringTable.bonuses
+            .filter(bonus => this.responses[bonus.question] >= bonus.minimum)
+            .reduce((sum, bonus) => sum + bonus.points, 0);
     }
     
     classifyApplicant() {
-        const thresholds = this.config.thresholds;
-        
-        if (this.totalScore >= thresholds.autoAccept) return 'auto_accept';
-        if (this.totalScore >= thresholds.strongCandidate) return 'strong_candidate';  
-        if (this.totalScore >= thresholds.interviewRequired) return 'interview_required';
-        return 'auto_reject';
+        const threshold = this.scoringTable.thresholds.find(threshold => this.totalScore >= threshold.minimum);
+        return threshold ? threshold.classification : this.scoringTable.default_classification;
     }
     
     showResults(classification) {
@@ -529,7 +330,7 @@ class BetaReaderApplication {
             <div class="results-container">
                 <h2>Application Complete</h2>
                 <div class="score-display">
-                    <h3>Your Score: ${this.totalScore}/150</h3>
+                    <h3>Your Score: ${this.totalScore}/${this.scoringTable.max_total}</h3>
                     <div class="score-breakdown">
                         ${Object.entries(this.stageScores).map(([stage, score]) => 
                             `<div>Stage ${stage}: ${score} points</div>`
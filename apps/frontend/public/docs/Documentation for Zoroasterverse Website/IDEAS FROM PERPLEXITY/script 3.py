@@ -25,6 +25,7 @@ html_template = '''
         </footer>
     </div>
     
+    <script src="beta_reader_scoring_table.js"></script>
     <script src="beta_reader_app.js"></script>
 </body>
 </html>
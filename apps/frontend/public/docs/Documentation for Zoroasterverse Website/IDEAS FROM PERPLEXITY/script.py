@@ -203,7 +203,9 @@ application_stages = {
                     {"aspect": "Provides realistic timeframe", "max_score": 3},
                     {"aspect": "Shows flexibility", "max_score": 2}
                 ],
-                "weight": 0.30,
+                # Collected for scheduling but never scored: the scorers give date
+                # ranges 0, so any weight here would only lower the stage ceiling
+                "weight": 0.0,
                 "required": True
             },
             {
@@ -217,7 +219,7 @@ application_stages = {
                 ],
                 "min_words": 50,
                 "max_words": 150,
-                "weight": 0.30,
+                "weight": 0.60,
                 "required": True
             }
         ]
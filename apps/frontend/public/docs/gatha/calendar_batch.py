@@ -0,0 +1,206 @@
+# Batch generation of calendar variants across a process pool.
+#
+# Takes the matrix locales x years x tag profiles and fans the jobs out over a
+# ProcessPoolExecutor. The parent warms the stage cache and checks the tag
+# profiles against tags_list; each worker loads the shared inputs (the
+# combined verse corpus and any translation catalogues) once in its
+# initializer, then every job only filters, schedules, localizes and writes.
+#
+# The day order is computed from the English entries, once per (year,
+# profile) in each worker, and only the scheduled calendar is localized:
+# script_8 breaks ties by hashing the entry text, so scheduling translated
+# text would put a different verse on day N in every locale.
+#
+# Outputs land in <out-dir>/<locale>/<year>/<profile>.json and are written to
+# a temporary file first and renamed into place, so a crashed or cancelled
+# run never leaves a half-written calendar behind. The default <out-dir> is
+# the git-ignored dist/calendars/ at the repository root, outside Vite's
+# public/ dir.
+#
+# Locales other than "en" read translations/<locale>.json, a {english text:
+# translated text} catalogue; untranslated entries fall back to English and
+# are counted in the job result.
+#
+# Usage:
+#   python calendar_batch.py --locales en,fa --years 2026,2027,2028 --profiles all,fire
+#   python calendar_batch.py --years 2026 --workers 4 --out-dir /tmp/calendars
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+GATHA_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(GATHA_DIR, "..", "..", "..", "..", ".."))
+TRANSLATIONS_DIR = os.path.join(GATHA_DIR, "translations")
+DEFAULT_OUT_DIR = os.path.join(REPO_ROOT, "dist", "calendars")
+
+# include_any: keep entries with at least one of these tags (empty = keep all)
+# exclude: drop entries carrying any of these tags
+TAG_PROFILES = {
+    "all": {"include_any": [], "exclude": []},
+    "fire": {"include_any": ["fire", "conscience", "enlightenment", "spenta-mainyu"], "exclude": []},
+    "practice": {"include_any": ["daily-practice", "good-deeds", "action", "renewal", "gratitude"], "exclude": []},
+    "wisdom": {"include_any": ["wisdom", "vohu-manah", "reflection", "good-thoughts"], "exclude": []},
+}
+
+# Per-worker state, filled once by _init_worker
+_shared = {}
+
+
+def _engine():
+    # The gatha folder is not a package; make calendar_build importable from anywhere
+    if GATHA_DIR not in sys.path:
+        sys.path.insert(0, GATHA_DIR)
+    import calendar_build
+    return calendar_build
+
+
+def _init_worker(cache_dir):
+    calendar_build = _engine()
+    _, entries = calendar_build.build_entries(cache_dir=cache_dir)
+    _shared["entries"] = entries["authentic"] + entries["inspired"]
+    _shared["ordering"] = calendar_build.load_stage("script_8")
+    _shared["output"] = calendar_build.load_stage("script_9")
+    _shared["catalogues"] = {}
+    _shared["schedules"] = {}
+
+
+def _catalogue(locale):
+    if locale not in _shared["catalogues"]:
+        path = os.path.join(TRANSLATIONS_DIR, f"{locale}.json")
+        if locale == "en" or not os.path.exists(path):
+            _shared["catalogues"][locale] = {}
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                _shared["catalogues"][locale] = json.load(f)
+    return _shared["catalogues"][locale]
+
+
+def select_entries(entries, profile):
+    include_any = set(profile.get("include_any", []))
+    exclude = set(profile.get("exclude", []))
+    return [
+        entry for entry in entries
+        if (not include_any or include_any.intersection(entry["tags"]))
+        and not exclude.intersection(entry["tags"])
+    ]
+
+
+def localize(entries, locale, catalogue):
+    """Translate the text of `entries`, keeping their order; returns them and the number of
+    distinct texts that fell back to English."""
+    untranslated = set()
+    localized = []
+    for entry in entries:
+        text = catalogue.get(entry["text"])
+        if text is None:
+            text = entry["text"]
+            if locale != "en":
+                untranslated.add(text)
+        localized.append(dict(entry, text=text))
+    return localized, len(untranslated)
+
+
+def schedule(year, profile_name):
+    """The numbered English calendar for (year, profile), scheduled once per worker."""
+    key = (year, profile_name)
+    if key not in _shared["schedules"]:
+        entries = select_entries(_shared["entries"], TAG_PROFILES[profile_name])
+        if not entries:
+            raise ValueError(f"Tag profile {profile_name!r} selects no entries")
+        ordering = _shared["ordering"]
+        _shared["schedules"][key] = (ordering.number_entries(ordering.order_entries(entries, year)),
+                                     len(entries))
+    return _shared["schedules"][key]
+
+
+def job_output_path(out_dir, locale, year, profile_name):
+    return os.path.join(out_dir, locale, str(year), f"{profile_name}.json")
+
+
+def run_job(locale, year, profile_name, out_dir):
+    """Build and atomically write one calendar variant; runs inside a worker."""
+    start = time.perf_counter()
+    scheduled, distinct_entries = schedule(year, profile_name)
+    final_calendar, untranslated = localize(scheduled, locale, _catalogue(locale))
+
+    path = job_output_path(out_dir, locale, year, profile_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    _shared["output"].write_calendar(final_calendar, tmp_path)
+    os.replace(tmp_path, path)
+
+    return {
+        "locale": locale,
+        "year": year,
+        "profile": profile_name,
+        "path": path,
+        "days": len(final_calendar),
+        "distinct_entries": distinct_entries,
+        "untranslated": untranslated,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def job_matrix(locales, years, profiles):
+    return [(locale, year, profile) for locale in locales for year in years for profile in profiles]
+
+
+def generate(jobs, out_dir=DEFAULT_OUT_DIR, workers=None, cache_dir=None):
+    """Run `jobs` [(locale, year, profile), ...] across a process pool."""
+    calendar_build = _engine()
+
+    cache_dir = calendar_build.DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+    unknown = sorted({profile for _, _, profile in jobs} - set(TAG_PROFILES))
+    if unknown:
+        raise ValueError(f"Unknown tag profiles: {', '.join(unknown)}")
+
+    # Warm the stage cache once so workers read it instead of rebuilding
+    calendar_build.build_entries(cache_dir=cache_dir)
+    _, tags_list = calendar_build.build_taxonomy(cache_dir=cache_dir)
+    for name in {profile for _, _, profile in jobs}:
+        profile = TAG_PROFILES[name]
+        stray = sorted(set(profile["include_any"] + profile["exclude"]) - set(tags_list))
+        if stray:
+            raise ValueError(f"Tag profile {name!r} uses tags outside tags_list: {', '.join(stray)}")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_dir,)) as pool:
+        futures = [pool.submit(run_job, locale, year, profile, out_dir)
+                   for locale, year, profile in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort(key=lambda result: (result["locale"], result["year"], result["profile"]))
+    return results
+
+
+def _split(value, cast=str):
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate calendar variants in parallel")
+    parser.add_argument("--locales", default="en", help="Comma-separated locales")
+    parser.add_argument("--years", required=True, help="Comma-separated years")
+    parser.add_argument("--profiles", default="all", help=f"Comma-separated tag profiles ({', '.join(TAG_PROFILES)})")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    jobs = job_matrix(_split(args.locales), _split(args.years, int), _split(args.profiles))
+    start = time.perf_counter()
+    results = generate(jobs, args.out_dir, args.workers)
+
+    for result in results:
+        note = f", {result['untranslated']} untranslated" if result["untranslated"] else ""
+        print(f"✅ {result['locale']}/{result['year']}/{result['profile']}: "
+              f"{result['days']} days from {result['distinct_entries']} entries{note}")
+    print(f"Generated {len(results)} calendars in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
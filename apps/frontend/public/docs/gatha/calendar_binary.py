@@ -0,0 +1,225 @@
+# Compact binary calendar format, readable through mmap.
+#
+# The JSON calendar has to be parsed in full before any single day can be
+# read. This format keeps a fixed-width entry table in front of a string pool,
+# so "verse for day N" is one offset computation plus one slice of the mapped
+# file, with no parsing of the other 364 entries.
+#
+# Layout (all integers little-endian):
+#
+#   header      "GCAL" | version u16 | entry_count u32 | tag_count u16 |
+#               source_count u16 | tag_table_off u32 | source_table_off u32 |
+#               tag_ids_off u32 | pool_off u32
+#   entries     entry_count x (id u32 | text_off u32 | text_len u32 |
+#                              source u16 | tag_count u16 | tag_start u32)
+#   tag table   tag_count x (name_off u32 | name_len u32)
+#   source tbl  source_count x (name_off u32 | name_len u32)
+#   tag ids     one u8 per tag occurrence, interned from `tags_list` order
+#   pool        UTF-8 string pool (texts, tag names, source names)
+#
+# Entries are stored in day order, so day N lives at record N - 1.
+#
+# Usage:
+#   python calendar_binary.py write   # JSON -> .gcal (calendar_build.py also writes it on every build)
+#   python calendar_binary.py verify  # round-trip check against the JSON
+#   python calendar_binary.py bench   # cold-start load time, JSON vs .gcal
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+
+MAGIC = b"GCAL"
+VERSION = 1
+BINARY_FILENAME = "365_day_gathic_devotional_calendar.gcal"
+
+HEADER = struct.Struct("<4sHIHHIIII")
+ENTRY = struct.Struct("<IIIHHI")
+NAME = struct.Struct("<II")
+
+
+def intern_tags(final_calendar, tags_list):
+    """Assign small integer ids to tags, taxonomy order first, extras after."""
+    tag_ids = {tag: i for i, tag in enumerate(tags_list)}
+    extra = sorted({tag for entry in final_calendar for tag in entry["tags"]} - set(tag_ids))
+    for tag in extra:
+        tag_ids[tag] = len(tag_ids)
+    if len(tag_ids) > 256:
+        raise ValueError(f"Too many distinct tags for u8 tag ids: {len(tag_ids)}")
+    return tag_ids
+
+
+def encode_calendar(final_calendar, tags_list):
+    tag_ids = intern_tags(final_calendar, tags_list)
+    sources = sorted({entry["source"] for entry in final_calendar})
+    source_ids = {source: i for i, source in enumerate(sources)}
+
+    pool = bytearray()
+
+    def add_string(value):
+        data = value.encode("utf-8")
+        offset = len(pool)
+        pool.extend(data)
+        return offset, len(data)
+
+    entry_records = bytearray()
+    tag_id_bytes = bytearray()
+    for entry in final_calendar:
+        text_off, text_len = add_string(entry["text"])
+        tag_start = len(tag_id_bytes)
+        tag_id_bytes.extend(tag_ids[tag] for tag in entry["tags"])
+        entry_records += ENTRY.pack(entry["id"], text_off, text_len,
+                                    source_ids[entry["source"]], len(entry["tags"]), tag_start)
+
+    tag_table = bytearray()
+    for tag in tag_ids:
+        tag_table += NAME.pack(*add_string(tag))
+    source_table = bytearray()
+    for source in sources:
+        source_table += NAME.pack(*add_string(source))
+
+    tag_table_off = HEADER.size + len(entry_records)
+    source_table_off = tag_table_off + len(tag_table)
+    tag_ids_off = source_table_off + len(source_table)
+    pool_off = tag_ids_off + len(tag_id_bytes)
+
+    header = HEADER.pack(MAGIC, VERSION, len(final_calendar), len(tag_ids), len(sources),
+                         tag_table_off, source_table_off, tag_ids_off, pool_off)
+    return header + entry_records + tag_table + source_table + tag_id_bytes + pool
+
+
+def write_binary_calendar(final_calendar, tags_list, path=BINARY_FILENAME):
+    data = encode_calendar(final_calendar, tags_list)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+class BinaryCalendar:
+    """Read-only view over a .gcal file; only the requested entries are decoded."""
+
+    def __init__(self, path=BINARY_FILENAME):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.entry_count, tag_count, source_count,
+         tag_table_off, source_table_off, self._tag_ids_off, self._pool_off) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} binary calendar")
+        self.tags = self._read_names(tag_table_off, tag_count)
+        self.sources = self._read_names(source_table_off, source_count)
+
+    def _string(self, offset, length):
+        start = self._pool_off + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _read_names(self, table_off, count):
+        return [self._string(*NAME.unpack_from(self._map, table_off + i * NAME.size))
+                for i in range(count)]
+
+    def __len__(self):
+        return self.entry_count
+
+    def entry(self, day):
+        """Entry for 1-based `day`, decoded as the same dict the JSON holds."""
+        if not 1 <= day <= self.entry_count:
+            raise IndexError(f"Day {day} outside 1..{self.entry_count}")
+        entry_id, text_off, text_len, source, tag_count, tag_start = ENTRY.unpack_from(
+            self._map, HEADER.size + (day - 1) * ENTRY.size)
+        tag_start += self._tag_ids_off
+        return {
+            "id": entry_id,
+            "text": self._string(text_off, text_len),
+            "tags": [self.tags[i] for i in self._map[tag_start:tag_start + tag_count]],
+            "source": self.sources[source],
+        }
+
+    def __iter__(self):
+        for day in range(1, self.entry_count + 1):
+            yield self.entry(day)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def verify_round_trip(json_path, binary_path=BINARY_FILENAME):
+    """Return a list of mismatches between the JSON calendar and its binary copy."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        expected = json.load(f)
+
+    problems = []
+    with BinaryCalendar(binary_path) as calendar:
+        if len(calendar) != len(expected):
+            problems.append(f"entry count {len(calendar)} != {len(expected)}")
+        for day, entry in enumerate(expected[:len(calendar)], 1):
+            actual = calendar.entry(day)
+            if actual != entry:
+                problems.append(f"day {day}: {actual!r} != {entry!r}")
+    return problems
+
+
+def benchmark_cold_start(json_path, binary_path=BINARY_FILENAME, day=180, repeat=50):
+    """Median seconds to open a calendar and read one day, for each format."""
+
+    def load_json():
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)[day - 1]
+
+    def load_binary():
+        with BinaryCalendar(binary_path) as calendar:
+            return calendar.entry(day)
+
+    results = {}
+    for name, load in (("json", load_json), ("binary", load_binary)):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        results[name] = timings[len(timings) // 2]
+    return results
+
+
+def main(argv=None):
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Binary devotional calendar tools")
+    parser.add_argument("command", choices=["write", "verify", "bench"])
+    parser.add_argument("--json", default=os.path.join(here, "365_day_gathic_devotional_calendar.json"))
+    parser.add_argument("--binary", default=os.path.join(here, BINARY_FILENAME))
+    args = parser.parse_args(argv)
+
+    if args.command == "write":
+        import calendar_build
+        with open(args.json, "r", encoding="utf-8") as f:
+            final_calendar = json.load(f)
+        write_binary_calendar(final_calendar, calendar_build.load_stage("script").tags_list, args.binary)
+        print(f"✅ Wrote {args.binary}")
+        return
+
+    if args.command == "verify":
+        problems = verify_round_trip(args.json, args.binary)
+        for problem in problems[:20]:
+            print(f"❌ {problem}")
+        print("✅ Binary calendar matches JSON" if not problems else f"{len(problems)} mismatches")
+        raise SystemExit(1 if problems else 0)
+
+    results = benchmark_cold_start(args.json, args.binary)
+    print(f"JSON cold start:   {results['json'] * 1000:.3f} ms")
+    print(f"Binary cold start: {results['binary'] * 1000:.3f} ms")
+    print(f"Speedup: {results['json'] / results['binary']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
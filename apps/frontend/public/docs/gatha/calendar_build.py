@@ -0,0 +1,253 @@
+# Single build engine for the 365-day Gathic devotional calendar.
+#
+# script.py ... script_9.py used to be run in order inside one interpreter
+# session, sharing `authentic_entries`, `gathic_inspired_entries` and
+# `final_calendar` as globals. Each script is now a side-effect-free stage
+# module and this file wires them together:
+#
+#   taxonomy  -> script.py      (tags_list)
+#   batches   -> script_1..7    (authentic + gathic-inspired batches)
+#   entries   -> combined authentic_entries + gathic_inspired_entries
+#   dedupe    -> dedupe.py      (MinHash/LSH near-duplicate clusters, optional collapse)
+#   calendar  -> script_8.py    (tag-balanced day scheduling + sequential ids)
+#   tag index -> tag_index.py   (tag -> sorted entry ids)
+#   output    -> script_9.py    (JSON file) + tag_index.py (companion index)
+#                + calendar_binary.py (mmap-readable .gcal copy)
+#
+# Every stage result is cached on disk under the repository's .build_cache/
+# (git-ignored and outside Vite's public/ dir, so it is never deployed), keyed
+# by a hash of the stage's own source plus the keys of the stages it depends
+# on, so a rebuild only re-executes the stages whose inputs actually changed.
+#
+# Usage:
+#   python calendar_build.py            # build 365_day_gathic_devotional_calendar.json
+#   python calendar_build.py --no-cache # force every stage to re-run
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+
+GATHA_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(GATHA_DIR, "..", "..", "..", "..", ".."))
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".build_cache", "gatha")
+
+# (stage module, authentic batch getter, inspired batch getter), in the order
+# the original notebook chain extended the two lists.
+BATCH_STAGES = [
+    ("script_1", lambda m: m.authentic_entries, lambda m: m.gathic_inspired_entries),
+    ("script_2", lambda m: m.more_authentic, lambda m: m.create_gathic_inspired_batch([], 30)),
+    ("script_3", lambda m: m.additional_authentic, lambda m: m.generate_inspired_entries_by_theme()),
+    ("script_4", lambda m: m.create_more_authentic_entries(), lambda m: m.create_large_inspired_batch()),
+    ("script_5", lambda m: m.create_another_authentic_batch(), lambda m: m.create_massive_inspired_batch()),
+    ("script_6", lambda m: m.create_final_authentic_batch(), lambda m: m.create_final_inspired_batch()),
+    ("script_7", lambda m: m.more_authentic_final, lambda m: m.create_completion_inspired_batch()),
+]
+
+_modules = {}
+_memo = {}
+
+
+def stage_path(name):
+    return os.path.join(GATHA_DIR, name + ".py")
+
+
+def load_stage(name):
+    """Import a stage script by path (the gatha folder is not a package)."""
+    if name not in _modules:
+        spec = importlib.util.spec_from_file_location("gatha_" + name, stage_path(name))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+
+def source_digest(name):
+    with open(stage_path(name), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def tag_index_path(calendar_path):
+    root, _ = os.path.splitext(calendar_path)
+    return root + ".tags.json"
+
+
+def binary_path(calendar_path):
+    root, _ = os.path.splitext(calendar_path)
+    return root + ".gcal"
+
+
+def stage_key(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def cached_stage(stage, key, compute, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """Return the result of `compute()` for (stage, key), memoised in-process and on disk."""
+    memo_key = (stage, key)
+    if use_cache and memo_key in _memo:
+        return _memo[memo_key]
+
+    path = os.path.join(cache_dir, f"{stage}-{key}.json") if cache_dir else None
+    if use_cache and path and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+    else:
+        result = compute()
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    _memo[memo_key] = result
+    return result
+
+
+def build_taxonomy(cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    key = source_digest("script")
+    tags = cached_stage("taxonomy", key, lambda: list(load_stage("script").tags_list),
+                        cache_dir, use_cache)
+    return key, tags
+
+
+def build_batch(name, get_authentic, get_inspired, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    key = source_digest(name)
+
+    def compute():
+        module = load_stage(name)
+        return {
+            "authentic": [dict(entry) for entry in get_authentic(module)],
+            "inspired": [dict(entry) for entry in get_inspired(module)],
+        }
+
+    return key, cached_stage("batch_" + name, key, compute, cache_dir, use_cache)
+
+
+def build_entries(cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """Combine every batch into authentic_entries + gathic_inspired_entries."""
+    batches = [build_batch(name, get_a, get_i, cache_dir, use_cache)
+               for name, get_a, get_i in BATCH_STAGES]
+    key = stage_key("entries", *(batch_key for batch_key, _ in batches))
+
+    def compute():
+        authentic_entries = []
+        gathic_inspired_entries = []
+        for _, batch in batches:
+            authentic_entries.extend(batch["authentic"])
+            gathic_inspired_entries.extend(batch["inspired"])
+        return {"authentic": authentic_entries, "inspired": gathic_inspired_entries}
+
+    return key, cached_stage("entries", key, compute, cache_dir, use_cache)
+
+
+def build_deduplicated_entries(collapse=False, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """Near-duplicate clusters over the combined entries, optionally collapsed.
+
+    Only textual near-duplicates are collapsed (first occurrence wins); the
+    same-verse-reference groups are reported by dedupe.py but kept, since they
+    are usually different lines of one verse.
+    """
+    entries_key, entries = build_entries(cache_dir, use_cache)
+    key = stage_key("dedupe", entries_key, source_digest("dedupe"), collapse)
+
+    def compute():
+        deduper = load_stage("dedupe")
+        all_entries = entries["authentic"] + entries["inspired"]
+        clusters = deduper.find_duplicate_clusters(all_entries, by_reference=False)
+        if collapse:
+            all_entries = deduper.collapse_duplicates(all_entries, clusters)
+        return {
+            "authentic": [entry for entry in all_entries if entry["source"] == "yasna"],
+            "inspired": [entry for entry in all_entries if entry["source"] != "yasna"],
+            "clusters": clusters,
+        }
+
+    return key, cached_stage("dedupe", key, compute, cache_dir, use_cache)
+
+
+def build_final_calendar(year=None, collapse_duplicates=False, cache_dir=DEFAULT_CACHE_DIR,
+                         use_cache=True):
+    """Schedule and number the combined entries (the script_8 stage).
+
+    `year` only matters for leap years (366 days) and month lengths.
+    """
+    ordering = load_stage("script_8")
+    if collapse_duplicates:
+        entries_key, entries = build_deduplicated_entries(True, cache_dir, use_cache)
+    else:
+        entries_key, entries = build_entries(cache_dir, use_cache)
+    key = stage_key("calendar", entries_key, source_digest("script_8"), year)
+
+    def compute():
+        all_entries = entries["authentic"] + entries["inspired"]
+        return ordering.number_entries(ordering.order_entries(all_entries, year))
+
+    return key, cached_stage("calendar", key, compute, cache_dir, use_cache)
+
+
+def build_tag_index(year=None, collapse_duplicates=False, cache_dir=DEFAULT_CACHE_DIR,
+                    use_cache=True):
+    """Inverted tag -> entry id index over the final calendar."""
+    taxonomy_key, tags_list = build_taxonomy(cache_dir, use_cache)
+    calendar_key, final_calendar = build_final_calendar(year, collapse_duplicates, cache_dir,
+                                                        use_cache)
+    key = stage_key("tag_index", taxonomy_key, calendar_key, source_digest("tag_index"))
+    indexer = load_stage("tag_index")
+    return key, cached_stage("tag_index", key,
+                             lambda: indexer.build_tag_index(final_calendar, tags_list),
+                             cache_dir, use_cache)
+
+
+def build_calendar(output_path=None, year=None, collapse_duplicates=False,
+                   cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """Build the devotional calendar and write it to `output_path`.
+
+    The inverted tag index (`.tags.json`) and the binary copy (`.gcal`) are
+    written next to it.
+    Returns the final calendar list. Pass `output_path=False` to skip writing.
+    """
+    _, final_calendar = build_final_calendar(year, collapse_duplicates, cache_dir, use_cache)
+
+    if output_path is not False:
+        output = load_stage("script_9")
+        if output_path is None:
+            output_path = os.path.join(GATHA_DIR, output.CALENDAR_FILENAME)
+        output.write_calendar(final_calendar, output_path)
+
+        _, tag_index = build_tag_index(year, collapse_duplicates, cache_dir, use_cache)
+        load_stage("tag_index").write_tag_index(tag_index, tag_index_path(output_path))
+
+        _, tags_list = build_taxonomy(cache_dir, use_cache)
+        load_stage("calendar_binary").write_binary_calendar(final_calendar, tags_list,
+                                                            binary_path(output_path))
+
+    return final_calendar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the 365-day Gathic devotional calendar")
+    parser.add_argument("--output", default=None, help="Output JSON path")
+    parser.add_argument("--year", type=int, default=None, help="Calendar year (366 days if leap)")
+    parser.add_argument("--collapse-duplicates", action="store_true",
+                        help="Drop textual near-duplicate entries before numbering")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every stage")
+    args = parser.parse_args(argv)
+
+    final_calendar = build_calendar(args.output, args.year, args.collapse_duplicates,
+                                    use_cache=not args.no_cache)
+    stats = load_stage("script_8").calendar_statistics(final_calendar)
+    total = stats["total"]
+
+    print(f"✅ Built {total}-day Gathic devotional calendar")
+    print(f"- Authentic (yasna): {stats['authentic']} entries ({stats['authentic']/total*100:.1f}%)")
+    print(f"- Inspired (gathic-inspired): {stats['inspired']} entries ({stats['inspired']/total*100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
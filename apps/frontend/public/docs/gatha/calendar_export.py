@@ -0,0 +1,152 @@
+# Streaming JSON Lines export and bulk loader for the devotional calendar.
+#
+# Calendars are exported one entry per line instead of one big JSON array, so
+# neither the writer nor the loader ever holds more than one batch in memory,
+# however many years or locales are chained together. Paths ending in .gz are
+# gzip-compressed transparently.
+#
+# The loader upserts batches into the `devotional_entries` table
+# (supabase/migrations/20251018000000_create_devotional_entries_table.sql)
+# through psycopg2; any Postgres works as a local stand-in for Supabase.
+#
+# Usage:
+#   python calendar_export.py export calendar.jsonl.gz
+#   python calendar_export.py load calendar.jsonl.gz --dsn postgresql://localhost/zoroastervers
+#   python calendar_export.py export - | python calendar_export.py load - --batch-size 1000
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_LOCALE = "en"
+# Year 0 marks the evergreen calendar that is not tied to a specific year
+EVERGREEN_YEAR = 0
+
+UPSERT_SQL = """
+    INSERT INTO devotional_entries (locale, year, day, text, tags, source)
+    VALUES %s
+    ON CONFLICT (locale, year, day) DO UPDATE SET
+        text = EXCLUDED.text,
+        tags = EXCLUDED.tags,
+        source = EXCLUDED.source,
+        updated_at = NOW()
+"""
+
+
+def iter_rows(final_calendar, locale=DEFAULT_LOCALE, year=EVERGREEN_YEAR):
+    """Yield one devotional_entries row per calendar entry."""
+    for entry in final_calendar:
+        yield {
+            "locale": locale,
+            "year": year,
+            "day": entry["id"],
+            "text": entry["text"],
+            "tags": entry["tags"],
+            "source": entry["source"],
+        }
+
+
+def iter_jsonl(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def _open(path, mode):
+    if path == "-":
+        stream = sys.stdout.buffer if "w" in mode else sys.stdin.buffer
+        return io.TextIOWrapper(stream, encoding="utf-8", write_through=True)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_jsonl(rows, path):
+    """Stream `rows` to `path` as JSON Lines; returns the number written."""
+    count = 0
+    with _open(path, "w") as f:
+        for line in iter_jsonl(rows):
+            f.write(line)
+            count += 1
+    return count
+
+
+def read_jsonl(path):
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_rows(rows, dsn, batch_size=DEFAULT_BATCH_SIZE):
+    """Upsert `rows` into devotional_entries, one transaction per batch."""
+    try:
+        import psycopg2
+        from psycopg2.extras import execute_values
+    except ImportError as exc:
+        raise RuntimeError("Loading into Postgres requires psycopg2 (pip install psycopg2-binary)") from exc
+
+    total = 0
+    connection = psycopg2.connect(dsn)
+    try:
+        with connection.cursor() as cursor:
+            for batch in batched(rows, batch_size):
+                # ON CONFLICT DO UPDATE cannot touch one row twice in a statement,
+                # so keep only the last row per (locale, year, day) in the batch
+                latest = {(row["locale"], row["year"], row["day"]): row for row in batch}
+                values = [(row["locale"], row["year"], row["day"], row["text"], row["tags"], row["source"])
+                          for row in latest.values()]
+                execute_values(cursor, UPSERT_SQL, values, page_size=batch_size)
+                connection.commit()
+                total += len(values)
+    finally:
+        connection.close()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream the devotional calendar as JSON Lines")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="Build the calendar and write JSON Lines")
+    export.add_argument("path", help="Output path (.gz to compress, - for stdout)")
+    export.add_argument("--locale", default=DEFAULT_LOCALE)
+    export.add_argument("--year", type=int, default=None)
+
+    load = subparsers.add_parser("load", help="Upsert JSON Lines into devotional_entries")
+    load.add_argument("path", help="Input path (.gz supported, - for stdin)")
+    load.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    load.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        import calendar_build
+        final_calendar = calendar_build.build_calendar(output_path=False, year=args.year)
+        year = EVERGREEN_YEAR if args.year is None else args.year
+        count = write_jsonl(iter_rows(final_calendar, args.locale, year), args.path)
+        print(f"✅ Exported {count} entries to {args.path}", file=sys.stderr)
+        return
+
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+    count = load_rows(read_jsonl(args.path), args.dsn, args.batch_size)
+    print(f"✅ Upserted {count} entries into devotional_entries", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# Near-duplicate detection for calendar entries.
+#
+# The batch builders (script_4, script_5, script_6, ...) re-add verses such as
+# Yasna 30.9 and 34.4 in a different translation. Comparing every pair of
+# texts is O(n^2) and will not survive full translations, so this pass uses
+# MinHash signatures and LSH banding: only entries that share at least one
+# band bucket are compared.
+#
+# The rewordings are paraphrases, not typos, so character shingles never
+# matched them. Shingles are the distinct words of the normalised text,
+# minus the words that occur in more than COMMON_WORD_SHARE of all entries
+# ("mazda", "truth", "good", "thinking", ...): those are shared by almost every
+# Gathic line and say nothing about whether two lines are the same one.
+# Two entries are textual near-duplicates when their word Jaccard reaches
+# the threshold, or the lower SAME_REFERENCE_THRESHOLD when both cite the
+# same verse.
+#
+# The report also groups entries citing the same verse reference, e.g.
+# "(Yasna 46.1)", even when the translations share too few words to be
+# textual near-duplicates. Those are often different lines of the same verse,
+# so the build only collapses textual near-duplicates
+# (`python calendar_build.py --collapse-duplicates`).
+#
+# Usage:
+#   python dedupe.py                 # report clusters in the built entries
+#   python dedupe.py --threshold 0.6
+#   python dedupe.py --check         # exit 1 if a known rewording is missed
+
+import argparse
+import hashlib
+import re
+import sys
+import zlib
+
+NUM_PERMUTATIONS = 64
+BANDS = 32
+DEFAULT_THRESHOLD = 0.5
+SAME_REFERENCE_THRESHOLD = 0.3
+COMMON_WORD_SHARE = 0.1
+
+# Verses the batch builders are known to re-add in different wording; --check
+# fails unless each one comes out as a textual near-duplicate cluster
+KNOWN_REWORDINGS = ["Yasna 30.9", "Yasna 34.4"]
+
+_VERSE_REF = re.compile(r"\((Yasna \d+\.\d+)[^()]*\)\s*$")
+_NON_WORD = re.compile(r"[^a-z0-9 ]+")
+_SPACES = re.compile(r"\s+")
+
+
+def _permutations(count):
+    # Fixed multiply-add pairs derived from a hash so signatures are reproducible;
+    # `a` is odd so (a * h + b) >> 32 spreads 32-bit shingle hashes well
+    params = []
+    for i in range(count):
+        digest = hashlib.sha256(f"minhash-{i}".encode("utf-8")).digest()
+        a = int.from_bytes(digest[:4], "little") | 1
+        b = int.from_bytes(digest[4:8], "little")
+        params.append((a, b))
+    return params
+
+
+_PERMUTATIONS = _permutations(NUM_PERMUTATIONS)
+
+
+def verse_reference(text):
+    match = _VERSE_REF.search(text)
+    return match.group(1) if match else None
+
+
+def normalize(text):
+    text = _VERSE_REF.sub("", text).lower()
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", text)).strip()
+
+
+def common_words(texts, share=COMMON_WORD_SHARE):
+    """Words that occur in more than `share` of `texts`."""
+    counts = {}
+    for text in texts:
+        for word in set(normalize(text).split()):
+            counts[word] = counts.get(word, 0) + 1
+    return frozenset(word for word, count in counts.items() if count > share * len(texts))
+
+
+def shingles(text, common=frozenset()):
+    words = set(normalize(text).split())
+    return (words - common) or words
+
+
+def minhash(shingle_set):
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingle_set] or [0]
+    return tuple(min([(a * h + b) >> 32 for h in hashes]) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def candidate_pairs(signatures, bands=BANDS):
+    """Index pairs that collide in at least one LSH band."""
+    rows = len(next(iter(signatures), ())) // bands
+    pairs = set()
+    for band in range(bands):
+        buckets = {}
+        for index, signature in enumerate(signatures):
+            key = signature[band * rows:(band + 1) * rows]
+            buckets.setdefault(key, []).append(index)
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    pairs.add((first, second))
+    return pairs
+
+
+class _DisjointSet:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def find_duplicate_clusters(entries, threshold=DEFAULT_THRESHOLD, by_reference=True,
+                            same_reference_threshold=SAME_REFERENCE_THRESHOLD):
+    """Group entries that are near-duplicate texts (or, with `by_reference`,
+    cite the same verse).
+
+    Returns a list of clusters, each a dict with the member indices (into
+    `entries`, ascending), the verse references cited by members and the best
+    text similarity found between members.
+    """
+    texts = [entry["text"] for entry in entries]
+    common = common_words(texts)
+    shingle_sets = [shingles(text, common) for text in texts]
+    references = [verse_reference(text) for text in texts]
+    groups = _DisjointSet(len(entries))
+    similarity = {}
+
+    # Entries citing the same verse are always compared, at the lower threshold
+    by_verse = {}
+    for index, reference in enumerate(references):
+        if reference is not None:
+            by_verse.setdefault(reference, []).append(index)
+    same_reference = {(first, second) for indices in by_verse.values()
+                      for n, first in enumerate(indices) for second in indices[n + 1:]}
+
+    # LSH only proposes candidates; confirm them with the exact word Jaccard
+    signatures = [minhash(shingle_set) for shingle_set in shingle_sets]
+    for i, j in candidate_pairs(signatures) | same_reference:
+        score = jaccard(shingle_sets[i], shingle_sets[j])
+        if score >= (same_reference_threshold if (i, j) in same_reference else threshold):
+            groups.union(i, j)
+            similarity[(i, j)] = score
+
+    if by_reference:
+        for indices in by_verse.values():
+            for index in indices[1:]:
+                groups.union(indices[0], index)
+
+    members = {}
+    for index in range(len(entries)):
+        members.setdefault(groups.find(index), []).append(index)
+
+    clusters = []
+    for indices in members.values():
+        if len(indices) < 2:
+            continue
+        member_set = set(indices)
+        scores = [score for (i, j), score in similarity.items() if i in member_set]
+        clusters.append({
+            "members": indices,
+            "verse_references": sorted({references[i] for i in indices} - {None}),
+            "max_similarity": max(scores, default=0.0),
+        })
+    clusters.sort(key=lambda cluster: cluster["members"][0])
+    return clusters
+
+
+def collapse_duplicates(entries, clusters):
+    """Keep the first member of each cluster, preserving entry order."""
+    dropped = {index for cluster in clusters for index in cluster["members"][1:]}
+    return [entry for index, entry in enumerate(entries) if index not in dropped]
+
+
+def main(argv=None):
+    import calendar_build
+
+    parser = argparse.ArgumentParser(description="Report near-duplicate calendar entries")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Minimum word Jaccard similarity of two entries")
+    parser.add_argument("--check", action="store_true",
+                        help="Fail unless every known rewording is found as a textual near-duplicate")
+    args = parser.parse_args(argv)
+
+    _, entries = calendar_build.build_entries()
+    all_entries = entries["authentic"] + entries["inspired"]
+    clusters = find_duplicate_clusters(all_entries, args.threshold)
+
+    for cluster in clusters:
+        references = ", ".join(cluster["verse_references"]) or "no verse reference"
+        print(f"\n{references} (max similarity {cluster['max_similarity']:.2f})")
+        for index in cluster["members"]:
+            print(f"  - {all_entries[index]['text'][:100]}")
+
+    textual = find_duplicate_clusters(all_entries, args.threshold, by_reference=False)
+    duplicates = sum(len(cluster["members"]) - 1 for cluster in textual)
+    print(f"\n{len(clusters)} clusters, {duplicates} textual near-duplicates would be collapsed")
+
+    if args.check:
+        found = {reference for cluster in textual for reference in cluster["verse_references"]}
+        missed = [reference for reference in KNOWN_REWORDINGS if reference not in found]
+        if missed:
+            print(f"Known rewordings not detected: {', '.join(missed)}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ All {len(KNOWN_REWORDINGS)} known rewordings detected")
+
+
+if __name__ == "__main__":
+    main()
@@ -122,8 +122,6 @@ authentic_entries = [
     }
 ]
 
-print(f"Created {len(authentic_entries)} authentic Gathic entries so far...")
-
 # Now I'll create original Gathic-inspired entries following the style guidelines
 gathic_inspired_entries = [
     {
@@ -152,6 +150,3 @@ gathic_inspired_entries = [
         "source": "gathic-inspired"
     }
 ]
-
-print(f"Created {len(gathic_inspired_entries)} initial Gathic-inspired entries...")
-print("Now building the complete 365-entry calendar...")
\ No newline at end of file
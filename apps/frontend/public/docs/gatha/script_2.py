@@ -66,8 +66,6 @@ more_authentic = [
     }
 ]
 
-authentic_entries.extend(more_authentic)
-
 # Now let me create a systematic approach to generate the remaining entries
 def create_gathic_inspired_batch(themes, count=20):
     """Create a batch of Gathic-inspired entries based on themes"""
@@ -147,11 +145,3 @@ def create_gathic_inspired_batch(themes, count=20):
                 })
     
     return entries
-
-# Generate a large batch of inspired entries
-inspired_batch1 = create_gathic_inspired_batch([], 30)
-gathic_inspired_entries.extend(inspired_batch1)
-
-print(f"Total authentic entries: {len(authentic_entries)}")
-print(f"Total inspired entries so far: {len(gathic_inspired_entries)}")
-print("Continuing to build to reach 365 total...")
\ No newline at end of file
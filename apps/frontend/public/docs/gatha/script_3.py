@@ -79,8 +79,6 @@ additional_authentic = [
     }
 ]
 
-authentic_entries.extend(additional_authentic)
-
 # Now create many more Gathic-inspired entries organized by themes
 def generate_inspired_entries_by_theme():
     entries = []
@@ -173,14 +171,3 @@ def generate_inspired_entries_by_theme():
             })
     
     return entries
-
-# Generate the theme-based entries
-new_inspired = generate_inspired_entries_by_theme()
-gathic_inspired_entries.extend(new_inspired)
-
-print(f"Updated totals:")
-print(f"Authentic entries: {len(authentic_entries)}")
-print(f"Inspired entries: {len(gathic_inspired_entries)}")
-print(f"Total entries so far: {len(authentic_entries) + len(gathic_inspired_entries)}")
-
-# I need to continue building to reach 365...
\ No newline at end of file
@@ -88,10 +88,6 @@ def create_more_authentic_entries():
     
     return more_authentic
 
-# Add more authentic entries
-additional_authentic_batch = create_more_authentic_entries()
-authentic_entries.extend(additional_authentic_batch)
-
 # Now create many more inspired entries covering more themes
 def create_large_inspired_batch():
     entries = []
@@ -184,13 +180,3 @@ def create_large_inspired_batch():
             })
     
     return entries
-
-# Generate the large batch of inspired entries
-large_inspired_batch = create_large_inspired_batch()
-gathic_inspired_entries.extend(large_inspired_batch)
-
-print(f"Current totals:")
-print(f"Authentic entries: {len(authentic_entries)}")
-print(f"Inspired entries: {len(gathic_inspired_entries)}")
-print(f"Total entries: {len(authentic_entries) + len(gathic_inspired_entries)}")
-print(f"Still need: {365 - (len(authentic_entries) + len(gathic_inspired_entries))} more entries")
\ No newline at end of file
@@ -142,10 +142,6 @@ def create_another_authentic_batch():
     
     return more_verses
 
-# Add another batch of authentic entries
-another_authentic_batch = create_another_authentic_batch()
-authentic_entries.extend(another_authentic_batch)
-
 # Now create a very large batch of inspired entries to get closer to our target
 def create_massive_inspired_batch():
     entries = []
@@ -253,13 +249,3 @@ def create_massive_inspired_batch():
             })
     
     return entries
-
-# Generate the massive inspired batch
-massive_inspired_batch = create_massive_inspired_batch()
-gathic_inspired_entries.extend(massive_inspired_batch)
-
-print(f"Updated totals:")
-print(f"Authentic entries: {len(authentic_entries)}")
-print(f"Inspired entries: {len(gathic_inspired_entries)}")
-print(f"Total entries: {len(authentic_entries) + len(gathic_inspired_entries)}")
-print(f"Still need: {365 - (len(authentic_entries) + len(gathic_inspired_entries))} more entries")
\ No newline at end of file
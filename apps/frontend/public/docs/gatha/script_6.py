@@ -89,10 +89,6 @@ def create_final_authentic_batch():
     
     return final_authentic
 
-# Add the final authentic batch
-final_authentic_batch = create_final_authentic_batch()
-authentic_entries.extend(final_authentic_batch)
-
 # Create the final batch of inspired entries to reach exactly 365
 def create_final_inspired_batch():
     entries = []
@@ -191,22 +187,3 @@ def create_final_inspired_batch():
         })
     
     return tagged_entries
-
-# Add the final inspired batch
-final_inspired_batch = create_final_inspired_batch()
-gathic_inspired_entries.extend(final_inspired_batch)
-
-print(f"Final totals:")
-print(f"Authentic entries: {len(authentic_entries)}")
-print(f"Inspired entries: {len(gathic_inspired_entries)}")
-print(f"Total entries: {len(authentic_entries) + len(gathic_inspired_entries)}")
-
-# Check if we need any more entries to reach exactly 365
-total_entries = len(authentic_entries) + len(gathic_inspired_entries)
-if total_entries < 365:
-    remaining_needed = 365 - total_entries
-    print(f"Still need: {remaining_needed} more entries")
-else:
-    print(f"Perfect! We have {total_entries} entries total.")
-    
-print(f"Ratio: {len(authentic_entries)/total_entries*100:.1f}% authentic, {len(gathic_inspired_entries)/total_entries*100:.1f}% inspired")
\ No newline at end of file
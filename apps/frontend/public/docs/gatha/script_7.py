@@ -1,9 +1,6 @@
 # I need exactly 32 more entries to reach 365
 # Let me add the final entries to complete the set
 
-# Create the very final batch to reach exactly 365
-final_completion_entries = []
-
 # Add a few more authentic entries
 more_authentic_final = [
     {
@@ -38,10 +35,7 @@ more_authentic_final = [
     }
 ]
 
-authentic_entries.extend(more_authentic_final)
-
 # Add the remaining inspired entries to reach exactly 365
-remaining_needed = 365 - (len(authentic_entries) + len(gathic_inspired_entries))
 more_inspired_final = [
     "The sun rises not because you need it but because it is the nature of the sun to shine—be like the sun.",
     "Every act of love is a victory over the forces that diminish life—love boldly, love widely, love deeply.",
@@ -101,21 +95,12 @@ inspired_tags_final = [
     ["wisdom", "action", "enlightenment"]
 ]
 
-for i, text in enumerate(more_inspired_final):
-    gathic_inspired_entries.append({
-        "text": text,
-        "tags": inspired_tags_final[i],
-        "source": "gathic-inspired"
-    })
-
-print(f"Final check - Total entries:")
-print(f"Authentic entries: {len(authentic_entries)}")
-print(f"Inspired entries: {len(gathic_inspired_entries)}")
-total_final = len(authentic_entries) + len(gathic_inspired_entries)
-print(f"Grand total: {total_final}")
-print(f"Final ratio: {len(authentic_entries)/total_final*100:.1f}% authentic, {len(gathic_inspired_entries)/total_final*100:.1f}% inspired")
-
-if total_final == 365:
-    print("✅ Perfect! We have exactly 365 entries for the full year calendar.")
-else:
-    print(f"⚠️  Need to adjust - we have {total_final} entries, need exactly 365")
\ No newline at end of file
+def create_completion_inspired_batch():
+    entries = []
+    for i, text in enumerate(more_inspired_final):
+        entries.append({
+            "text": text,
+            "tags": inspired_tags_final[i],
+            "source": "gathic-inspired"
+        })
+    return entries
@@ -1,57 +1,155 @@
-# Now I need to combine all entries, shuffle them, and create the final JSON dataset
-import random
-
-# Combine all entries
-all_entries = authentic_entries + gathic_inspired_entries
-
-print(f"Total entries to process: {len(all_entries)}")
-
-# Shuffle the entries to distribute authentic and inspired throughout the year
-# rather than clustering them together
-random.seed(42)  # For reproducible shuffling
-random.shuffle(all_entries)
-
-# Add sequential IDs from 1 to 365
-final_calendar = []
-for i, entry in enumerate(all_entries, 1):
-    calendar_entry = {
-        "id": i,
-        "text": entry["text"],
-        "tags": entry["tags"],
-        "source": entry["source"]
+# Now I need to combine all entries, schedule them onto days, and create the final JSON dataset
+#
+# Instead of random.shuffle (which lets "fire" or "justice" entries land on
+# consecutive days), entries are placed greedily, one day at a time:
+#
+# - every tag has a "due day": the day it was last used plus the days left in
+#   the year divided by its remaining occurrences, so the leftover uses of a
+#   tag stay evenly spread instead of piling up in December;
+# - an entry's priority is the latest due day among its tags (then the sum of
+#   them), so picking the lowest priority maximises the smallest gap between
+#   entries sharing a tag;
+# - each month gets a fixed yasna / gathic-inspired quota and days inside the
+#   month alternate sources by largest deficit, keeping the ratio steady.
+#
+# Priorities only ever grow, so each source keeps a lazy heap: a popped entry
+# whose stored priority is stale is pushed back with its current one.
+import calendar
+import hashlib
+import heapq
+
+# Non-leap reference year for month lengths when no year is given
+REFERENCE_YEAR = 2001
+
+
+def month_lengths(year=None):
+    year = REFERENCE_YEAR if year is None else year
+    return [calendar.monthrange(year, month)[1] for month in range(1, 13)]
+
+
+def _largest_remainder(shares, total):
+    # Split `total` into integers proportional to `shares`
+    weight = sum(shares.values())
+    exact = {key: share * total / weight for key, share in shares.items()}
+    result = {key: int(value) for key, value in exact.items()}
+    leftover = total - sum(result.values())
+    for key in sorted(exact, key=lambda k: (result[k] - exact[k], k))[:leftover]:
+        result[key] += 1
+    return result
+
+
+def monthly_source_quotas(source_counts, lengths):
+    # Cumulative quotas per month, so rounding never drifts over the year
+    quotas = []
+    previous = {source: 0 for source in source_counts}
+    elapsed = 0
+    for length in lengths:
+        elapsed += length
+        cumulative = _largest_remainder(source_counts, elapsed)
+        quotas.append({source: max(0, cumulative[source] - previous[source]) for source in source_counts})
+        previous = cumulative
+    return quotas
+
+
+def _tie_break(entry, salt=""):
+    # Stable across runs and independent of batch order; the year salt gives
+    # each year of a multi-year run its own (still deterministic) sequence
+    return hashlib.sha1((salt + entry["text"]).encode("utf-8")).hexdigest()
+
+
+def order_entries(all_entries, year=None):
+    lengths = month_lengths(year)
+    days = sum(lengths)
+
+    occurrences = {}
+    source_counts = {}
+    for entry in all_entries:
+        source_counts[entry["source"]] = source_counts.get(entry["source"], 0) + 1
+        for tag in entry["tags"]:
+            occurrences[tag] = occurrences.get(tag, 0) + 1
+    remaining = dict(occurrences)
+    due = {tag: 0.0 for tag in occurrences}
+
+    def priority(index):
+        dues = [due[tag] for tag in all_entries[index]["tags"]]
+        return (max(dues, default=0.0), sum(dues))
+
+    by_source = {source: [] for source in source_counts}
+    for index, entry in enumerate(all_entries):
+        by_source[entry["source"]].append((_tie_break(entry, "" if year is None else str(year)), index))
+    heaps = {source: [] for source in source_counts}
+
+    def refill(source):
+        # Leap days (more days than entries) start a second pass over the source
+        heaps[source] = [(priority(index), key, index) for key, index in by_source[source]]
+        heapq.heapify(heaps[source])
+
+    def take(source):
+        if not heaps[source]:
+            refill(source)
+        heap = heaps[source]
+        while True:
+            stored, key, index = heapq.heappop(heap)
+            current = priority(index)
+            if current <= stored:
+                return index
+            heapq.heappush(heap, (current, key, index))
+
+    ordered = []
+    quotas = monthly_source_quotas(source_counts, lengths)
+    for length, quota in zip(lengths, quotas):
+        placed = {source: 0 for source in quota}
+        for day_in_month in range(1, length + 1):
+            source = max(
+                (s for s in sorted(quota) if placed[s] < quota[s]),
+                key=lambda s: quota[s] * day_in_month / length - placed[s],
+            )
+            placed[source] += 1
+            index = take(source)
+            entry = all_entries[index]
+            day = len(ordered) + 1
+            for tag in entry["tags"]:
+                remaining[tag] = max(remaining[tag] - 1, 1)
+                due[tag] = day + (days - day) / remaining[tag]
+            ordered.append(entry)
+
+    return ordered
+
+
+def number_entries(ordered_entries):
+    # Add sequential IDs from 1 to 365 (366 in leap years)
+    final_calendar = []
+    for i, entry in enumerate(ordered_entries, 1):
+        calendar_entry = {
+            "id": i,
+            "text": entry["text"],
+            "tags": entry["tags"],
+            "source": entry["source"]
+        }
+        final_calendar.append(calendar_entry)
+    return final_calendar
+
+
+def calendar_statistics(final_calendar):
+    # Quick statistics, counted once over the finished calendar
+    total = len(final_calendar)
+    authentic_count = sum(1 for entry in final_calendar if entry["source"] == "yasna")
+    inspired_count = sum(1 for entry in final_calendar if entry["source"] == "gathic-inspired")
+    return {
+        "total": total,
+        "authentic": authentic_count,
+        "inspired": inspired_count,
     }
-    final_calendar.append(calendar_entry)
-
-# Verify we have exactly 365 entries
-print(f"Final calendar entries: {len(final_calendar)}")
-
-# Quick statistics
-authentic_count = sum(1 for entry in final_calendar if entry["source"] == "yasna")
-inspired_count = sum(1 for entry in final_calendar if entry["source"] == "gathic-inspired")
-
-print(f"Final statistics:")
-print(f"- Authentic (yasna): {authentic_count} entries ({authentic_count/365*100:.1f}%)")
-print(f"- Inspired (gathic-inspired): {inspired_count} entries ({inspired_count/365*100:.1f}%)")
-
-# Sample a few entries to verify formatting
-print(f"\nSample entries:")
-for i in [0, 100, 200, 300, 364]:  # Sample from different parts of the year
-    entry = final_calendar[i]
-    print(f"Day {entry['id']}: {entry['text'][:80]}...")
-    print(f"  Source: {entry['source']}, Tags: {entry['tags'][:3]}...")
-
-# Convert to JSON format
-calendar_json = json.dumps(final_calendar, indent=2, ensure_ascii=False)
-
-print(f"\n✅ Successfully created complete 365-day Gathic devotional calendar!")
-print(f"📊 Total size: {len(calendar_json)} characters")
-print(f"📅 Ready for integration into the Zoroasterverse website")
-
-# Display first few entries as preview
-print(f"\nFirst 3 entries preview:")
-for entry in final_calendar[:3]:
-    print(f"Entry {entry['id']}:")
-    print(f"  Text: {entry['text']}")
-    print(f"  Tags: {entry['tags']}")
-    print(f"  Source: {entry['source']}")
-    print()
\ No newline at end of file
+
+
+def minimum_tag_gaps(final_calendar):
+    # Smallest number of days between two entries sharing each tag
+    last_day = {}
+    gaps = {}
+    for entry in final_calendar:
+        for tag in entry["tags"]:
+            if tag in last_day:
+                gap = entry["id"] - last_day[tag]
+                gaps[tag] = min(gaps.get(tag, gap), gap)
+            last_day[tag] = entry["id"]
+    return gaps
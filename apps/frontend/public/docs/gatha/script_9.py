@@ -1,11 +1,17 @@
 # Save the complete calendar to a JSON file
-with open("365_day_gathic_devotional_calendar.json", "w", encoding="utf-8") as f:
-    json.dump(final_calendar, f, indent=2, ensure_ascii=False)
+import json
+
+CALENDAR_FILENAME = "365_day_gathic_devotional_calendar.json"
+
+
+def write_calendar(final_calendar, path=CALENDAR_FILENAME):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(final_calendar, f, indent=2, ensure_ascii=False)
+    return path
 
-print("✅ Saved complete 365-day Gathic devotional calendar to: 365_day_gathic_devotional_calendar.json")
 
 # Create a summary report
-summary_report = f"""
+SUMMARY_REPORT = """
 # 365-Day Gathic Devotional Calendar - COMPLETE
 
 ## Overview
@@ -36,7 +42,7 @@ Successfully created a complete 365-day devotional calendar for the Zoroasterver
 
 ## Technical Specifications
 - **Format**: JSON with id, text, tags, source fields
-- **Distribution**: Random mixing rather than clustering by type
+- **Distribution**: Tag-balanced day scheduling with a steady yasna ratio per month
 - **Length**: Each entry 25-150 words, poetic and contemplative
 - **Tags**: Comprehensive taxonomy for filtering and organization
 - **Sources**: All authentic content from verified public domain translations
@@ -47,20 +53,3 @@ Perfect for integration into web applications, mobile apps, daily notification s
 ## File Output
 Complete dataset saved as: 365_day_gathic_devotional_calendar.json
 """
-
-print(summary_report)
-
-# Let's also check a few more sample entries from different parts of the year
-print("\n📅 Sample entries from different times of year:")
-sample_days = [50, 150, 250, 350]
-for day in sample_days:
-    entry = final_calendar[day-1]  # Convert to 0-based index
-    print(f"\nDay {day}:")
-    print(f"Text: {entry['text']}")
-    print(f"Source: {entry['source']}")
-    print(f"Tags: {', '.join(entry['tags'])}")
-
-print(f"\n🎉 COMPLETE: All 365 entries for your Gathic devotional calendar have been created!")
-print(f"📁 File ready for download: 365_day_gathic_devotional_calendar.json")
-print(f"📖 This represents a comprehensive year-long journey through Zarathustra's teachings")
-print(f"🔥 May these daily reflections kindle the sacred fire in every reader's heart!")
\ No newline at end of file
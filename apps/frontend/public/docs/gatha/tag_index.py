@@ -0,0 +1,88 @@
+# Inverted tag index for the devotional calendar.
+#
+# Maps every tag to the sorted list of entry ids carrying it, so tag filters
+# ("entries tagged asha") and intersections ("fire AND conscience") touch only
+# the posting lists involved instead of scanning all 365 entries.
+#
+# Written next to the calendar as 365_day_gathic_devotional_calendar.tags.json:
+#
+#   {
+#     "entry_count": 365,
+#     "tags": {"asha": [3, 17, ...], "vohu-manah": [...], ...}
+#   }
+#
+# Tags are listed in `tags_list` order first; tags that appear in entries but
+# not in the taxonomy are appended alphabetically so nothing is dropped.
+
+import json
+
+TAG_INDEX_FILENAME = "365_day_gathic_devotional_calendar.tags.json"
+
+
+def build_tag_index(final_calendar, tags_list):
+    postings = {tag: [] for tag in tags_list}
+    extra = {}
+    for entry in final_calendar:
+        for tag in entry["tags"]:
+            ids = postings.get(tag)
+            if ids is None:
+                ids = extra.setdefault(tag, [])
+            ids.append(entry["id"])
+
+    for tag in sorted(extra):
+        postings[tag] = extra[tag]
+    for ids in postings.values():
+        ids.sort()
+
+    return {"entry_count": len(final_calendar), "tags": postings}
+
+
+def write_tag_index(tag_index, path=TAG_INDEX_FILENAME):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tag_index, f, ensure_ascii=False, separators=(",", ":"))
+    return path
+
+
+def load_tag_index(path=TAG_INDEX_FILENAME):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def entries_tagged(tag_index, tag):
+    return tag_index["tags"].get(tag, [])
+
+
+def entries_tagged_all(tag_index, tags):
+    """Ids carrying every tag in `tags` (AND), intersecting shortest lists first."""
+    postings = sorted((entries_tagged(tag_index, tag) for tag in tags), key=len)
+    if not postings:
+        return []
+    result = postings[0]
+    for ids in postings[1:]:
+        result = _intersect_sorted(result, ids)
+        if not result:
+            break
+    return result
+
+
+def entries_tagged_any(tag_index, tags):
+    """Ids carrying at least one tag in `tags` (OR), in ascending order."""
+    merged = set()
+    for tag in tags:
+        merged.update(entries_tagged(tag_index, tag))
+    return sorted(merged)
+
+
+def _intersect_sorted(a, b):
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return result
@@ -1,578 +0,0 @@
-# Create the HTML template and CSS styling for the application
-
-html_template = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Zoroasterverse Beta Reader Application</title>
-    <link rel="stylesheet" href="beta_reader_styles.css">
-</head>
-<body>
-    <div class="application-container">
-        <header class="app-header">
-            <h1>Zoroasterverse Beta Reader Program</h1>
-            <p class="subtitle">Join our exclusive beta reading community</p>
-        </header>
-        
-        <main id="form-container" class="form-container">
-            <!-- Dynamic content will be inserted here -->
-        </main>
-        
-        <footer class="app-footer">
-            <p>&copy; 2025 Sina Panahi. All rights reserved.</p>
-        </footer>
-    </div>
-    
-    <script src="beta_reader_app.js"></script>
-</body>
-</html>
-'''
-
-css_styles = '''
-/* Zoroasterverse Beta Reader Application Styles */
-
-* {
-    margin: 0;
-    padding: 0;
-    box-sizing: border-box;
-}
-
-body {
-    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    line-height: 1.6;
-    color: #333;
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    min-height: 100vh;
-}
-
-.application-container {
-    max-width: 800px;
-    margin: 0 auto;
-    padding: 20px;
-    min-height: 100vh;
-    display: flex;
-    flex-direction: column;
-}
-
-/* Header Styles */
-.app-header {
-    text-align: center;
-    background: rgba(255, 255, 255, 0.95);
-    padding: 30px;
-    border-radius: 15px 15px 0 0;
-    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-}
-
-.app-header h1 {
-    font-size: 2.5em;
-    color: #2c3e50;
-    margin-bottom: 10px;
-    font-weight: 700;
-}
-
-.subtitle {
-    font-size: 1.2em;
-    color: #7f8c8d;
-    font-weight: 300;
-}
-
-/* Main Form Container */
-.form-container {
-    flex: 1;
-    background: rgba(255, 255, 255, 0.98);
-    padding: 40px;
-    border-radius: 0 0 15px 15px;
-    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-}
-
-/* Stage Header */
-.stage-header {
-    text-align: center;
-    margin-bottom: 30px;
-    border-bottom: 2px solid #e9ecef;
-    padding-bottom: 20px;
-}
-
-.stage-header h2 {
-    font-size: 2em;
-    color: #2c3e50;
-    margin-bottom: 10px;
-}
-
-.stage-description {
-    font-size: 1.1em;
-    color: #6c757d;
-    font-style: italic;
-}
-
-/* Progress Bar */
-.progress-container {
-    margin-bottom: 30px;
-}
-
-.progress-bar {
-    width: 100%;
-    height: 8px;
-    background-color: #e9ecef;
-    border-radius: 4px;
-    overflow: hidden;
-    margin-bottom: 10px;
-}
-
-.progress-fill {
-    height: 100%;
-    background: linear-gradient(90deg, #4CAF50, #45a049);
-    transition: width 0.5s ease;
-}
-
-.progress-text {
-    display: block;
-    text-align: center;
-    color: #6c757d;
-    font-weight: 500;
-}
-
-/* Question Styles */
-.question-container {
-    margin-bottom: 35px;
-    padding: 25px;
-    background: #f8f9fa;
-    border-radius: 10px;
-    border-left: 4px solid #667eea;
-}
-
-.question-title {
-    font-size: 1.3em;
-    color: #2c3e50;
-    margin-bottom: 20px;
-    font-weight: 600;
-}
-
-/* Multiple Choice Options */
-.radio-group, .checkbox-group {
-    display: flex;
-    flex-direction: column;
-    gap: 12px;
-}
-
-.radio-option, .checkbox-option {
-    display: flex;
-    align-items: center;
-    padding: 15px;
-    background: white;
-    border: 2px solid #e9ecef;
-    border-radius: 8px;
-    cursor: pointer;
-    transition: all 0.3s ease;
-    position: relative;
-}
-
-.radio-option:hover, .checkbox-option:hover {
-    border-color: #667eea;
-    background-color: #f8f9ff;
-    transform: translateY(-1px);
-}
-
-.radio-option input, .checkbox-option input {
-    display: none;
-}
-
-.radio-custom, .checkbox-custom {
-    width: 20px;
-    height: 20px;
-    border: 2px solid #ddd;
-    border-radius: 50%;
-    margin-right: 15px;
-    position: relative;
-    transition: all 0.3s ease;
-}
-
-.checkbox-custom {
-    border-radius: 4px;
-}
-
-.radio-option input:checked + .radio-custom {
-    border-color: #667eea;
-    background-color: #667eea;
-}
-
-.radio-option input:checked + .radio-custom::after {
-    content: '';
-    position: absolute;
-    top: 50%;
-    left: 50%;
-    width: 8px;
-    height: 8px;
-    background: white;
-    border-radius: 50%;
-    transform: translate(-50%, -50%);
-}
-
-.checkbox-option input:checked + .checkbox-custom {
-    border-color: #667eea;
-    background-color: #667eea;
-}
-
-.checkbox-option input:checked + .checkbox-custom::after {
-    content: '✓';
-    position: absolute;
-    top: 50%;
-    left: 50%;
-    color: white;
-    font-weight: bold;
-    font-size: 14px;
-    transform: translate(-50%, -50%);
-}
-
-.option-text {
-    font-weight: 500;
-    color: #2c3e50;
-}
-
-.selection-counter {
-    margin-top: 10px;
-    font-size: 0.9em;
-    color: #6c757d;
-}
-
-/* Textarea Styles */
-.sample-text {
-    margin-bottom: 20px;
-    padding: 20px;
-    background: #e8f4fd;
-    border-radius: 8px;
-    border-left: 4px solid #3498db;
-}
-
-.sample-text h4 {
-    color: #2c3e50;
-    margin-bottom: 10px;
-}
-
-.excerpt {
-    font-style: italic;
-    font-size: 1.1em;
-    line-height: 1.8;
-    color: #34495e;
-}
-
-.textarea-container {
-    position: relative;
-}
-
-textarea {
-    width: 100%;
-    min-height: 150px;
-    padding: 15px;
-    border: 2px solid #e9ecef;
-    border-radius: 8px;
-    font-family: inherit;
-    font-size: 1em;
-    line-height: 1.6;
-    resize: vertical;
-    transition: border-color 0.3s ease;
-}
-
-textarea:focus {
-    outline: none;
-    border-color: #667eea;
-    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-}
-
-.word-count {
-    text-align: right;
-    margin-top: 8px;
-    font-size: 0.9em;
-    color: #6c757d;
-}
-
-/* Slider Styles */
-.slider-container {
-    padding: 20px 0;
-}
-
-.slider {
-    width: 100%;
-    height: 8px;
-    border-radius: 4px;
-    background: #e9ecef;
-    outline: none;
-    -webkit-appearance: none;
-    margin-bottom: 15px;
-}
-
-.slider::-webkit-slider-thumb {
-    -webkit-appearance: none;
-    appearance: none;
-    width: 24px;
-    height: 24px;
-    border-radius: 50%;
-    background: #667eea;
-    cursor: pointer;
-    box-shadow: 0 2px 10px rgba(0, 0, 0, 0.2);
-    transition: all 0.3s ease;
-}
-
-.slider::-webkit-slider-thumb:hover {
-    transform: scale(1.2);
-    background: #5a6fd8;
-}
-
-.slider::-moz-range-thumb {
-    width: 24px;
-    height: 24px;
-    border-radius: 50%;
-    background: #667eea;
-    cursor: pointer;
-    border: none;
-    box-shadow: 0 2px 10px rgba(0, 0, 0, 0.2);
-}
-
-.slider-labels {
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    font-weight: 500;
-}
-
-.slider-labels span:nth-child(2) {
-    background: #667eea;
-    color: white;
-    padding: 5px 15px;
-    border-radius: 20px;
-    font-weight: bold;
-}
-
-/* Form Actions */
-.form-actions {
-    display: flex;
-    justify-content: space-between;
-    margin-top: 40px;
-    padding-top: 25px;
-    border-top: 2px solid #e9ecef;
-}
-
-/* Buttons */
-.btn-primary, .btn-secondary {
-    padding: 15px 30px;
-    font-size: 1.1em;
-    font-weight: 600;
-    border: none;
-    border-radius: 8px;
-    cursor: pointer;
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-    transition: all 0.3s ease;
-    text-decoration: none;
-    display: inline-block;
-}
-
-.btn-primary {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-}
-
-.btn-primary:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-}
-
-.btn-secondary {
-    background: #6c757d;
-    color: white;
-}
-
-.btn-secondary:hover {
-    background: #5a6268;
-    transform: translateY(-2px);
-}
-
-/* Results Styles */
-.results-container, .disqualification-container {
-    text-align: center;
-    padding: 40px;
-}
-
-.score-display {
-    background: #f8f9fa;
-    padding: 30px;
-    border-radius: 10px;
-    margin: 30px 0;
-    border-left: 4px solid #28a745;
-}
-
-.score-display h3 {
-    font-size: 2em;
-    color: #28a745;
-    margin-bottom: 20px;
-}
-
-.score-breakdown {
-    display: flex;
-    justify-content: space-around;
-    flex-wrap: wrap;
-    gap: 15px;
-}
-
-.score-breakdown div {
-    padding: 10px 20px;
-    background: white;
-    border-radius: 8px;
-    border: 1px solid #dee2e6;
-    font-weight: 500;
-}
-
-.result-message {
-    padding: 30px;
-    border-radius: 10px;
-    margin: 30px 0;
-}
-
-.result-message.auto_accept {
-    background: #d4edda;
-    border-left: 4px solid #28a745;
-}
-
-.result-message.strong_candidate {
-    background: #d1ecf1;
-    border-left: 4px solid #17a2b8;
-}
-
-.result-message.interview_required {
-    background: #fff3cd;
-    border-left: 4px solid #ffc107;
-}
-
-.result-message.auto_reject {
-    background: #f8d7da;
-    border-left: 4px solid #dc3545;
-}
-
-.result-message h3 {
-    margin-bottom: 15px;
-    font-size: 1.5em;
-}
-
-/* Error Messages */
-.error-message {
-    color: #dc3545;
-    font-size: 0.9em;
-    margin-top: 8px;
-    padding: 8px 12px;
-    background: #f8d7da;
-    border-radius: 4px;
-    border-left: 3px solid #dc3545;
-}
-
-/* Footer */
-.app-footer {
-    text-align: center;
-    padding: 20px;
-    color: rgba(255, 255, 255, 0.8);
-    margin-top: 20px;
-}
-
-/* Responsive Design */
-@media (max-width: 768px) {
-    .application-container {
-        padding: 10px;
-    }
-    
-    .app-header, .form-container {
-        padding: 20px;
-    }
-    
-    .app-header h1 {
-        font-size: 2em;
-    }
-    
-    .form-actions {
-        flex-direction: column;
-        gap: 15px;
-    }
-    
-    .score-breakdown {
-        flex-direction: column;
-    }
-    
-    .radio-option, .checkbox-option {
-        padding: 12px;
-    }
-}
-
-@media (max-width: 480px) {
-    .app-header h1 {
-        font-size: 1.8em;
-    }
-    
-    .question-title {
-        font-size: 1.1em;
-    }
-    
-    .btn-primary, .btn-secondary {
-        padding: 12px 25px;
-        font-size: 1em;
-    }
-}
-
-/* Loading States */
-.loading {
-    opacity: 0.6;
-    pointer-events: none;
-}
-
-/* Animations */
-@keyframes fadeIn {
-    from { opacity: 0; transform: translateY(20px); }
-    to { opacity: 1; transform: translateY(0); }
-}
-
-.question-container {
-    animation: fadeIn 0.5s ease;
-}
-
-/* Focus States for Accessibility */
-.radio-option:focus-within,
-.checkbox-option:focus-within,
-textarea:focus,
-.slider:focus {
-    outline: 2px solid #667eea;
-    outline-offset: 2px;
-}
-'''
-
-# Save the HTML template
-with open('index.html', 'w') as f:
-    f.write(html_template)
-
-# Save the CSS styles  
-with open('beta_reader_styles.css', 'w') as f:
-    f.write(css_styles)
-
-print("Complete Web Application Created")
-print("="*35)
-print("\nFiles generated:")
-print("1. index.html - Main application page")
-print("2. beta_reader_styles.css - Complete styling")
-print("3. beta_reader_app.js - JavaScript functionality")
-print("4. beta_reader_application_system.json - Configuration")
-print("\nFeatures implemented:")
-print("✓ Multi-stage progressive disclosure")
-print("✓ Real-time scoring algorithm")
-print("✓ Interactive form validation")
-print("✓ Responsive mobile design")
-print("✓ Accessibility features")
-print("✓ Professional UI/UX")
-print("✓ Word count tracking")
-print("✓ Conditional question logic")
-print("✓ Auto-disqualification system")
-print("✓ Detailed score breakdown")
-print("✓ Four-tier classification system")
-print("\nTo deploy:")
-print("1. Upload all files to your web server")
-print("2. Customize the configuration in JSON file")
-print("3. Adjust scoring criteria as needed")
-print("4. Test thoroughly before going live")
\ No newline at end of file
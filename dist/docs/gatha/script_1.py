@@ -1,157 +0,0 @@
-# Let me build a comprehensive set of authentic Gathic entries first
-# Based on public domain translations from Taraporewala, Mills, and others
-
-authentic_entries = [
-    # From Yasna 30 (Choice and Dualism)
-    {
-        "text": "Reflect with a clear mind—each person for themselves—before the Great Event of Choices. Awaken to this doctrine: there is no compromise between right and wrong. (Yasna 30.2)",
-        "tags": ["choice", "free-will", "asha", "responsibility", "wisdom"],
-        "source": "yasna"
-    },
-    {
-        "text": "Yes, there are two fundamental spirits, twins, renowned to be in conflict. In thought and word, in action, they are two: the good and the bad. Between these two, the beneficent have correctly chosen. (Yasna 30.3)",
-        "tags": ["choice", "good-thoughts", "good-words", "good-deeds", "spenta-mainyu"],
-        "source": "yasna"
-    },
-    {
-        "text": "When these two spirits came together in the beginning, they established life and not-life, and how at the end the worst existence shall be for the followers of falsehood, but the best mind for the truthful. (Yasna 30.4)",
-        "tags": ["asha", "vohu-manah", "choice", "responsibility"],
-        "source": "yasna"
-    },
-    {
-        "text": "The deceitful one chose to bring to realization the worst things. But the very beneficent spirit chose truth, and so shall those who satisfy the Wise Lord continuously with true actions. (Yasna 30.5)",
-        "tags": ["asha", "spenta-mainyu", "good-deeds", "choice"],
-        "source": "yasna"
-    },
-    
-    # From Yasna 28 (Service and Good Mind)
-    {
-        "text": "I who shall serve You with good thinking... may I thus bring solace to the soul of Earth. (Yasna 28.2)",
-        "tags": ["vohu-manah", "good-thoughts", "devotion", "action"],
-        "source": "yasna"
-    },
-    {
-        "text": "I shall serve You with good thinking, with truth and righteous action, so that You may grant me that which leads to the straight path. (Yasna 28.5)",
-        "tags": ["vohu-manah", "asha", "good-deeds", "devotion", "wisdom"],
-        "source": "yasna"
-    },
-    {
-        "text": "Grant me, O Mazda, through Your most beneficent spirit, through truth, the rewards of good thinking, through which I may bring joy to my supporters. (Yasna 28.11)",
-        "tags": ["spenta-mainyu", "asha", "vohu-manah", "good-thoughts", "devotion"],
-        "source": "yasna"
-    },
-    
-    # From Yasna 43 (Divine Illumination)
-    {
-        "text": "For a wise Lord I knew You to be, Mazda, when Good Mind came to me and asked: 'Who are you? To whom do you belong?' (Yasna 43.7)",
-        "tags": ["vohu-manah", "wisdom", "reflection", "enlightenment"],
-        "source": "yasna"
-    },
-    {
-        "text": "I beheld You clearly in my mind's eye as the first one at the birth of life, when You made actions have consequences—evil for the evil, good reward for the good. (Yasna 43.5)",
-        "tags": ["wisdom", "enlightenment", "responsibility", "justice", "reflection"],
-        "source": "yasna"
-    },
-    {
-        "text": "I realized You, Mazda, to be beneficent when I was encircled by Good Mind, when he taught me to proclaim: 'Let not men seek to please the followers of falsehood.' (Yasna 43.11)",
-        "tags": ["vohu-manah", "spenta-mainyu", "wisdom", "enlightenment", "asha"],
-        "source": "yasna"
-    },
-    
-    # From Yasna 31 (Fire and Truth)
-    {
-        "text": "Through Your fire, show me the rewards that come through truth for both parties—those who uphold righteousness and those who do not. (Yasna 31.3)",
-        "tags": ["fire", "asha", "justice", "responsibility", "conscience"],
-        "source": "yasna"
-    },
-    {
-        "text": "Through Your radiant fire, assign the destiny of the righteous and the unrighteous, O Mazda, that our teaching may spread among the living. (Yasna 31.19)",
-        "tags": ["fire", "asha", "justice", "enlightenment", "wisdom"],
-        "source": "yasna"
-    },
-    
-    # From Yasna 34 (Fire as Helper)
-    {
-        "text": "Your fire, strong through truth, is a visible help to Your supporter, but visible harm to Your enemy, O Ahura Mazda. (Yasna 34.4)",
-        "tags": ["fire", "asha", "conscience", "justice"],
-        "source": "yasna"
-    },
-    
-    # Ashem Vohu prayer
-    {
-        "text": "The true order of existence is good; the most-good existence it is; desire it! Wish it! Happiness, bliss, enlightenment it is for that existence which is the true order of existence. (Ashem Vohu)",
-        "tags": ["asha", "enlightenment", "wisdom", "hope"],
-        "source": "yasna"
-    },
-    
-    # More from various Yasnas
-    {
-        "text": "By Your beneficent spirit and by fire, O Mazda, show me truth and good thinking, through whose work one goes to Your abode. (Yasna 31.20)",
-        "tags": ["spenta-mainyu", "fire", "asha", "vohu-manah", "enlightenment"],
-        "source": "yasna"
-    },
-    {
-        "text": "The loving man who brings help to the truthful, whether kinsman or fellow-member of the community, is in good accord with truth. (Yasna 46.2)",
-        "tags": ["asha", "compassion", "friendship", "good-deeds", "action"],
-        "source": "yasna"
-    },
-    {
-        "text": "When shall I know that You have power over those who cause harm to me, O Mazda? Let fire accompanied by good thinking make this known to me through truth. (Yasna 48.7)",
-        "tags": ["fire", "vohu-manah", "asha", "wisdom", "justice"],
-        "source": "yasna"
-    },
-    {
-        "text": "Good thinking, good words, and good deeds—these three bring a person to paradise, the best existence, light, and all good things. (Traditional summary)",
-        "tags": ["good-thoughts", "good-words", "good-deeds", "enlightenment", "hope"],
-        "source": "yasna"
-    },
-    {
-        "text": "Whoever upholds truth most, whether man or woman, O Mazda Ahura, is most dear to You. (Yasna 46.11)",
-        "tags": ["asha", "devotion", "justice", "wisdom"],
-        "source": "yasna"
-    },
-    {
-        "text": "I approach You, O Mazda, with good thinking, so that You may grant me both the blessings of this existence and that of the spirit. (Yasna 28.4)",
-        "tags": ["vohu-manah", "devotion", "hope", "enlightenment"],
-        "source": "yasna"
-    },
-    {
-        "text": "I know You to be the first and the last, O Ahura Mazda—You are father of good thinking, creator of truth, judge of our actions. (Yasna 31.8)",
-        "tags": ["vohu-manah", "asha", "wisdom", "justice", "enlightenment"],
-        "source": "yasna"
-    }
-]
-
-print(f"Created {len(authentic_entries)} authentic Gathic entries so far...")
-
-# Now I'll create original Gathic-inspired entries following the style guidelines
-gathic_inspired_entries = [
-    {
-        "text": "Let the fire within you remember the spark of dawn—every choice a new horizon to the world's unfolding. Walk in watchfulness, and the light of Good Mind will not fail you.",
-        "tags": ["fire", "choice", "vohu-manah", "enlightenment", "daily-practice"],
-        "source": "gathic-inspired"
-    },
-    {
-        "text": "As rivers seek the sea, let your thoughts flow toward truth. In the silence of right action, wisdom speaks without words.",
-        "tags": ["asha", "vohu-manah", "good-deeds", "wisdom", "reflection"],
-        "source": "gathic-inspired"
-    },
-    {
-        "text": "The beneficent spirit breathes in every act of kindness. When you lift another's burden, you lighten the world.",
-        "tags": ["spenta-mainyu", "compassion", "good-deeds", "action", "friendship"],
-        "source": "gathic-inspired"
-    },
-    {
-        "text": "Morning brings the gift of choice renewed. Stand at the crossroads of thought and deed—which path serves the light?",
-        "tags": ["choice", "daily-practice", "good-thoughts", "good-deeds", "responsibility"],
-        "source": "gathic-inspired"
-    },
-    {
-        "text": "In the garden of the heart, plant seeds of truthful speech. Words watered with wisdom bloom into lasting peace.",
-        "tags": ["asha", "good-words", "wisdom", "reflection", "harmonization"],
-        "source": "gathic-inspired"
-    }
-]
-
-print(f"Created {len(gathic_inspired_entries)} initial Gathic-inspired entries...")
-print("Now building the complete 365-entry calendar...")
\ No newline at end of file
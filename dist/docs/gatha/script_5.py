@@ -1,265 +0,0 @@
-# I need 173 more entries. Let me continue building systematically.
-# Target final ratio: ~130 authentic (need 73 more), ~235 inspired (need 100 more)
-
-# Create more authentic entries from various Gathic sources
-def create_another_authentic_batch():
-    entries = []
-    
-    # More verses from the Gathas drawing from various public domain translations
-    more_verses = [
-        # From Yasna 29 (The Soul of the Earth)
-        {
-            "text": "The soul of the earth cries out: For whom did You fashion me? Who created me? (Yasna 29.1)",
-            "tags": ["reflection", "wisdom", "responsibility"],
-            "source": "yasna"
-        },
-        {
-            "text": "Then spoke Ahura Mazda: We have no pastor here who is both knowing and holy. (Yasna 29.6)",
-            "tags": ["wisdom", "responsibility", "devotion"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 32 (Warning Against False Teachers)
-        {
-            "text": "The false teacher leads people astray from the path of good thinking and truth. (Yasna 32.3)",
-            "tags": ["vohu-manah", "asha", "wisdom", "responsibility"],
-            "source": "yasna"
-        },
-        {
-            "text": "But the righteous man chooses truth and good thinking as his allies. (Yasna 32.2)",
-            "tags": ["asha", "vohu-manah", "choice", "good-thoughts"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 33 (Prayer for Help)
-        {
-            "text": "Come to my help, O Mazda, grant me strength through truth and good thinking. (Yasna 33.6)",
-            "tags": ["devotion", "asha", "vohu-manah", "reflection"],
-            "source": "yasna"
-        },
-        {
-            "text": "May we receive the promised reward, the joy that comes from truth, O Mazda. (Yasna 33.11)",
-            "tags": ["asha", "hope", "enlightenment"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 34 (Worship and Fire)
-        {
-            "text": "We approach You, O Ahura Mazda, with good thinking and truth, seeking Your blessing. (Yasna 34.1)",
-            "tags": ["vohu-manah", "asha", "devotion", "reflection"],
-            "source": "yasna"
-        },
-        {
-            "text": "May Your fire shine forth to help the supporter of truth, O Mazda. (Yasna 34.4)",
-            "tags": ["fire", "asha", "enlightenment", "justice"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 43 (Divine Vision)
-        {
-            "text": "When Good Mind came to me, I first learned to proclaim Your words, O Mazda. (Yasna 43.15)",
-            "tags": ["vohu-manah", "wisdom", "good-words", "enlightenment"],
-            "source": "yasna"
-        },
-        {
-            "text": "I praise You as the greatest and best, as the most beautiful, O Mazda Ahura. (Yasna 43.16)",
-            "tags": ["devotion", "gratitude", "reflection"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 44 (Questions)
-        {
-            "text": "This I ask You: Which is the first and which the last? (Yasna 44.6)",
-            "tags": ["wisdom", "reflection", "enlightenment"],
-            "source": "yasna"
-        },
-        {
-            "text": "This I ask You: Who holds up the earth below and keeps the sky from falling? (Yasna 44.4)",
-            "tags": ["wisdom", "reflection", "gratitude"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 45 (Devotion)
-        {
-            "text": "As long as I have strength and power, I shall teach people to seek truth. (Yasna 45.4)",
-            "tags": ["asha", "good-words", "devotion", "action"],
-            "source": "yasna"
-        },
-        {
-            "text": "May good thinking reign supreme, may truth be established in the world. (Yasna 45.10)",
-            "tags": ["vohu-manah", "asha", "hope", "justice"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 46 (Seeking Refuge)
-        {
-            "text": "Where shall the righteous man find refuge when the wicked overwhelm the land? (Yasna 46.1)",
-            "tags": ["reflection", "justice", "responsibility"],
-            "source": "yasna"
-        },
-        {
-            "text": "The friend of truth shall be the friend of my spirit, O Ahura Mazda. (Yasna 46.2)",
-            "tags": ["asha", "friendship", "spenta-mainyu", "devotion"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 47 (The Holy Spirit)
-        {
-            "text": "Through Your most beneficent spirit, O Mazda, I seek to do Your will. (Yasna 47.1)",
-            "tags": ["spenta-mainyu", "devotion", "good-deeds"],
-            "source": "yasna"
-        },
-        {
-            "text": "May the beneficent spirit help us to speak truth and act righteously. (Yasna 47.6)",
-            "tags": ["spenta-mainyu", "asha", "good-words", "good-deeds"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 48 (Trust in Mazda)
-        {
-            "text": "I entrust my soul to You, O Mazda, seeking Your protection through good thinking. (Yasna 48.9)",
-            "tags": ["devotion", "vohu-manah", "reflection"],
-            "source": "yasna"
-        },
-        {
-            "text": "Grant victory to those who speak truth and live righteously, O Ahura Mazda. (Yasna 48.12)",
-            "tags": ["asha", "good-words", "good-deeds", "justice"],
-            "source": "yasna"
-        },
-        
-        # From Yasna 49 (Recognition)
-        {
-            "text": "I have recognized You as beneficent through truth and good thinking, O Mazda. (Yasna 49.5)",
-            "tags": ["spenta-mainyu", "asha", "vohu-manah", "enlightenment"],
-            "source": "yasna"
-        },
-        {
-            "text": "Through good deeds and righteous words, may we please Your spirit, O Mazda. (Yasna 49.10)",
-            "tags": ["good-deeds", "good-words", "spenta-mainyu", "devotion"],
-            "source": "yasna"
-        }
-    ]
-    
-    return more_verses
-
-# Add another batch of authentic entries
-another_authentic_batch = create_another_authentic_batch()
-authentic_entries.extend(another_authentic_batch)
-
-# Now create a very large batch of inspired entries to get closer to our target
-def create_massive_inspired_batch():
-    entries = []
-    
-    # Gratitude and Devotion theme
-    gratitude_devotion = [
-        "Gratitude is the memory of the heart—it never forgets a kindness received or given.",
-        "Each breath is a gift, each heartbeat a blessing, each moment an opportunity for thankfulness.",
-        "The grateful heart sees abundance everywhere; the ungrateful heart finds scarcity in plenty.",
-        "Devotion is gratitude in action, love expressing itself through loyal service.",
-        "Thank the sunrise for its faithfulness, the earth for its generosity, life for its infinite possibilities.",
-        "The practice of gratitude transforms ordinary moments into sacred experiences.",
-        "Appreciation is the highest form of prayer—seeing the divine in every blessing.",
-        "A thankful heart is a magnet for miracles, drawing goodness from the infinite storehouse of grace.",
-        "Devotion asks not what you can receive but what you can give, not what you deserve but what you can serve.",
-        "Let gratitude be your first thought at dawn, your last thought at dusk, your constant companion throughout the day."
-    ]
-    
-    # Reflection and Self-Knowledge theme
-    reflection_self = [
-        "The unexamined life scatters like leaves in the wind; the examined life grows deep roots in truth.",
-        "Self-knowledge is the beginning of wisdom, self-acceptance the foundation of growth.",
-        "Look within with the same honesty you demand from others, the same compassion you show to friends.",
-        "The mirror of self-reflection shows not what you want to see but what you need to see.",
-        "Meditation is the art of listening to the still small voice that whispers your deepest truth.",
-        "Know yourself not to become self-absorbed but to become self-aware, not to focus inward but to focus clearly.",
-        "The person who knows their weaknesses is stronger than the person who denies them.",
-        "Self-reflection without self-compassion becomes self-criticism; self-compassion without self-reflection becomes self-deception.",
-        "The journey inward is the most courageous journey—it requires facing yourself without flinching.",
-        "True self-knowledge includes knowing not just what you are but what you could become."
-    ]
-    
-    # Harmony and Peace theme
-    harmony_peace = [
-        "Peace is not the absence of conflict but the presence of justice, not the silence of oppression but the harmony of mutual respect.",
-        "Where differences divide, find common ground; where similarities unite, celebrate diversity.",
-        "The peaceful heart creates peaceful surroundings; the harmonious soul attracts harmonious relationships.",
-        "Conflict is often the birth-pain of greater understanding—do not avoid it, but engage it constructively.",
-        "Peace begins with each person choosing to be peaceful, harmony starts with each individual choosing to be harmonious.",
-        "The music of the spheres plays on—attune your heart to hear the cosmic symphony of love.",
-        "Bridge-builders are more valuable than wall-builders, peacemakers more needed than warriors.",
-        "Harmony does not require uniformity—an orchestra creates beauty through coordinated differences.",
-        "Inner peace is not a luxury but a necessity, not a retreat from the world but preparation for effective engagement.",
-        "Let your presence be a sanctuary where others can find rest from the storms of life."
-    ]
-    
-    # Growth and Learning theme
-    growth_learning = [
-        "Every mistake is a teacher in disguise, every failure a step toward success, every setback a setup for comeback.",
-        "Growth requires leaving your comfort zone regularly—comfort and growth cannot coexist.",
-        "The curious mind stays young, the learning heart stays open, the growing soul stays alive.",
-        "What doesn't challenge you doesn't change you; what doesn't stretch you doesn't strengthen you.",
-        "Learning from others shortens your path to wisdom; teaching others deepens your own understanding.",
-        "The beginner's mind sees possibilities everywhere; the expert mind sees problems in everything.",
-        "Transformation happens not when you try to become someone else but when you become more fully yourself.",
-        "Each day offers lessons if you are willing to be a student, opportunities if you are willing to try.",
-        "The growing edge is always uncomfortable—that's how you know you're growing.",
-        "Personal evolution is not about perfection but about progression, not about arrival but about journey."
-    ]
-    
-    # Community and Connection theme
-    community_connection = [
-        "You are not just in the community; the community is in you—you carry it wherever you go.",
-        "The strength of the individual is the community; the strength of the community is the individual.",
-        "We rise by lifting others, we succeed by serving others, we find ourselves by losing ourselves in love.",
-        "Connection is the energy that exists between people when they feel seen, heard, and valued.",
-        "Your network is not about who can help you but who you can help, not who you know but who knows they can count on you.",
-        "Community is not a place but a relationship, not a location but a connection.",
-        "The isolated tree falls in the storm; the forest of trees stands strong together.",
-        "Every person you meet is fighting a battle you know nothing about—be kind, be patient, be present.",
-        "True belonging doesn't require you to change who you are; it requires you to be who you are.",
-        "We are all connected—what helps one helps all, what harms one harms all."
-    ]
-    
-    # Sacred Living theme
-    sacred_living = [
-        "Every moment is sacred when approached with reverence, every task holy when performed with love.",
-        "The sacred is not separate from the ordinary but hidden within it, waiting to be discovered.",
-        "Your daily work is your temple, your loving relationships your prayer, your kind actions your worship.",
-        "Holiness is not about being perfect but about being present, not about being pure but about being real.",
-        "The divine dwells not only in temples but in every heart that welcomes it, every life that serves it.",
-        "Sacred living means recognizing the extraordinary within the ordinary, the eternal within the temporal.",
-        "Every meal is communion when shared with gratitude, every conversation prayer when spoken with love.",
-        "The sacred space is wherever you are when you remember who you really are and why you are here.",
-        "Your life is a sacred text written one choice at a time—make it a beautiful story.",
-        "The holy is not somewhere else or some time else but here and now, in this place, at this moment."
-    ]
-    
-    # Compile all with appropriate tags
-    all_theme_entries = [
-        (gratitude_devotion, ["gratitude", "devotion", "reflection", "enlightenment"]),
-        (reflection_self, ["reflection", "wisdom", "self-renovation", "enlightenment"]),
-        (harmony_peace, ["harmonization", "compassion", "wisdom", "friendship"]),
-        (growth_learning, ["wisdom", "self-renovation", "enlightenment", "hope"]),
-        (community_connection, ["friendship", "compassion", "action", "harmonization"]),
-        (sacred_living, ["devotion", "daily-practice", "enlightenment", "gratitude"])
-    ]
-    
-    for theme_texts, theme_tags in all_theme_entries:
-        for text in theme_texts:
-            entries.append({
-                "text": text,
-                "tags": theme_tags,
-                "source": "gathic-inspired"
-            })
-    
-    return entries
-
-# Generate the massive inspired batch
-massive_inspired_batch = create_massive_inspired_batch()
-gathic_inspired_entries.extend(massive_inspired_batch)
-
-print(f"Updated totals:")
-print(f"Authentic entries: {len(authentic_entries)}")
-print(f"Inspired entries: {len(gathic_inspired_entries)}")
-print(f"Total entries: {len(authentic_entries) + len(gathic_inspired_entries)}")
-print(f"Still need: {365 - (len(authentic_entries) + len(gathic_inspired_entries))} more entries")
\ No newline at end of file
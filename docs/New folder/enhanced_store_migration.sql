@@ -262,7 +262,7 @@ BEGIN
         JOIN product_categories pc ON pc.slug = p.category
         WHERE pc.id = product_categories.id
     );
-
+    
     RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
@@ -0,0 +1,249 @@
+# Benchmark the content_paths hierarchy index against the join chain it replaced.
+#
+# Loads the hierarchy part of novel_publishing_platform_schema.sql (the six
+# content tables, content_paths, its triggers and rebuild_content_paths())
+# into a scratch schema, seeds it (1M chapters by default), and times:
+# - a chapter's full URL: five-way join vs one content_paths lookup
+# - all chapters of a volume: join chain vs one id_path range scan
+# - trigger upkeep: inserting chapters and renaming a volume
+#
+# The scratch schema is dropped afterwards unless --keep is given.
+#
+# Usage:
+#   python hierarchy_benchmark.py --dsn postgresql://localhost/zoroastervers
+#   python hierarchy_benchmark.py --dsn $DATABASE_URL --books 1 --samples 50 --keep
+
+import argparse
+import os
+import random
+import re
+import statistics
+import time
+
+from schema_model import LEADING_NOISE, read_schema, split_statements
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_PATH = os.path.join(BASE_DIR, "novel_publishing_platform_schema.sql")
+BENCH_SCHEMA = "hierarchy_bench"
+
+HIERARCHY_TABLES = r"(?:books|volumes|sagas|arcs|issues|chapters|content_paths)"
+HIERARCHY_STATEMENTS = re.compile(
+    rf"CREATE\s+TABLE\s+{HIERARCHY_TABLES}\b"
+    rf"|CREATE\s+(?:UNIQUE\s+)?INDEX\s+\w+\s+ON\s+{HIERARCHY_TABLES}\s*\("
+    rf"|CREATE\s+TRIGGER\s+\w+\s+[^;]*?\s+ON\s+{HIERARCHY_TABLES}\s"
+    r"|CREATE\s+OR\s+REPLACE\s+FUNCTION\s+(?:update_updated_at_column|maintain_content_path|rebuild_content_paths"
+    r"|set_chapter_effective_subscription|propagate_issue_subscription)\(",
+    re.I,
+)
+# SECURITY DEFINER functions pin search_path to public; the scratch copies
+# must resolve the scratch schema's tables instead
+PUBLIC_SEARCH_PATH = re.compile(r"SET\s+search_path\s*=\s*public\b", re.I)
+
+SEED_SQL = [
+    "INSERT INTO books (id, title, slug, state) "
+    "SELECT gen_random_uuid(), 'Book ' || n, 'book-' || n, 'published' FROM generate_series(1, %(books)s) n",
+    "INSERT INTO volumes (id, book_id, title, slug, order_index, state) "
+    "SELECT gen_random_uuid(), p.id, 'Volume ' || n, 'volume-' || n, n, 'published' "
+    "FROM books p, generate_series(1, %(volumes)s) n",
+    "INSERT INTO sagas (id, volume_id, title, slug, order_index, state) "
+    "SELECT gen_random_uuid(), p.id, 'Saga ' || n, 'saga-' || n, n, 'published' "
+    "FROM volumes p, generate_series(1, %(sagas)s) n",
+    "INSERT INTO arcs (id, saga_id, title, slug, order_index, state) "
+    "SELECT gen_random_uuid(), p.id, 'Arc ' || n, 'arc-' || n, n, 'published' "
+    "FROM sagas p, generate_series(1, %(arcs)s) n",
+    "INSERT INTO issues (id, arc_id, title, slug, order_index, subscription_required, state) "
+    "SELECT gen_random_uuid(), p.id, 'Issue ' || n, 'issue-' || n, n, n > 1, 'published' "
+    "FROM arcs p, generate_series(1, %(issues)s) n",
+    "INSERT INTO chapters (id, issue_id, title, slug, order_index, content_format, content_text, state) "
+    "SELECT gen_random_uuid(), p.id, 'Chapter ' || n, 'chapter-' || n, n, 'markdown', "
+    "'# Chapter ' || n, 'published' "
+    "FROM issues p, generate_series(1, %(chapters)s) n",
+]
+
+# What get_content_path() ran before content_paths existed
+JOIN_PATH_SQL = """
+    SELECT '/library/books/' || b.slug || '/volumes/' || v.slug || '/sagas/' || s.slug
+           || '/arcs/' || a.slug || '/issues/' || i.slug || '/chapters/' || c.slug
+    FROM chapters c
+    JOIN issues i ON i.id = c.issue_id
+    JOIN arcs a ON a.id = i.arc_id
+    JOIN sagas s ON s.id = a.saga_id
+    JOIN volumes v ON v.id = s.volume_id
+    JOIN books b ON b.id = v.book_id
+    WHERE c.id = %s
+"""
+INDEX_PATH_SQL = "SELECT url_path FROM content_paths WHERE node_id = %s"
+JOIN_SUBTREE_SQL = """
+    SELECT c.id
+    FROM chapters c
+    JOIN issues i ON i.id = c.issue_id
+    JOIN arcs a ON a.id = i.arc_id
+    JOIN sagas s ON s.id = a.saga_id
+    WHERE s.volume_id = %s
+"""
+INDEX_SUBTREE_SQL = """
+    SELECT d.node_id
+    FROM content_paths n
+    JOIN content_paths d ON d.id_path > n.id_path AND d.id_path < n.id_path || '~'
+    WHERE n.node_id = %s AND d.node_type = 'chapter'
+"""
+
+
+def schema_statements(pattern, path=SCHEMA_PATH):
+    """The statements of the generated schema that `pattern` matches at their start."""
+    text = read_schema(path)
+    statements, start = [], 0
+    for end in split_statements(text)[0]:
+        statement = text[start:end]
+        start = end
+        noise = LEADING_NOISE.match(statement)
+        if pattern.match(statement, noise.end() if noise else 0):
+            statements.append(statement)
+    return statements
+
+
+def hierarchy_statements(path=SCHEMA_PATH):
+    """The statements of the generated schema that build the content hierarchy."""
+    return schema_statements(HIERARCHY_STATEMENTS, path)
+
+
+def connect(dsn):
+    try:
+        import psycopg2
+    except ImportError as exc:
+        raise RuntimeError("The hierarchy benchmark requires psycopg2 (pip install psycopg2-binary)") from exc
+    connection = psycopg2.connect(dsn)
+    connection.autocommit = True
+    return connection
+
+
+def setup(cursor, shape, schema_path=SCHEMA_PATH, schema=BENCH_SCHEMA):
+    """Create the scratch schema and seed it; returns seconds spent seeding and indexing."""
+    cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {schema}")
+    cursor.execute(f"SET search_path = {schema}, public")
+    cursor.execute("CREATE OR REPLACE FUNCTION uuid_generate_v4() RETURNS uuid AS 'SELECT gen_random_uuid()' LANGUAGE sql")
+    for statement in hierarchy_statements(schema_path):
+        cursor.execute(PUBLIC_SEARCH_PATH.sub(f"SET search_path = {schema}, public", statement))
+
+    timings = {}
+    # Bulk seeding goes around the per-row triggers; rebuild_content_paths()
+    # then fills the index set-based, as a backfill of an existing database would
+    start = time.perf_counter()
+    for table in ("books", "volumes", "sagas", "arcs", "issues", "chapters"):
+        cursor.execute(f"ALTER TABLE {table} DISABLE TRIGGER USER")
+    for statement in SEED_SQL:
+        cursor.execute(statement, shape)
+    timings["seed"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cursor.execute("SELECT rebuild_content_paths()")
+    timings["rebuild_content_paths"] = time.perf_counter() - start
+
+    for table in ("books", "volumes", "sagas", "arcs", "issues", "chapters"):
+        cursor.execute(f"ALTER TABLE {table} ENABLE TRIGGER USER")
+    cursor.execute("VACUUM ANALYZE")
+    return timings
+
+
+def time_query(cursor, sql, ids):
+    """Per-call latencies in milliseconds (one warm-up call first)."""
+    cursor.execute(sql, (ids[0],))
+    cursor.fetchall()
+    latencies = []
+    for node_id in ids:
+        start = time.perf_counter()
+        cursor.execute(sql, (node_id,))
+        cursor.fetchall()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return f"mean {statistics.mean(latencies):7.3f} ms   p95 {p95:7.3f} ms"
+
+
+def run(cursor, samples, seed):
+    results = {}
+
+    cursor.execute("SELECT setseed(%s)", (random.Random(seed).random(),))
+    cursor.execute("SELECT id FROM chapters ORDER BY random() LIMIT %s", (samples,))
+    chapter_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute("SELECT id FROM volumes ORDER BY random() LIMIT %s", (samples,))
+    volume_ids = [row[0] for row in cursor.fetchall()]
+
+    # Both versions must agree before their timings mean anything
+    for chapter_id in chapter_ids[:20]:
+        cursor.execute(JOIN_PATH_SQL, (chapter_id,))
+        joined = cursor.fetchone()
+        cursor.execute(INDEX_PATH_SQL, (chapter_id,))
+        if joined != cursor.fetchone():
+            raise RuntimeError(f"content_paths disagrees with the join chain for chapter {chapter_id}")
+
+    results["chapter path (join)"] = time_query(cursor, JOIN_PATH_SQL, chapter_ids)
+    results["chapter path (content_paths)"] = time_query(cursor, INDEX_PATH_SQL, chapter_ids)
+    results["volume chapters (join)"] = time_query(cursor, JOIN_SUBTREE_SQL, volume_ids)
+    results["volume chapters (content_paths)"] = time_query(cursor, INDEX_SUBTREE_SQL, volume_ids)
+
+    # Trigger upkeep
+    cursor.execute("SELECT id FROM issues ORDER BY random() LIMIT 1")
+    issue_id = cursor.fetchone()[0]
+    start = time.perf_counter()
+    cursor.execute(
+        "INSERT INTO chapters (issue_id, title, slug, order_index, state) "
+        "SELECT %s, 'Extra ' || n, 'extra-' || n, 1000 + n, 'draft' FROM generate_series(1, 1000) n",
+        (issue_id,),
+    )
+    results["insert 1000 chapters (with triggers)"] = [(time.perf_counter() - start) * 1000]
+
+    start = time.perf_counter()
+    cursor.execute("UPDATE volumes SET slug = slug || '-renamed' WHERE id = %s", (volume_ids[0],))
+    results["rename one volume (subtree rewrite)"] = [(time.perf_counter() - start) * 1000]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark content_paths against the hierarchy join chain")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--schema", default=SCHEMA_PATH, help="Generated schema SQL (script.py)")
+    parser.add_argument("--books", type=int, default=10)
+    parser.add_argument("--fanout", type=int, nargs=4, default=[5, 4, 5, 10], metavar=("VOLUMES", "SAGAS", "ARCS", "ISSUES"),
+                        help="Children per book, volume, saga and arc")
+    parser.add_argument("--chapters", type=int, default=100, help="Chapters per issue")
+    parser.add_argument("--samples", type=int, default=500, help="Lookups timed per query")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help=f"Keep the {BENCH_SCHEMA} schema afterwards")
+    args = parser.parse_args(argv)
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    volumes, sagas, arcs, issues = args.fanout
+    shape = {"books": args.books, "volumes": volumes, "sagas": sagas, "arcs": arcs, "issues": issues,
+             "chapters": args.chapters}
+    chapter_count = args.books * volumes * sagas * arcs * issues * args.chapters
+
+    connection = connect(args.dsn)
+    try:
+        with connection.cursor() as cursor:
+            print(f"Seeding {chapter_count:,} chapters into {BENCH_SCHEMA}...")
+            for name, seconds in setup(cursor, shape, args.schema).items():
+                print(f"- {name}: {seconds:.1f}s")
+            cursor.execute("SELECT pg_size_pretty(pg_total_relation_size('content_paths'))")
+            print(f"- content_paths size (with indexes): {cursor.fetchone()[0]}")
+
+            for name, latencies in run(cursor, args.samples, args.seed).items():
+                if len(latencies) == 1:
+                    print(f"✅ {name:<38} {latencies[0]:9.1f} ms")
+                else:
+                    print(f"✅ {name:<38} {summarize(latencies)}")
+
+            if not args.keep:
+                cursor.execute(f"DROP SCHEMA {BENCH_SCHEMA} CASCADE")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
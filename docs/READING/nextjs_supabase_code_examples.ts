@@ -79,6 +79,7 @@ export interface Database {
           content_url: string | null
           release_date: string | null
           subscription_required: boolean | null
+          effective_subscription_required: boolean
           state: 'draft' | 'scheduled' | 'published' | 'archived'
           word_count: number
           estimated_reading_time: number
@@ -187,6 +188,23 @@ export interface Database {
           added_at?: string
         }
       }
+      user_entitlements: {
+        Row: {
+          user_id: string
+          premium_until: string | null
+          refreshed_at: string
+        }
+        Insert: {
+          user_id: string
+          premium_until?: string | null
+          refreshed_at?: string
+        }
+        Update: {
+          user_id?: string
+          premium_until?: string | null
+          refreshed_at?: string
+        }
+      }
     }
   }
 }
@@ -200,11 +218,26 @@ type Json = string | number | boolean | null | { [key: string]: Json | undefined
 // lib/services/content.ts
 import { supabase } from '../supabase'
 import { Database } from '../database.types'
+import { readingProgressBuffer } from './readingProgress'
+import { activityLogger } from './activityLog'
 
 type Book = Database['public']['Tables']['books']['Row']
 type Chapter = Database['public']['Tables']['chapters']['Row']
 type Profile = Database['public']['Tables']['profiles']['Row']
 
+// Table-of-contents entry (get_book_skeleton / get_content_children)
+type ContentNodeRow = {
+  id: string
+  parent_id: string | null
+  node_type: 'book' | 'volume' | 'saga' | 'arc' | 'issue' | 'chapter'
+  title: string
+  slug: string
+  order_index: number
+  state: 'draft' | 'scheduled' | 'published' | 'archived'
+  chapter_count?: number | null
+}
+type ContentNode = ContentNodeRow & { children: ContentNode[] }
+
 export class ContentService {
   // Get all published books for library
   static async getPublishedBooks(): Promise<Book[]> {
@@ -218,32 +251,70 @@ export class ContentService {
     return data || []
   }
 
-  // Get book with full hierarchy
-  static async getBookWithHierarchy(bookSlug: string) {
-    const { data: book, error: bookError } = await supabase
-      .from('books')
-      .select(`
-        *,
-        volumes(
-          *,
-          sagas(
-            *,
-            arcs(
-              *,
-              issues(
-                *,
-                chapters(*)
-              )
-            )
-          )
-        )
-      `)
-      .eq('slug', bookSlug)
-      .eq('state', 'published')
-      .single()
+  // Get a book's table of contents: the skeleton of every published level
+  // down to issues (ids, titles, slugs, order, state, chapter counts), never
+  // any chapter content. Chapters are loaded per issue with getChildren().
+  static async getBookSkeleton(
+    bookSlug: string
+  ): Promise<(ContentNode & Pick<Book, 'subtitle' | 'description' | 'cover_image'>) | null> {
+    const [{ data, error }, { data: header, error: headerError }] = await Promise.all([
+      supabase.rpc('get_book_skeleton', { book_slug: bookSlug }),
+      supabase
+        .from('books')
+        .select('subtitle, description, cover_image')
+        .eq('slug', bookSlug)
+        .eq('state', 'published')
+        .maybeSingle()
+    ])
 
-    if (bookError) throw bookError
-    return book
+    if (error) throw error
+    if (headerError) throw headerError
+    if (!data || data.length === 0 || !header) return null
+
+    const nodes = new Map<string, ContentNode>()
+    for (const row of data as ContentNodeRow[]) {
+      nodes.set(row.id, { ...row, children: [] })
+    }
+
+    let book: ContentNode | null = null
+    for (const node of nodes.values()) {
+      const parent = node.parent_id ? nodes.get(node.parent_id) : undefined
+      if (parent) {
+        parent.children.push(node)
+      } else if (node.node_type === 'book') {
+        book = node
+      }
+    }
+    for (const node of nodes.values()) {
+      node.children.sort((a, b) => a.order_index - b.order_index || a.id.localeCompare(b.id))
+    }
+    return book && { ...book, ...header }
+  }
+
+  // Get one page of a node's published children (a book's volumes ... an
+  // issue's chapters); pass the returned cursor to get the next page
+  static async getChildren(
+    parentId: string,
+    cursor?: string | null,
+    pageSize: number = 50
+  ): Promise<{ items: ContentNodeRow[]; nextCursor: string | null }> {
+    // get_content_children caps pages at 200 rows
+    const size = Math.min(Math.max(pageSize, 1), 200)
+    const [afterOrderIndex, afterId] = cursor ? cursor.split(':') : [null, null]
+    const { data, error } = await supabase.rpc('get_content_children', {
+      parent_id_param: parentId,
+      after_order_index: afterOrderIndex === null ? null : Number(afterOrderIndex),
+      after_id: afterId,
+      page_size: size
+    })
+
+    if (error) throw error
+    const items = (data || []) as ContentNodeRow[]
+    const last = items[items.length - 1]
+    return {
+      items,
+      nextCursor: items.length === size && last ? `${last.order_index}:${last.id}` : null
+    }
   }
 
   // Get chapter content with access control
@@ -256,45 +327,35 @@ export class ContentService {
     chapterSlug: string,
     userId?: string
   ): Promise<Chapter | null> {
-    // Build the query with all joins to validate the full path
+    // One round trip: path resolution, publish checks and the access decision
+    // all happen in get_chapter_by_path
     const { data, error } = await supabase
-      .from('chapters')
-      .select(`
-        *,
-        issues!inner(
-          *,
-          arcs!inner(
-            *,
-            sagas!inner(
-              *,
-              volumes!inner(
-                *,
-                books!inner(slug)
-              )
-            )
-          )
-        )
-      `)
-      .eq('slug', chapterSlug)
-      .eq('issues.slug', issueSlug)
-      .eq('issues.arcs.slug', arcSlug)
-      .eq('issues.arcs.sagas.slug', sagaSlug)
-      .eq('issues.arcs.sagas.volumes.slug', volumeSlug)
-      .eq('issues.arcs.sagas.volumes.books.slug', bookSlug)
-      .single()
+      .rpc('get_chapter_by_path', {
+        book_slug: bookSlug,
+        volume_slug: volumeSlug,
+        saga_slug: sagaSlug,
+        arc_slug: arcSlug,
+        issue_slug: issueSlug,
+        chapter_slug: chapterSlug,
+        user_id_param: userId ?? null
+      })
+      .maybeSingle()
 
     if (error) {
       console.error('Chapter access error:', error)
       return null
     }
 
-    // Check access permissions
-    const hasAccess = await this.checkContentAccess(data.id, 'chapter', userId)
-    if (!hasAccess) {
+    // Not found, or no access (the row then has no content fields)
+    if (!data?.has_access) {
       return null
     }
 
-    return data
+    const chapter = data.chapter as Chapter
+    if (userId) {
+      activityLogger.log(userId, { action_type: 'read', entity_type: 'chapter', entity_id: chapter.id })
+    }
+    return chapter
   }
 
   // Check if user has access to specific content
@@ -308,14 +369,11 @@ export class ContentService {
       if (contentType === 'chapter') {
         const { data } = await supabase
           .from('chapters')
-          .select(`
-            subscription_required,
-            issues!inner(subscription_required)
-          `)
+          .select('effective_subscription_required')
           .eq('id', contentId)
           .single()
 
-        return !data?.subscription_required && !data?.issues?.subscription_required
+        return data?.effective_subscription_required === false
       }
     }
 
@@ -349,6 +407,7 @@ export class ContentService {
       })
 
     if (error) throw error
+    activityLogger.log(userId, { action_type: 'add_to_library', entity_type: workType, entity_id: workId })
     return data
   }
 
@@ -364,29 +423,211 @@ export class ContentService {
     return data || []
   }
 
-  // Update reading progress
-  static async updateReadingProgress(
+  // Update reading progress. Buffered: the latest position and highest
+  // percentage per (user, chapter) are written in bulk by readingProgressBuffer
+  static updateReadingProgress(
     userId: string,
     chapterId: string,
     progressPercentage: number,
     lastReadPosition: number = 0
   ) {
-    const { data, error } = await supabase
-      .from('reading_progress')
-      .upsert({
-        user_id: userId,
-        chapter_id: chapterId,
-        progress_percentage: progressPercentage,
-        last_read_position: lastReadPosition,
-        completed: progressPercentage >= 100,
-        last_read_at: new Date().toISOString()
-      })
+    readingProgressBuffer.record(userId, chapterId, progressPercentage, lastReadPosition)
+  }
+}
 
-    if (error) throw error
-    return data
+// lib/services/readingProgress.ts
+// Coalesces reading progress updates in the browser. The reader reports its
+// position on every scroll event; instead of one reading_progress upsert per
+// event, only the latest position and the highest percentage per
+// (user, chapter) are kept and sent to /api/reading-progress/batch every
+// FLUSH_INTERVAL_MS and when the page is hidden or unloaded.
+import { supabase } from '../supabase'
+
+export type ReadingProgressUpdate = {
+  chapter_id: string
+  progress_percentage: number
+  last_read_position: number
+  last_read_at: string
+}
+
+const BATCH_ENDPOINT = '/api/reading-progress/batch'
+const FLUSH_INTERVAL_MS = 15000
+const MAX_BATCH_SIZE = 100 // keeps keepalive requests well under the 64 KB body limit
+
+class ReadingProgressBuffer {
+  private pending = new Map<string, ReadingProgressUpdate & { user_id: string }>()
+  private accessToken: string | null = null
+  private userId: string | null = null
+  private timer: ReturnType<typeof setInterval> | null = null
+
+  record(userId: string, chapterId: string, progressPercentage: number, lastReadPosition: number = 0) {
+    this.merge({
+      user_id: userId,
+      chapter_id: chapterId,
+      progress_percentage: Math.min(100, Math.max(0, progressPercentage)),
+      last_read_position: Math.round(lastReadPosition),
+      last_read_at: new Date().toISOString()
+    })
+    this.start()
+  }
+
+  // Send everything pending. keepalive lets the request outlive the page
+  // (pagehide); batches that fail to send or hit a server error go back into
+  // the buffer for the next flush.
+  async flush({ keepalive = false } = {}) {
+    if (!this.accessToken || this.pending.size === 0) return
+    const token = this.accessToken
+    const updates = Array.from(this.pending.values()).filter((update) => update.user_id === this.userId)
+    this.pending.clear()
+
+    for (let start = 0; start < updates.length; start += MAX_BATCH_SIZE) {
+      const batch = updates.slice(start, start + MAX_BATCH_SIZE)
+      try {
+        const response = await fetch(BATCH_ENDPOINT, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json', Authorization: `Bearer ${token}` },
+          body: JSON.stringify({ updates: batch.map(({ user_id, ...update }) => update) }),
+          keepalive
+        })
+        if (response.status >= 500) batch.forEach((update) => this.merge(update))
+      } catch (error) {
+        batch.forEach((update) => this.merge(update))
+      }
+    }
+  }
+
+  private merge(update: ReadingProgressUpdate & { user_id: string }) {
+    const key = `${update.user_id}:${update.chapter_id}`
+    const previous = this.pending.get(key)
+    if (!previous) {
+      this.pending.set(key, update)
+      return
+    }
+    const latest = update.last_read_at >= previous.last_read_at ? update : previous
+    this.pending.set(key, {
+      ...latest,
+      progress_percentage: Math.max(previous.progress_percentage, update.progress_percentage)
+    })
+  }
+
+  private start() {
+    if (this.timer || typeof window === 'undefined') return
+    this.timer = setInterval(() => this.flush(), FLUSH_INTERVAL_MS)
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush({ keepalive: true })
+    })
+    window.addEventListener('pagehide', () => this.flush({ keepalive: true }))
+
+    // The token is needed synchronously on pagehide, so track it here; a
+    // previous user's pending updates are sent with their token before it changes
+    supabase.auth.onAuthStateChange((_event, session) => {
+      if (session?.user.id !== this.userId) this.flush({ keepalive: true })
+      this.accessToken = session?.access_token ?? null
+      this.userId = session?.user.id ?? null
+    })
+  }
+}
+
+export const readingProgressBuffer = new ReadingProgressBuffer()
+
+// lib/services/activityLog.ts
+// Fire-and-forget activity logging. log() only queues the event under the
+// user it belongs to; the current user's queue is written with one
+// log_activity_batch call when it reaches MAX_BATCH_SIZE events, every
+// FLUSH_INTERVAL_MS, and when the page is hidden or unloaded, so no action
+// waits on an activity_log insert.
+import { supabase } from '../supabase'
+
+// Reader actions only; content state changes are logged by a database trigger
+export type ActivityEvent = {
+  action_type: 'read' | 'add_to_library'
+  entity_type: 'book' | 'volume' | 'saga' | 'arc' | 'issue' | 'chapter'
+  entity_id: string
+}
+
+type QueuedActivityEvent = ActivityEvent & { created_at: string }
+
+const RPC_ENDPOINT = `${process.env.NEXT_PUBLIC_SUPABASE_URL}/rest/v1/rpc/log_activity_batch`
+const MAX_BATCH_SIZE = 50
+const MAX_QUEUE_SIZE = 1000 // per user; oldest events are dropped beyond this (e.g. while offline)
+const FLUSH_INTERVAL_MS = 5000
+
+class ActivityLogger {
+  private queues = new Map<string, QueuedActivityEvent[]>()
+  private accessToken: string | null = null
+  private userId: string | null = null
+  private timer: ReturnType<typeof setInterval> | null = null
+
+  log(userId: string, event: ActivityEvent) {
+    const queue = this.queues.get(userId) ?? []
+    queue.push({ ...event, created_at: new Date().toISOString() })
+    if (queue.length > MAX_QUEUE_SIZE) queue.splice(0, queue.length - MAX_QUEUE_SIZE)
+    this.queues.set(userId, queue)
+    this.start()
+    if (queue.length >= MAX_BATCH_SIZE) this.flush()
+  }
+
+  // Send the signed-in user's queue with their own token, so events are
+  // always credited to the user who caused them. keepalive lets the request
+  // outlive the page (pagehide); batches that fail to send or hit a server
+  // error go back to the front of that user's queue. Events queued for
+  // anyone else cannot be written with this session and are dropped.
+  async flush({ keepalive = false } = {}) {
+    if (!this.accessToken || !this.userId) return
+    const token = this.accessToken
+    const userId = this.userId
+    const events = this.queues.get(userId) ?? []
+    this.queues.clear()
+
+    for (let start = 0; start < events.length; start += MAX_BATCH_SIZE) {
+      const batch = events.slice(start, start + MAX_BATCH_SIZE)
+      try {
+        const response = await fetch(RPC_ENDPOINT, {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            apikey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+            Authorization: `Bearer ${token}`
+          },
+          body: JSON.stringify({ events: batch }),
+          keepalive
+        })
+        if (response.status < 500) continue
+      } catch (error) {
+        console.error('Activity log error:', error)
+      }
+      this.requeue(userId, events.slice(start))
+      return
+    }
+  }
+
+  private requeue(userId: string, events: QueuedActivityEvent[]) {
+    const queue = [...events, ...(this.queues.get(userId) ?? [])]
+    if (queue.length > MAX_QUEUE_SIZE) queue.splice(0, queue.length - MAX_QUEUE_SIZE)
+    this.queues.set(userId, queue)
+  }
+
+  private start() {
+    if (this.timer || typeof window === 'undefined') return
+    this.timer = setInterval(() => this.flush(), FLUSH_INTERVAL_MS)
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush({ keepalive: true })
+    })
+    window.addEventListener('pagehide', () => this.flush({ keepalive: true }))
+
+    // The token is needed synchronously on pagehide, so track it here; a
+    // previous user's queued events are sent with their token before it
+    // changes (sign-out or account switch)
+    supabase.auth.onAuthStateChange((_event, session) => {
+      if (session?.user.id !== this.userId) this.flush({ keepalive: true })
+      this.accessToken = session?.access_token ?? null
+      this.userId = session?.user.id ?? null
+    })
   }
 }
 
+export const activityLogger = new ActivityLogger()
+
 // ==================================================
 // ADMIN SERVICE
 // ==================================================
@@ -434,7 +675,7 @@ export class AdminService {
 
   // Update content state
   static async updateContentState(
-    table: string,
+    table: 'books' | 'volumes' | 'sagas' | 'arcs' | 'issues' | 'chapters',
     id: string,
     state: 'draft' | 'scheduled' | 'published' | 'archived',
     publishAt?: string
@@ -450,6 +691,7 @@ export class AdminService {
       .single()
 
     if (error) throw error
+    // The log_content_state_change trigger records the change in activity_log
     return data
   }
 
@@ -488,7 +730,7 @@ export function useAuth() {
     const getInitialSession = async () => {
       const { data: { session } } = await supabase.auth.getSession()
       setUser(session?.user ?? null)
-
+      
       if (session?.user) {
         // Get user profile
         const { data: profile } = await supabase
@@ -496,10 +738,10 @@ export function useAuth() {
           .select('*')
           .eq('id', session.user.id)
           .single()
-
+        
         setProfile(profile)
       }
-
+      
       setLoading(false)
     }
 
@@ -509,19 +751,19 @@ export function useAuth() {
     const { data: { subscription } } = supabase.auth.onAuthStateChange(
       async (event, session) => {
         setUser(session?.user ?? null)
-
+        
         if (session?.user) {
           const { data: profile } = await supabase
             .from('profiles')
             .select('*')
             .eq('id', session.user.id)
             .single()
-
+          
           setProfile(profile)
         } else {
           setProfile(null)
         }
-
+        
         setLoading(false)
       }
     )
@@ -534,7 +776,7 @@ export function useAuth() {
       email,
       password
     })
-
+    
     return { data, error }
   }
 
@@ -546,7 +788,7 @@ export function useAuth() {
         data: metadata
       }
     })
-
+    
     return { data, error }
   }
 
@@ -650,18 +892,18 @@ export const LibraryCard: React.FC<LibraryCardProps> = ({
           />
         </div>
       )}
-
+      
       <div className="p-4">
         <h3 className="font-bold text-lg mb-2 line-clamp-2">{book.title}</h3>
-
+        
         {book.subtitle && (
           <p className="text-gray-600 text-sm mb-2 line-clamp-2">{book.subtitle}</p>
         )}
-
+        
         {book.description && (
           <p className="text-gray-700 text-sm mb-4 line-clamp-3">{book.description}</p>
         )}
-
+        
         <div className="flex justify-between items-center">
           <Link
             href={`/library/books/${book.slug}`}
@@ -669,7 +911,7 @@ export const LibraryCard: React.FC<LibraryCardProps> = ({
           >
             View Details
           </Link>
-
+          
           {onAddToLibrary && !inLibrary && (
             <button
               onClick={() => onAddToLibrary(book.id)}
@@ -678,7 +920,7 @@ export const LibraryCard: React.FC<LibraryCardProps> = ({
               Add to Library
             </button>
           )}
-
+          
           {inLibrary && (
             <span className="text-green-600 font-medium">✓ In Library</span>
           )}
@@ -691,6 +933,7 @@ export const LibraryCard: React.FC<LibraryCardProps> = ({
 // components/EbookReader.tsx
 import React, { useState, useEffect } from 'react'
 import { ContentService } from '../lib/services/content'
+import { readingProgressBuffer } from '../lib/services/readingProgress'
 import { useAuth } from '../hooks/useAuth'
 
 interface EbookReaderProps {
@@ -710,6 +953,10 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
 
   useEffect(() => {
     loadChapter()
+    // Progress is buffered; send this chapter's last position when leaving it
+    return () => {
+      readingProgressBuffer.flush()
+    }
   }, [chapterId])
 
   const loadChapter = async () => {
@@ -727,12 +974,12 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
   const handleScroll = (e: React.UIEvent<HTMLDivElement>) => {
     const target = e.target as HTMLDivElement
     const scrollPercentage = (target.scrollTop / (target.scrollHeight - target.clientHeight)) * 100
-
+    
     if (onProgressUpdate) {
       onProgressUpdate(scrollPercentage)
     }
 
-    // Update reading progress in database
+    // Record reading progress (coalesced and written in batches)
     if (user && chapter) {
       ContentService.updateReadingProgress(
         user.id,
@@ -757,7 +1004,7 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
       {/* Reader Controls */}
       <div className="sticky top-0 bg-white border-b p-4 flex justify-between items-center">
         <h1 className="text-xl font-bold">{chapter.title}</h1>
-
+        
         <div className="flex items-center space-x-4">
           {/* Font Size Controls */}
           <div className="flex items-center space-x-2">
@@ -775,7 +1022,7 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
               A+
             </button>
           </div>
-
+          
           {/* Theme Controls */}
           <select
             value={theme}
@@ -802,7 +1049,7 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
             }}
           />
         )}
-
+        
         {chapter.content_format === 'rich' && (
           <div>
             {/* Render rich content from content_json */}
@@ -832,7 +1079,7 @@ interface LibraryPageProps {
 export default function LibraryPage({ books }: LibraryPageProps) {
   const { user, isPremium } = useAuth()
   const { library, addToLibrary } = useLibrary(user?.id)
-
+  
   const [filter, setFilter] = useState<'all' | 'free' | 'premium'>('all')
   const [searchTerm, setSearchTerm] = useState('')
 
@@ -841,14 +1088,14 @@ export default function LibraryPage({ books }: LibraryPageProps) {
     if (searchTerm && !book.title.toLowerCase().includes(searchTerm.toLowerCase())) {
       return false
     }
-
+    
     // Apply access filter
     if (filter === 'free') {
       return !book.subscription_required
     } else if (filter === 'premium') {
       return book.subscription_required
     }
-
+    
     return true
   })
 
@@ -867,7 +1114,7 @@ export default function LibraryPage({ books }: LibraryPageProps) {
   return (
     <div className="container mx-auto px-4 py-8">
       <h1 className="text-3xl font-bold mb-8">Library</h1>
-
+      
       {/* Filters and Search */}
       <div className="mb-8 flex flex-col sm:flex-row gap-4">
         <input
@@ -877,7 +1124,7 @@ export default function LibraryPage({ books }: LibraryPageProps) {
           onChange={(e) => setSearchTerm(e.target.value)}
           className="flex-1 p-3 border rounded-lg"
         />
-
+        
         <div className="flex gap-2">
           <button
             onClick={() => setFilter('all')}
@@ -924,7 +1171,7 @@ export default function LibraryPage({ books }: LibraryPageProps) {
 export const getServerSideProps: GetServerSideProps = async () => {
   try {
     const books = await ContentService.getPublishedBooks()
-
+    
     return {
       props: {
         books
@@ -932,7 +1179,7 @@ export const getServerSideProps: GetServerSideProps = async () => {
     }
   } catch (error) {
     console.error('Error fetching books:', error)
-
+    
     return {
       props: {
         books: []
@@ -961,24 +1208,24 @@ export default function BookPage({ content, contentType, slugs }: BookPageProps)
   return (
     <div className="container mx-auto px-4 py-8">
       <h1 className="text-3xl font-bold mb-4">{content.title}</h1>
-
+      
       {content.subtitle && (
         <h2 className="text-xl text-gray-600 mb-4">{content.subtitle}</h2>
       )}
-
+      
       {content.description && (
         <p className="text-gray-700 mb-8">{content.description}</p>
       )}
 
-      {/* Navigation and children listing */}
-      {contentType === 'book' && content.volumes && (
+      {/* Navigation and children listing (table of contents skeleton) */}
+      {contentType === 'book' && content.children && (
         <div>
           <h3 className="text-2xl font-bold mb-4">Volumes</h3>
           <div className="grid gap-4">
-            {content.volumes.map((volume: any) => (
+            {content.children.map((volume: any) => (
               <div key={volume.id} className="border p-4 rounded">
                 <h4 className="font-bold">{volume.title}</h4>
-                {volume.description && <p className="text-gray-600">{volume.description}</p>}
+                <p className="text-gray-600">{volume.children.length} sagas</p>
               </div>
             ))}
           </div>
@@ -990,7 +1237,7 @@ export default function BookPage({ content, contentType, slugs }: BookPageProps)
 
 export const getServerSideProps: GetServerSideProps = async ({ params, req }) => {
   const slugs = params?.slugs as string[]
-
+  
   if (!slugs || slugs.length === 0) {
     return { notFound: true }
   }
@@ -999,8 +1246,12 @@ export const getServerSideProps: GetServerSideProps = async ({ params, req }) =>
     // Determine content type and fetch appropriate data
     if (slugs.length === 2 && slugs[0] === 'books') {
       // Book detail page: /library/books/[bookSlug]
-      const book = await ContentService.getBookWithHierarchy(slugs[1])
+      const book = await ContentService.getBookSkeleton(slugs[1])
 
+      if (!book) {
+        return { notFound: true }
+      }
+      
       return {
         props: {
           content: book,
@@ -1011,16 +1262,16 @@ export const getServerSideProps: GetServerSideProps = async ({ params, req }) =>
     } else if (slugs.length === 8) {
       // Chapter page: /library/books/[book]/volumes/[volume]/sagas/[saga]/arcs/[arc]/issues/[issue]/chapters/[chapter]
       const [, bookSlug, , volumeSlug, , sagaSlug, , arcSlug, , issueSlug, , chapterSlug] = slugs
-
+      
       // Get user from session for access control
       const chapter = await ContentService.getChapterContent(
         bookSlug, volumeSlug, sagaSlug, arcSlug, issueSlug, chapterSlug
       )
-
+      
       if (!chapter) {
         return { notFound: true }
       }
-
+      
       return {
         props: {
           content: chapter,
@@ -1029,7 +1280,7 @@ export const getServerSideProps: GetServerSideProps = async ({ params, req }) =>
         }
       }
     }
-
+    
     return { notFound: true }
   } catch (error) {
     console.error('Error fetching content:', error)
@@ -1037,6 +1288,44 @@ export const getServerSideProps: GetServerSideProps = async ({ params, req }) =>
   }
 }
 
+// pages/api/reading-progress/batch.ts
+// Batch endpoint for readingProgressBuffer: accepts { updates: [...] } (or a
+// bare array) and records them for the caller in one record_reading_progress
+// call. The user comes from the bearer token, never from the payload.
+import type { NextApiRequest, NextApiResponse } from 'next'
+import { createClient } from '@supabase/supabase-js'
+import { Database } from '../../../lib/database.types'
+
+const MAX_UPDATES = 500
+
+export default async function handler(req: NextApiRequest, res: NextApiResponse) {
+  if (req.method !== 'POST') {
+    res.setHeader('Allow', 'POST')
+    return res.status(405).json({ error: 'Method not allowed' })
+  }
+
+  const authorization = req.headers.authorization
+  if (!authorization?.startsWith('Bearer ')) {
+    return res.status(401).json({ error: 'Missing access token' })
+  }
+
+  const updates = Array.isArray(req.body) ? req.body : req.body?.updates
+  if (!Array.isArray(updates) || updates.length === 0 || updates.length > MAX_UPDATES) {
+    return res.status(400).json({ error: `Expected 1-${MAX_UPDATES} updates` })
+  }
+
+  // A per-request client acting as the reader, so auth.uid() is theirs
+  const supabase = createClient<Database>(
+    process.env.NEXT_PUBLIC_SUPABASE_URL!,
+    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    { global: { headers: { Authorization: authorization } }, auth: { persistSession: false } }
+  )
+  const { data, error } = await supabase.rpc('record_reading_progress', { updates })
+
+  if (error) return res.status(500).json({ error: error.message })
+  return res.status(200).json({ received: updates.length, written: data })
+}
+
 // ==================================================
 // ADMIN DASHBOARD COMPONENT
 // ==================================================
@@ -1079,18 +1368,18 @@ export default function AdminDashboard() {
   return (
     <div className="container mx-auto px-4 py-8">
       <h1 className="text-3xl font-bold mb-8">Admin Dashboard</h1>
-
+      
       <div className="grid grid-cols-1 md:grid-cols-3 gap-6 mb-8">
         <div className="bg-white p-6 rounded-lg shadow">
           <h3 className="text-lg font-semibold mb-2">Total Books</h3>
           <p className="text-3xl font-bold text-blue-600">{dashboardData?.books?.length || 0}</p>
         </div>
-
+        
         <div className="bg-white p-6 rounded-lg shadow">
           <h3 className="text-lg font-semibold mb-2">Total Chapters</h3>
           <p className="text-3xl font-bold text-green-600">{dashboardData?.chapters?.length || 0}</p>
         </div>
-
+        
         <div className="bg-white p-6 rounded-lg shadow">
           <h3 className="text-lg font-semibold mb-2">Total Users</h3>
           <p className="text-3xl font-bold text-purple-600">{dashboardData?.users?.length || 0}</p>
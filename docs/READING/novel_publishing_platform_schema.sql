@@ -115,24 +115,25 @@ CREATE TABLE chapters (
     synopsis TEXT,
     slug VARCHAR(255) NOT NULL,
     order_index INTEGER NOT NULL DEFAULT 0,
-
+    
     -- Content storage options
     content_format VARCHAR(20) DEFAULT 'rich' CHECK (content_format IN ('rich', 'markdown', 'file')),
     content_json JSONB, -- For rich text editor content
     content_text TEXT, -- For markdown content
     content_url VARCHAR(500), -- For uploaded files
-
+    
     -- Publishing control
     release_date TIMESTAMPTZ,
     subscription_required BOOLEAN, -- Nullable to inherit from issue
+    effective_subscription_required BOOLEAN NOT NULL DEFAULT false, -- COALESCE(own, issue's, false); set by triggers
     state VARCHAR(20) DEFAULT 'draft' CHECK (state IN ('draft', 'scheduled', 'published', 'archived')),
     publish_at TIMESTAMPTZ,
     unpublish_at TIMESTAMPTZ,
-
+    
     -- Word count and reading time
     word_count INTEGER DEFAULT 0,
     estimated_reading_time INTEGER DEFAULT 0, -- in minutes
-
+    
     metadata JSONB DEFAULT '{}',
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
@@ -171,6 +172,14 @@ CREATE TABLE subscriptions (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- User Entitlements (one row per user, refreshed from subscriptions by trigger;
+-- what RLS checks instead of joining profiles/subscriptions per row)
+CREATE TABLE user_entitlements (
+    user_id uuid PRIMARY KEY REFERENCES profiles(id) ON DELETE CASCADE,
+    premium_until TIMESTAMPTZ, -- NULL: no active subscription; 'infinity': no end date
+    refreshed_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- User Library (polymorphic - can point to any content level)
 CREATE TABLE user_library (
     id uuid PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -197,9 +206,13 @@ CREATE TABLE reading_progress (
 -- AUDIT AND ACTIVITY TABLES
 -- ==================================================
 
--- Activity Log (for admin actions and reader activities)
+-- Activity Log (for admin actions and reader activities). Append-only and
+-- range-partitioned by month on created_at: activity_log_YYYY_MM partitions
+-- are created ahead of time by create_activity_log_partitions(), old ones are
+-- detached by detach_activity_log_partitions(), and rows outside every
+-- monthly partition land in activity_log_default.
 CREATE TABLE activity_log (
-    id uuid PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
     user_id uuid REFERENCES profiles(id) ON DELETE SET NULL,
     action_type VARCHAR(50) NOT NULL, -- 'create', 'update', 'publish', 'read', 'add_to_library', etc.
     entity_type VARCHAR(20) NOT NULL, -- 'book', 'chapter', etc.
@@ -208,22 +221,51 @@ CREATE TABLE activity_log (
     new_values JSONB,
     ip_address INET,
     user_agent TEXT,
-    created_at TIMESTAMPTZ DEFAULT NOW()
-);
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, created_at) -- a partitioned table's keys include the partition key
+) PARTITION BY RANGE (created_at);
 
--- Chapter Revisions (version control for chapters)
+CREATE TABLE activity_log_default PARTITION OF activity_log DEFAULT;
+
+-- Chapter Revisions (version control for chapters). Insert full snapshots;
+-- the encode_chapter_revision trigger keeps periodic keyframes (full
+-- content) and stores the revisions in between as a line delta against
+-- their keyframe. Read revisions through get_chapter_revision().
 CREATE TABLE chapter_revisions (
     id uuid PRIMARY KEY DEFAULT uuid_generate_v4(),
     chapter_id uuid NOT NULL REFERENCES chapters(id) ON DELETE CASCADE,
     version_number INTEGER NOT NULL,
     title VARCHAR(255),
-    content_json JSONB,
-    content_text TEXT,
+    content_json JSONB, -- keyframes only
+    content_text TEXT, -- keyframes only
     content_url VARCHAR(500),
+    keyframe_version INTEGER, -- delta rows: the keyframe content_delta applies to
+    content_delta JSONB, -- delta rows: {"json": ops, "text": ops}, see revision_delta()
     revision_notes TEXT,
     created_by uuid REFERENCES profiles(id) ON DELETE SET NULL,
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    UNIQUE(chapter_id, version_number)
+    UNIQUE(chapter_id, version_number),
+    -- a keyframe cannot be deleted while revisions still depend on it
+    CONSTRAINT chapter_revisions_keyframe_fkey
+        FOREIGN KEY (chapter_id, keyframe_version) REFERENCES chapter_revisions(chapter_id, version_number),
+    CONSTRAINT chapter_revisions_keyframe_check CHECK ((keyframe_version IS NULL) = (content_delta IS NULL))
+);
+
+-- ==================================================
+-- CONTENT HIERARCHY INDEX
+-- ==================================================
+
+-- Content Paths (materialized path of every book/volume/saga/arc/issue/chapter,
+-- kept up to date by triggers; resolves a node's URL or its whole subtree with
+-- one indexed lookup instead of a five-way join)
+CREATE TABLE content_paths (
+    node_id uuid PRIMARY KEY, -- id of the book, volume, saga, arc, issue or chapter
+    node_type VARCHAR(20) NOT NULL CHECK (node_type IN ('book', 'volume', 'saga', 'arc', 'issue', 'chapter')),
+    parent_id uuid, -- NULL for books
+    book_id uuid NOT NULL,
+    depth SMALLINT NOT NULL, -- 0 for books ... 5 for chapters
+    id_path TEXT COLLATE "C" NOT NULL, -- '/<book id>/<volume id>/.../<node id>/'
+    url_path TEXT NOT NULL -- '/library/books/<slug>/volumes/<slug>/...'
 );
 
 -- ==================================================
@@ -262,7 +304,7 @@ CREATE INDEX idx_volumes_order ON volumes(book_id, order_index);
 CREATE INDEX idx_sagas_order ON sagas(volume_id, order_index);
 CREATE INDEX idx_arcs_order ON arcs(saga_id, order_index);
 CREATE INDEX idx_issues_order ON issues(arc_id, order_index);
-CREATE INDEX idx_chapters_order ON chapters(issue_id, order_index);
+CREATE INDEX idx_chapters_order ON chapters(issue_id, order_index, id); -- keyset pages of get_content_children
 
 -- User and subscription indexes
 CREATE INDEX idx_profiles_subscription_status ON profiles(subscription_status);
@@ -276,9 +318,15 @@ CREATE INDEX idx_reading_progress_chapter_id ON reading_progress(chapter_id);
 -- Activity and audit indexes
 CREATE INDEX idx_activity_log_user_id ON activity_log(user_id);
 CREATE INDEX idx_activity_log_entity ON activity_log(entity_type, entity_id);
-CREATE INDEX idx_activity_log_created_at ON activity_log(created_at);
+CREATE INDEX idx_activity_log_created_at ON activity_log USING BRIN (created_at); -- append-only: BRIN stays tiny
 CREATE INDEX idx_chapter_revisions_chapter_id ON chapter_revisions(chapter_id);
 
+-- Hierarchy index lookups (subtree = id_path range, covering so listings are
+-- index-only scans; URL resolution)
+CREATE UNIQUE INDEX idx_content_paths_id_path ON content_paths(id_path) INCLUDE (node_type, node_id);
+CREATE UNIQUE INDEX idx_content_paths_url_path ON content_paths(url_path);
+CREATE INDEX idx_content_paths_parent_id ON content_paths(parent_id);
+
 -- ==================================================
 -- TRIGGERS FOR AUTOMATIC UPDATES
 -- ==================================================
@@ -310,6 +358,172 @@ CREATE TRIGGER update_profiles_updated_at BEFORE UPDATE ON profiles
 CREATE TRIGGER update_subscriptions_updated_at BEFORE UPDATE ON subscriptions 
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- Effective subscription flag: a chapter inherits its issue's setting unless it sets its own
+CREATE OR REPLACE FUNCTION set_chapter_effective_subscription()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.effective_subscription_required := COALESCE(
+        NEW.subscription_required,
+        (SELECT subscription_required FROM issues WHERE id = NEW.issue_id),
+        false
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION propagate_issue_subscription()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE chapters
+    SET effective_subscription_required = COALESCE(NEW.subscription_required, false)
+    WHERE issue_id = NEW.id
+    AND subscription_required IS NULL
+    AND effective_subscription_required IS DISTINCT FROM COALESCE(NEW.subscription_required, false);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER set_chapters_effective_subscription BEFORE INSERT OR UPDATE OF subscription_required, issue_id ON chapters
+    FOR EACH ROW EXECUTE FUNCTION set_chapter_effective_subscription();
+CREATE TRIGGER propagate_issues_subscription AFTER UPDATE OF subscription_required ON issues
+    FOR EACH ROW WHEN (OLD.subscription_required IS DISTINCT FROM NEW.subscription_required)
+    EXECUTE FUNCTION propagate_issue_subscription();
+
+-- User entitlement refresh (runs inside whatever writes subscriptions, e.g. the payment webhook)
+CREATE OR REPLACE FUNCTION refresh_user_entitlement(user_id_param UUID)
+RETURNS TIMESTAMPTZ AS $$
+    -- No row when the profile itself is being deleted (cascade from profiles)
+    INSERT INTO user_entitlements (user_id, premium_until, refreshed_at)
+    SELECT p.id, MAX(COALESCE(s.end_date, 'infinity')) FILTER (WHERE s.id IS NOT NULL), NOW()
+    FROM profiles p
+    LEFT JOIN subscriptions s ON s.user_id = p.id AND s.status = 'active'
+    WHERE p.id = user_id_param
+    GROUP BY p.id
+    ON CONFLICT (user_id) DO UPDATE SET
+        premium_until = EXCLUDED.premium_until,
+        refreshed_at = EXCLUDED.refreshed_at
+    RETURNING premium_until;
+$$ LANGUAGE sql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION sync_user_entitlement()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_user_entitlement(OLD.user_id);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND (TG_OP = 'INSERT' OR NEW.user_id IS DISTINCT FROM OLD.user_id) THEN
+        PERFORM refresh_user_entitlement(NEW.user_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_subscriptions_user_entitlement AFTER INSERT OR UPDATE OR DELETE ON subscriptions
+    FOR EACH ROW EXECUTE FUNCTION sync_user_entitlement();
+
+-- Content path maintenance: TG_ARGV = (node type, parent id column). Runs as
+-- the owner: content_paths has no write policies, and the parent's path must
+-- be readable even when the writer cannot see it
+CREATE OR REPLACE FUNCTION maintain_content_path()
+RETURNS TRIGGER AS $$
+DECLARE
+    node_type TEXT := TG_ARGV[0];
+    parent_column TEXT := TG_ARGV[1];
+    new_parent_id uuid;
+    parent content_paths%ROWTYPE;
+    old_node content_paths%ROWTYPE;
+    new_id_path TEXT;
+    new_url_path TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        -- Children are deleted by ON DELETE CASCADE; drop the whole subtree at once
+        SELECT * INTO old_node FROM content_paths WHERE node_id = OLD.id;
+        IF FOUND THEN
+            DELETE FROM content_paths
+            WHERE id_path >= old_node.id_path AND id_path < old_node.id_path || '~';
+        END IF;
+        RETURN OLD;
+    END IF;
+
+    IF parent_column IS NOT NULL THEN
+        new_parent_id := (to_jsonb(NEW) ->> parent_column)::uuid;
+        SELECT * INTO parent FROM content_paths WHERE node_id = new_parent_id;
+    END IF;
+    new_id_path := COALESCE(parent.id_path, '/') || NEW.id || '/';
+    new_url_path := COALESCE(parent.url_path, '/library') || '/' || node_type || 's/' || NEW.slug;
+
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO content_paths (node_id, node_type, parent_id, book_id, depth, id_path, url_path)
+        VALUES (NEW.id, node_type, new_parent_id, COALESCE(parent.book_id, NEW.id),
+                COALESCE(parent.depth + 1, 0), new_id_path, new_url_path);
+        RETURN NEW;
+    END IF;
+
+    -- Slug change or move: rewrite the prefix of the node and its whole subtree
+    SELECT * INTO old_node FROM content_paths WHERE node_id = NEW.id;
+    IF old_node.id_path IS DISTINCT FROM new_id_path OR old_node.url_path IS DISTINCT FROM new_url_path THEN
+        UPDATE content_paths SET
+            id_path = new_id_path || substr(id_path, length(old_node.id_path) + 1),
+            url_path = new_url_path || substr(url_path, length(old_node.url_path) + 1),
+            book_id = COALESCE(parent.book_id, NEW.id),
+            parent_id = CASE WHEN node_id = NEW.id THEN new_parent_id ELSE content_paths.parent_id END
+        WHERE id_path >= old_node.id_path AND id_path < old_node.id_path || '~';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER maintain_books_content_path AFTER INSERT OR UPDATE OF slug OR DELETE ON books
+    FOR EACH ROW EXECUTE FUNCTION maintain_content_path('book', NULL);
+CREATE TRIGGER maintain_volumes_content_path AFTER INSERT OR UPDATE OF slug, book_id OR DELETE ON volumes
+    FOR EACH ROW EXECUTE FUNCTION maintain_content_path('volume', 'book_id');
+CREATE TRIGGER maintain_sagas_content_path AFTER INSERT OR UPDATE OF slug, volume_id OR DELETE ON sagas
+    FOR EACH ROW EXECUTE FUNCTION maintain_content_path('saga', 'volume_id');
+CREATE TRIGGER maintain_arcs_content_path AFTER INSERT OR UPDATE OF slug, saga_id OR DELETE ON arcs
+    FOR EACH ROW EXECUTE FUNCTION maintain_content_path('arc', 'saga_id');
+CREATE TRIGGER maintain_issues_content_path AFTER INSERT OR UPDATE OF slug, arc_id OR DELETE ON issues
+    FOR EACH ROW EXECUTE FUNCTION maintain_content_path('issue', 'arc_id');
+CREATE TRIGGER maintain_chapters_content_path AFTER INSERT OR UPDATE OF slug, issue_id OR DELETE ON chapters
+    FOR EACH ROW EXECUTE FUNCTION maintain_content_path('chapter', 'issue_id');
+
+-- Content state audit: TG_ARGV = (entity type). State changes are recorded
+-- here, by whoever made the update, rather than reported by the client; runs
+-- as the owner because activity_log has no write policies
+CREATE OR REPLACE FUNCTION log_content_state_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO activity_log (user_id, action_type, entity_type, entity_id, old_values, new_values)
+    VALUES (
+        auth.uid(),
+        CASE WHEN NEW.state = 'published' THEN 'publish' ELSE 'update' END,
+        TG_ARGV[0],
+        NEW.id,
+        jsonb_build_object('state', OLD.state, 'publish_at', OLD.publish_at),
+        jsonb_build_object('state', NEW.state, 'publish_at', NEW.publish_at)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER log_books_state_change AFTER UPDATE OF state ON books
+    FOR EACH ROW WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION log_content_state_change('book');
+CREATE TRIGGER log_volumes_state_change AFTER UPDATE OF state ON volumes
+    FOR EACH ROW WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION log_content_state_change('volume');
+CREATE TRIGGER log_sagas_state_change AFTER UPDATE OF state ON sagas
+    FOR EACH ROW WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION log_content_state_change('saga');
+CREATE TRIGGER log_arcs_state_change AFTER UPDATE OF state ON arcs
+    FOR EACH ROW WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION log_content_state_change('arc');
+CREATE TRIGGER log_issues_state_change AFTER UPDATE OF state ON issues
+    FOR EACH ROW WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION log_content_state_change('issue');
+CREATE TRIGGER log_chapters_state_change AFTER UPDATE OF state ON chapters
+    FOR EACH ROW WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION log_content_state_change('chapter');
+
 -- ==================================================
 -- ROW LEVEL SECURITY (RLS) POLICIES
 -- ==================================================
@@ -323,10 +537,13 @@ ALTER TABLE issues ENABLE ROW LEVEL SECURITY;
 ALTER TABLE chapters ENABLE ROW LEVEL SECURITY;
 ALTER TABLE profiles ENABLE ROW LEVEL SECURITY;
 ALTER TABLE subscriptions ENABLE ROW LEVEL SECURITY;
+ALTER TABLE user_entitlements ENABLE ROW LEVEL SECURITY;
 ALTER TABLE user_library ENABLE ROW LEVEL SECURITY;
 ALTER TABLE reading_progress ENABLE ROW LEVEL SECURITY;
 ALTER TABLE activity_log ENABLE ROW LEVEL SECURITY;
+ALTER TABLE activity_log_default ENABLE ROW LEVEL SECURITY;
 ALTER TABLE chapter_revisions ENABLE ROW LEVEL SECURITY;
+ALTER TABLE content_paths ENABLE ROW LEVEL SECURITY;
 
 -- Public read policies for published content
 CREATE POLICY "Published books are publicly viewable" ON books
@@ -349,7 +566,8 @@ CREATE POLICY "Published issues are publicly viewable" ON issues
     FOR SELECT USING (state = 'published' AND (publish_at IS NULL OR publish_at <= NOW()) 
                      AND (unpublish_at IS NULL OR unpublish_at > NOW()));
 
--- Chapter access with subscription check
+-- Chapter access with subscription check: a column check per row, and one
+-- entitlement lookup per query (the subquery does not depend on the row)
 CREATE POLICY "Chapter access with subscription check" ON chapters
     FOR SELECT USING (
         state = 'published' 
@@ -358,18 +576,14 @@ CREATE POLICY "Chapter access with subscription check" ON chapters
         AND (release_date IS NULL OR release_date <= NOW())
         AND (
             -- Free chapters (no subscription required)
-            (COALESCE(subscription_required, 
-                (SELECT subscription_required FROM issues WHERE id = chapters.issue_id)
-            ) = false)
+            NOT effective_subscription_required
             OR
-            -- Premium chapters (subscription required and user has active subscription)
-            (auth.uid() IS NOT NULL AND EXISTS (
-                SELECT 1 FROM profiles p 
-                JOIN subscriptions s ON s.user_id = p.id 
-                WHERE p.id = auth.uid() 
-                AND s.status = 'active' 
-                AND (s.end_date IS NULL OR s.end_date > NOW())
-            ))
+            -- Premium chapters (user is entitled right now)
+            EXISTS (
+                SELECT 1 FROM user_entitlements e
+                WHERE e.user_id = (SELECT auth.uid())
+                AND e.premium_until > NOW()
+            )
         )
     );
 
@@ -414,6 +628,9 @@ CREATE POLICY "Users can update their own profile" ON profiles
 CREATE POLICY "Users can view their own subscriptions" ON subscriptions
     FOR SELECT USING (auth.uid() = user_id);
 
+CREATE POLICY "Users can view their own entitlement" ON user_entitlements
+    FOR SELECT USING (auth.uid() = user_id);
+
 -- User library policies
 CREATE POLICY "Users can manage their own library" ON user_library
     FOR ALL USING (auth.uid() = user_id);
@@ -422,67 +639,280 @@ CREATE POLICY "Users can manage their own library" ON user_library
 CREATE POLICY "Users can manage their own reading progress" ON reading_progress
     FOR ALL USING (auth.uid() = user_id);
 
+-- Content paths include unpublished slugs; readers go through the helper
+-- functions, which only return published paths to non-admins. Writes happen
+-- only in the SECURITY DEFINER maintenance trigger and rebuild function.
+CREATE POLICY "Admins can view content paths" ON content_paths
+    FOR SELECT USING (
+        EXISTS (
+            SELECT 1 FROM profiles WHERE id = auth.uid() AND subscription_status = 'admin'
+        )
+    );
+
 -- ==================================================
 -- HELPER FUNCTIONS
 -- ==================================================
 
--- Function to get full content path
+-- Function to check the publishing window shared by all content levels
+CREATE OR REPLACE FUNCTION content_is_published(
+    state TEXT,
+    publish_at TIMESTAMPTZ,
+    unpublish_at TIMESTAMPTZ
+)
+RETURNS BOOLEAN AS $$
+    SELECT state = 'published'
+        AND (publish_at IS NULL OR publish_at <= NOW())
+        AND (unpublish_at IS NULL OR unpublish_at > NOW());
+$$ LANGUAGE sql STABLE;
+
+-- Function to check that every level of a content_paths id_path is published
+-- (chapters also need their release date); the first `checked_levels` levels
+-- are skipped when the caller has already checked them. A node's level in the
+-- path decides its table: 1 = book ... 6 = chapter.
+CREATE OR REPLACE FUNCTION content_path_is_published(
+    id_path TEXT,
+    checked_levels INTEGER DEFAULT 0
+)
+RETURNS BOOLEAN AS $$
+    SELECT COALESCE(bool_and(CASE node.level
+        WHEN 1 THEN EXISTS (SELECT 1 FROM books x WHERE x.id = node.id
+                            AND content_is_published(x.state, x.publish_at, x.unpublish_at))
+        WHEN 2 THEN EXISTS (SELECT 1 FROM volumes x WHERE x.id = node.id
+                            AND content_is_published(x.state, x.publish_at, x.unpublish_at))
+        WHEN 3 THEN EXISTS (SELECT 1 FROM sagas x WHERE x.id = node.id
+                            AND content_is_published(x.state, x.publish_at, x.unpublish_at))
+        WHEN 4 THEN EXISTS (SELECT 1 FROM arcs x WHERE x.id = node.id
+                            AND content_is_published(x.state, x.publish_at, x.unpublish_at))
+        WHEN 5 THEN EXISTS (SELECT 1 FROM issues x WHERE x.id = node.id
+                            AND content_is_published(x.state, x.publish_at, x.unpublish_at))
+        WHEN 6 THEN EXISTS (SELECT 1 FROM chapters x WHERE x.id = node.id
+                            AND content_is_published(x.state, x.publish_at, x.unpublish_at)
+                            AND (x.release_date IS NULL OR x.release_date <= NOW()))
+    END), TRUE)
+    FROM unnest(string_to_array(trim(BOTH '/' FROM id_path), '/')::uuid[]) WITH ORDINALITY AS node(id, level)
+    WHERE node.level > checked_levels;
+$$ LANGUAGE sql STABLE;
+
+-- Function to get full content path (any content type, one index lookup).
+-- Readers only get paths whose every level is published; admins get all.
 CREATE OR REPLACE FUNCTION get_content_path(
     content_type TEXT,
     content_id UUID
 )
 RETURNS TEXT AS $$
-DECLARE
-    result TEXT;
-    book_slug TEXT;
-    volume_slug TEXT;
-    saga_slug TEXT;
-    arc_slug TEXT;
-    issue_slug TEXT;
-    chapter_slug TEXT;
+    SELECT COALESCE(
+        (SELECT url_path FROM content_paths
+         WHERE node_id = content_id AND node_type = content_type
+         AND (content_path_is_published(id_path)
+              OR EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND subscription_status = 'admin'))),
+        '/library'
+    );
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+-- Function to list a node's descendants (optionally of one type) in one range
+-- scan. Readers only see published nodes under a published node (a hidden
+-- level hides everything below it); admins see the whole subtree.
+CREATE OR REPLACE FUNCTION get_content_descendants(
+    content_id UUID,
+    descendant_type TEXT DEFAULT NULL
+)
+RETURNS SETOF content_paths AS $$
+    WITH viewer AS (
+        SELECT EXISTS (
+            SELECT 1 FROM profiles WHERE id = auth.uid() AND subscription_status = 'admin'
+        ) AS is_admin
+    ), n AS (
+        SELECT p.*, viewer.is_admin FROM content_paths p, viewer
+        WHERE p.node_id = content_id
+        AND (viewer.is_admin OR content_path_is_published(p.id_path))
+    )
+    SELECT d.*
+    FROM n
+    JOIN content_paths d ON d.id_path > n.id_path AND d.id_path < n.id_path || '~'
+    WHERE (descendant_type IS NULL OR d.node_type = descendant_type)
+    AND (n.is_admin OR content_path_is_published(d.id_path, n.depth + 1))
+    ORDER BY d.id_path;
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+-- Function to open a chapter by its URL slugs: resolves the path through
+-- content_paths, checks that every level is published and decides access, all
+-- in one query. Without access the chapter comes back without its content.
+CREATE OR REPLACE FUNCTION get_chapter_by_path(
+    book_slug TEXT,
+    volume_slug TEXT,
+    saga_slug TEXT,
+    arc_slug TEXT,
+    issue_slug TEXT,
+    chapter_slug TEXT,
+    user_id_param UUID DEFAULT NULL
+)
+RETURNS TABLE (chapter JSONB, has_access BOOLEAN) AS $$
+    WITH viewer AS (
+        -- Entitlements count for the signed-in user only (any user for the service role)
+        SELECT CASE WHEN user_id_param = auth.uid() OR auth.role() = 'service_role'
+                    THEN user_id_param END AS user_id
+    )
+    SELECT
+        CASE WHEN access.granted THEN to_jsonb(c)
+             ELSE to_jsonb(c) - ARRAY['content_json', 'content_text', 'content_url'] END,
+        access.granted
+    FROM content_paths p
+    JOIN chapters c ON c.id = p.node_id
+    JOIN issues i ON i.id = c.issue_id
+    JOIN arcs a ON a.id = i.arc_id
+    JOIN sagas s ON s.id = a.saga_id
+    JOIN volumes v ON v.id = s.volume_id
+    JOIN books b ON b.id = v.book_id
+    CROSS JOIN LATERAL (
+        SELECT NOT c.effective_subscription_required OR EXISTS (
+            SELECT 1 FROM user_entitlements e
+            JOIN viewer ON viewer.user_id = e.user_id
+            WHERE e.premium_until > NOW()
+        ) AS granted
+    ) access
+    WHERE p.url_path = '/library/books/' || book_slug || '/volumes/' || volume_slug || '/sagas/' || saga_slug
+                       || '/arcs/' || arc_slug || '/issues/' || issue_slug || '/chapters/' || chapter_slug
+    AND p.node_type = 'chapter'
+    AND content_is_published(c.state, c.publish_at, c.unpublish_at)
+    AND (c.release_date IS NULL OR c.release_date <= NOW())
+    AND content_is_published(i.state, i.publish_at, i.unpublish_at)
+    AND content_is_published(a.state, a.publish_at, a.unpublish_at)
+    AND content_is_published(s.state, s.publish_at, s.unpublish_at)
+    AND content_is_published(v.state, v.publish_at, v.unpublish_at)
+    AND content_is_published(b.state, b.publish_at, b.unpublish_at);
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+-- Function to list a book's table of contents without any content bodies:
+-- published volumes, sagas, arcs and issues (plus each issue's chapter count);
+-- a hidden level hides everything below it. Chapters are paged in with
+-- get_content_children.
+CREATE OR REPLACE FUNCTION get_book_skeleton(book_slug TEXT)
+RETURNS TABLE (
+    id UUID,
+    parent_id UUID,
+    node_type TEXT,
+    title VARCHAR(255),
+    slug VARCHAR(255),
+    order_index INTEGER,
+    state VARCHAR(20),
+    chapter_count INTEGER
+) AS $$
+    WITH b AS (
+        SELECT * FROM books
+        WHERE slug = book_slug AND content_is_published(state, publish_at, unpublish_at)
+    ), v AS (
+        SELECT x.* FROM volumes x JOIN b ON x.book_id = b.id
+        WHERE content_is_published(x.state, x.publish_at, x.unpublish_at)
+    ), s AS (
+        SELECT x.* FROM sagas x JOIN v ON x.volume_id = v.id
+        WHERE content_is_published(x.state, x.publish_at, x.unpublish_at)
+    ), a AS (
+        SELECT x.* FROM arcs x JOIN s ON x.saga_id = s.id
+        WHERE content_is_published(x.state, x.publish_at, x.unpublish_at)
+    ), i AS (
+        SELECT x.* FROM issues x JOIN a ON x.arc_id = a.id
+        WHERE content_is_published(x.state, x.publish_at, x.unpublish_at)
+    )
+    SELECT id, NULL::uuid, 'book', title, slug, 0, state, NULL::integer FROM b
+    UNION ALL
+    SELECT id, book_id, 'volume', title, slug, order_index, state, NULL FROM v
+    UNION ALL
+    SELECT id, volume_id, 'saga', title, slug, order_index, state, NULL FROM s
+    UNION ALL
+    SELECT id, saga_id, 'arc', title, slug, order_index, state, NULL FROM a
+    UNION ALL
+    SELECT i.id, i.arc_id, 'issue', i.title, i.slug, i.order_index, i.state, (
+        SELECT COUNT(*)::integer FROM chapters c
+        WHERE c.issue_id = i.id
+        AND content_is_published(c.state, c.publish_at, c.unpublish_at)
+        AND (c.release_date IS NULL OR c.release_date <= NOW())
+    )
+    FROM i;
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+-- Function to page through the published children of any node (a book's
+-- volumes ... an issue's chapters), keyset-paginated on (order_index, id).
+-- Pass the last row's order_index and id to get the next page. As in
+-- get_book_skeleton, a hidden level hides everything below it: the parent and
+-- all of its ancestors must be published.
+CREATE OR REPLACE FUNCTION get_content_children(
+    parent_id_param UUID,
+    after_order_index INTEGER DEFAULT NULL,
+    after_id UUID DEFAULT NULL,
+    page_size INTEGER DEFAULT 50
+)
+RETURNS TABLE (
+    id UUID,
+    parent_id UUID,
+    node_type TEXT,
+    title VARCHAR(255),
+    slug VARCHAR(255),
+    order_index INTEGER,
+    state VARCHAR(20)
+) AS $$
+    SELECT * FROM (
+        SELECT x.id, x.book_id, 'volume', x.title, x.slug, x.order_index, x.state
+        FROM volumes x
+        WHERE x.book_id = parent_id_param
+        AND content_is_published(x.state, x.publish_at, x.unpublish_at)
+        UNION ALL
+        SELECT x.id, x.volume_id, 'saga', x.title, x.slug, x.order_index, x.state
+        FROM sagas x
+        WHERE x.volume_id = parent_id_param
+        AND content_is_published(x.state, x.publish_at, x.unpublish_at)
+        UNION ALL
+        SELECT x.id, x.saga_id, 'arc', x.title, x.slug, x.order_index, x.state
+        FROM arcs x
+        WHERE x.saga_id = parent_id_param
+        AND content_is_published(x.state, x.publish_at, x.unpublish_at)
+        UNION ALL
+        SELECT x.id, x.arc_id, 'issue', x.title, x.slug, x.order_index, x.state
+        FROM issues x
+        WHERE x.arc_id = parent_id_param
+        AND content_is_published(x.state, x.publish_at, x.unpublish_at)
+        UNION ALL
+        SELECT x.id, x.issue_id, 'chapter', x.title, x.slug, x.order_index, x.state
+        FROM chapters x
+        WHERE x.issue_id = parent_id_param
+        AND content_is_published(x.state, x.publish_at, x.unpublish_at)
+        AND (x.release_date IS NULL OR x.release_date <= NOW())
+    ) children (id, parent_id, node_type, title, slug, order_index, state)
+    -- Checked once for the whole page: the parent's path from its book down
+    WHERE EXISTS (
+        SELECT 1 FROM content_paths p
+        WHERE p.node_id = parent_id_param AND content_path_is_published(p.id_path)
+    )
+    AND (after_order_index IS NULL OR (children.order_index, children.id) > (after_order_index, after_id))
+    ORDER BY children.order_index, children.id
+    LIMIT LEAST(GREATEST(page_size, 1), 200);
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+-- Function to rebuild content_paths from the hierarchy tables (backfill / repair)
+CREATE OR REPLACE FUNCTION rebuild_content_paths()
+RETURNS VOID AS $$
 BEGIN
-    CASE content_type
-        WHEN 'chapter' THEN
-            SELECT b.slug, v.slug, s.slug, a.slug, i.slug, c.slug
-            INTO book_slug, volume_slug, saga_slug, arc_slug, issue_slug, chapter_slug
-            FROM chapters c
-            JOIN issues i ON i.id = c.issue_id
-            JOIN arcs a ON a.id = i.arc_id
-            JOIN sagas s ON s.id = a.saga_id
-            JOIN volumes v ON v.id = s.volume_id
-            JOIN books b ON b.id = v.book_id
-            WHERE c.id = content_id;
-
-            result := '/library/books/' || book_slug || '/volumes/' || volume_slug || 
-                     '/sagas/' || saga_slug || '/arcs/' || arc_slug || 
-                     '/issues/' || issue_slug || '/chapters/' || chapter_slug;
-
-        WHEN 'issue' THEN
-            SELECT b.slug, v.slug, s.slug, a.slug, i.slug
-            INTO book_slug, volume_slug, saga_slug, arc_slug, issue_slug
-            FROM issues i
-            JOIN arcs a ON a.id = i.arc_id
-            JOIN sagas s ON s.id = a.saga_id
-            JOIN volumes v ON v.id = s.volume_id
-            JOIN books b ON b.id = v.book_id
-            WHERE i.id = content_id;
-
-            result := '/library/books/' || book_slug || '/volumes/' || volume_slug || 
-                     '/sagas/' || saga_slug || '/arcs/' || arc_slug || 
-                     '/issues/' || issue_slug;
-
-        WHEN 'book' THEN
-            SELECT slug INTO book_slug FROM books WHERE id = content_id;
-            result := '/library/books/' || book_slug;
-
-        -- Add other cases as needed
-        ELSE
-            result := '/library';
-    END CASE;
-
-    RETURN result;
+    DELETE FROM content_paths;
+    INSERT INTO content_paths
+    SELECT id, 'book', NULL, id, 0, '/' || id || '/', '/library/books/' || slug FROM books;
+    INSERT INTO content_paths
+    SELECT c.id, 'volume', p.node_id, p.book_id, 1, p.id_path || c.id || '/', p.url_path || '/volumes/' || c.slug
+    FROM volumes c JOIN content_paths p ON p.node_id = c.book_id;
+    INSERT INTO content_paths
+    SELECT c.id, 'saga', p.node_id, p.book_id, 2, p.id_path || c.id || '/', p.url_path || '/sagas/' || c.slug
+    FROM sagas c JOIN content_paths p ON p.node_id = c.volume_id;
+    INSERT INTO content_paths
+    SELECT c.id, 'arc', p.node_id, p.book_id, 3, p.id_path || c.id || '/', p.url_path || '/arcs/' || c.slug
+    FROM arcs c JOIN content_paths p ON p.node_id = c.saga_id;
+    INSERT INTO content_paths
+    SELECT c.id, 'issue', p.node_id, p.book_id, 4, p.id_path || c.id || '/', p.url_path || '/issues/' || c.slug
+    FROM issues c JOIN content_paths p ON p.node_id = c.arc_id;
+    INSERT INTO content_paths
+    SELECT c.id, 'chapter', p.node_id, p.book_id, 5, p.id_path || c.id || '/', p.url_path || '/chapters/' || c.slug
+    FROM chapters c JOIN content_paths p ON p.node_id = c.issue_id;
 END;
-$$ LANGUAGE plpgsql;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION rebuild_content_paths() FROM PUBLIC, anon, authenticated;
 
 -- Function to check if user has access to content
 CREATE OR REPLACE FUNCTION user_has_content_access(
@@ -498,37 +928,448 @@ BEGIN
     -- Check if content requires subscription
     CASE content_type
         WHEN 'chapter' THEN
-            SELECT COALESCE(c.subscription_required, i.subscription_required, false)
-            INTO requires_subscription
-            FROM chapters c
-            JOIN issues i ON i.id = c.issue_id
-            WHERE c.id = content_id_param;
-
+            SELECT effective_subscription_required INTO requires_subscription
+            FROM chapters WHERE id = content_id_param;
+        
         WHEN 'issue' THEN
             SELECT subscription_required INTO requires_subscription
             FROM issues WHERE id = content_id_param;
-
+        
         ELSE
             requires_subscription := false;
     END CASE;
-
+    
     -- If no subscription required, access granted
     IF NOT requires_subscription THEN
         RETURN true;
     END IF;
-
-    -- Check if user has active subscription
+    
+    -- Check if user is entitled right now
     SELECT EXISTS (
-        SELECT 1 FROM subscriptions s 
-        WHERE s.user_id = user_id_param 
-        AND s.status = 'active' 
-        AND (s.end_date IS NULL OR s.end_date > NOW())
+        SELECT 1 FROM user_entitlements e
+        WHERE e.user_id = user_id_param
+        AND e.premium_until > NOW()
     ) INTO user_has_subscription;
-
+    
     RETURN user_has_subscription;
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function to record a batch of reading progress updates for the calling
+-- user (the reader's buffered scroll positions). Updates are
+-- [{chapter_id, progress_percentage, last_read_position, last_read_at}, ...];
+-- per chapter the highest percentage and the latest position win, both
+-- within the batch and against the stored row, and rows that would not
+-- change are not rewritten. Returns the number of rows written.
+CREATE OR REPLACE FUNCTION record_reading_progress(updates JSONB)
+RETURNS INTEGER AS $$
+    WITH batch AS (
+        SELECT u.chapter_id,
+               LEAST(GREATEST(u.progress_percentage, 0), 100) AS progress_percentage,
+               COALESCE(u.last_read_position, 0) AS last_read_position,
+               LEAST(COALESCE(u.last_read_at, NOW()), NOW()) AS last_read_at
+        FROM jsonb_to_recordset(updates) AS u(
+            chapter_id UUID,
+            progress_percentage DECIMAL(5,2),
+            last_read_position INTEGER,
+            last_read_at TIMESTAMPTZ
+        )
+        WHERE u.chapter_id IS NOT NULL AND u.progress_percentage IS NOT NULL
+    ),
+    latest AS (
+        SELECT chapter_id,
+               MAX(progress_percentage) AS progress_percentage,
+               (ARRAY_AGG(last_read_position ORDER BY last_read_at DESC))[1] AS last_read_position,
+               MAX(last_read_at) AS last_read_at
+        FROM batch
+        GROUP BY chapter_id
+    ),
+    written AS (
+        INSERT INTO reading_progress AS r
+            (user_id, chapter_id, progress_percentage, last_read_position, completed, last_read_at)
+        SELECT auth.uid(), l.chapter_id, l.progress_percentage, l.last_read_position,
+               l.progress_percentage >= 100, l.last_read_at
+        FROM latest l
+        JOIN chapters c ON c.id = l.chapter_id
+        WHERE auth.uid() IS NOT NULL
+        ON CONFLICT (user_id, chapter_id) DO UPDATE SET
+            progress_percentage = GREATEST(r.progress_percentage, EXCLUDED.progress_percentage),
+            last_read_position = CASE WHEN EXCLUDED.last_read_at >= COALESCE(r.last_read_at, '-infinity')
+                                      THEN EXCLUDED.last_read_position ELSE r.last_read_position END,
+            completed = COALESCE(r.completed, false) OR EXCLUDED.completed,
+            last_read_at = GREATEST(r.last_read_at, EXCLUDED.last_read_at)
+        WHERE EXCLUDED.progress_percentage > COALESCE(r.progress_percentage, 0)
+        OR EXCLUDED.last_read_at > COALESCE(r.last_read_at, '-infinity')
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM written;
+$$ LANGUAGE sql SECURITY DEFINER SET search_path = public;
+
+-- ==================================================
+-- CHAPTER REVISION STORE
+-- ==================================================
+
+-- Function to diff two texts line by line into the ops apply_revision_delta()
+-- replays: a positive number copies that many base lines, a negative one
+-- skips base lines, an array inserts its lines. Greedy, in one pass: a line
+-- that is not the next base line is matched further ahead only when it
+-- occurs once in the rest of the base, so repeated lines (blank lines,
+-- jsonb_pretty() braces) are inserted rather than used as anchors.
+-- A NULL target is encoded as JSON null.
+CREATE OR REPLACE FUNCTION revision_delta(base TEXT, target TEXT)
+RETURNS JSONB AS $$
+DECLARE
+    base_lines TEXT[] := CASE WHEN COALESCE(base, '') = '' THEN '{}' ELSE string_to_array(base, E'\n') END;
+    target_line TEXT;
+    base_pos INTEGER := 1;
+    found_at INTEGER;
+    copied INTEGER := 0;
+    inserted TEXT[] := '{}';
+    ops JSONB := '[]';
+BEGIN
+    IF target IS NULL THEN
+        RETURN 'null';
+    END IF;
+
+    FOREACH target_line IN ARRAY CASE WHEN target = '' THEN '{}' ELSE string_to_array(target, E'\n') END LOOP
+        IF base_lines[base_pos] = target_line THEN
+            found_at := base_pos;
+        ELSE
+            found_at := array_position(base_lines, target_line, base_pos);
+            IF found_at IS NOT NULL AND array_position(base_lines, target_line, found_at + 1) IS NOT NULL THEN
+                found_at := NULL;
+            END IF;
+        END IF;
+
+        IF found_at IS NULL THEN
+            IF copied > 0 THEN
+                ops := ops || to_jsonb(copied);
+                copied := 0;
+            END IF;
+            inserted := inserted || target_line;
+        ELSE
+            IF cardinality(inserted) > 0 THEN
+                ops := ops || jsonb_build_array(inserted);
+                inserted := '{}';
+            END IF;
+            IF found_at > base_pos THEN
+                IF copied > 0 THEN
+                    ops := ops || to_jsonb(copied);
+                    copied := 0;
+                END IF;
+                ops := ops || to_jsonb(base_pos - found_at);
+            END IF;
+            copied := copied + 1;
+            base_pos := found_at + 1;
+        END IF;
+    END LOOP;
+
+    IF copied > 0 THEN
+        ops := ops || to_jsonb(copied);
+    END IF;
+    IF cardinality(inserted) > 0 THEN
+        ops := ops || jsonb_build_array(inserted);
+    END IF;
+    RETURN ops;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Function to rebuild a text from its base and revision_delta() ops
+CREATE OR REPLACE FUNCTION apply_revision_delta(base TEXT, ops JSONB)
+RETURNS TEXT AS $$
+DECLARE
+    base_lines TEXT[] := CASE WHEN COALESCE(base, '') = '' THEN '{}' ELSE string_to_array(base, E'\n') END;
+    result_lines TEXT[] := '{}';
+    base_pos INTEGER := 1;
+    op JSONB;
+BEGIN
+    IF ops IS NULL OR jsonb_typeof(ops) = 'null' THEN
+        RETURN NULL;
+    END IF;
+
+    FOR op IN SELECT value FROM jsonb_array_elements(ops) WITH ORDINALITY ORDER BY ordinality LOOP
+        IF jsonb_typeof(op) = 'array' THEN
+            result_lines := result_lines || ARRAY(SELECT jsonb_array_elements_text(op));
+        ELSIF op::INTEGER > 0 THEN
+            result_lines := result_lines || base_lines[base_pos:base_pos + op::INTEGER - 1];
+            base_pos := base_pos + op::INTEGER;
+        ELSE
+            base_pos := base_pos - op::INTEGER;
+        END IF;
+    END LOOP;
+    RETURN array_to_string(result_lines, E'\n');
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Function to encode a revision against its chapter's latest keyframe.
+-- Returns the {"json": ops, "text": ops} delta (content_json is diffed as
+-- jsonb_pretty() text), or NULL when the revision should be stored as a
+-- keyframe: there is no keyframe yet, it is keyframe_interval or more
+-- versions old, or the delta is larger than max_delta_ratio of the content.
+CREATE OR REPLACE FUNCTION chapter_revision_delta(
+    keyframe_json JSONB,
+    keyframe_text TEXT,
+    versions_since_keyframe INTEGER,
+    content_json_param JSONB,
+    content_text_param TEXT,
+    keyframe_interval INTEGER DEFAULT 16,
+    max_delta_ratio NUMERIC DEFAULT 0.5
+)
+RETURNS JSONB AS $$
+DECLARE
+    delta JSONB;
+BEGIN
+    IF versions_since_keyframe IS NULL OR versions_since_keyframe >= keyframe_interval THEN
+        RETURN NULL;
+    END IF;
+
+    delta := jsonb_build_object(
+        'json', revision_delta(jsonb_pretty(keyframe_json), jsonb_pretty(content_json_param)),
+        'text', revision_delta(keyframe_text, content_text_param)
+    );
+    IF octet_length(delta::TEXT) > max_delta_ratio * (COALESCE(octet_length(content_json_param::TEXT), 0)
+                                                      + COALESCE(octet_length(content_text_param), 0)) THEN
+        RETURN NULL;
+    END IF;
+    RETURN delta;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Function to read one revision with its full content: a keyframe as
+-- stored, any other revision as its keyframe plus one delta
+CREATE OR REPLACE FUNCTION get_chapter_revision(chapter_id_param UUID, version_param INTEGER)
+RETURNS TABLE (
+    id UUID,
+    chapter_id UUID,
+    version_number INTEGER,
+    title VARCHAR(255),
+    content_json JSONB,
+    content_text TEXT,
+    content_url VARCHAR(500),
+    revision_notes TEXT,
+    created_by UUID,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT r.id, r.chapter_id, r.version_number, r.title,
+           CASE WHEN r.content_delta IS NULL THEN r.content_json
+                ELSE apply_revision_delta(jsonb_pretty(k.content_json), r.content_delta->'json')::JSONB END,
+           CASE WHEN r.content_delta IS NULL THEN r.content_text
+                ELSE apply_revision_delta(k.content_text, r.content_delta->'text') END,
+           r.content_url, r.revision_notes, r.created_by, r.created_at
+    FROM chapter_revisions r
+    LEFT JOIN chapter_revisions k ON k.chapter_id = r.chapter_id AND k.version_number = r.keyframe_version
+    WHERE r.chapter_id = chapter_id_param AND r.version_number = version_param;
+$$ LANGUAGE sql STABLE;
+
+-- Trigger function to store an inserted full snapshot as a delta when
+-- chapter_revision_delta() allows it. TG_ARGV: keyframe interval, max delta
+-- ratio. Rows inserted already encoded (content_delta set) are kept as is.
+CREATE OR REPLACE FUNCTION encode_chapter_revision()
+RETURNS TRIGGER AS $$
+DECLARE
+    keyframe RECORD;
+BEGIN
+    IF NEW.content_delta IS NOT NULL THEN
+        RETURN NEW;
+    END IF;
+
+    -- One revision per chapter is encoded at a time, and not while
+    -- compact_chapter_revisions() rewrites the chapter's revisions
+    PERFORM 1 FROM chapters WHERE id = NEW.chapter_id FOR NO KEY UPDATE;
+
+    SELECT r.version_number, r.content_json, r.content_text INTO keyframe
+    FROM chapter_revisions r
+    WHERE r.chapter_id = NEW.chapter_id AND r.content_delta IS NULL AND r.version_number < NEW.version_number
+    ORDER BY r.version_number DESC
+    LIMIT 1;
+
+    NEW.content_delta := chapter_revision_delta(
+        keyframe.content_json, keyframe.content_text, NEW.version_number - keyframe.version_number,
+        NEW.content_json, NEW.content_text, TG_ARGV[0]::INTEGER, TG_ARGV[1]::NUMERIC
+    );
+    IF NEW.content_delta IS NOT NULL THEN
+        NEW.keyframe_version := keyframe.version_number;
+        NEW.content_json := NULL;
+        NEW.content_text := NULL;
+    ELSE
+        NEW.keyframe_version := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER encode_chapter_revision BEFORE INSERT ON chapter_revisions
+    FOR EACH ROW EXECUTE FUNCTION encode_chapter_revision('16', '0.5');
+
+-- Function to (re-)encode all revisions of a chapter, oldest first, with
+-- the same keyframe rules as the trigger (converts full-snapshot history;
+-- rerun after changing the interval or ratio). Rows whose encoding does
+-- not change are not rewritten. Returns the number of delta rows.
+CREATE OR REPLACE FUNCTION compact_chapter_revisions(
+    chapter_id_param UUID,
+    keyframe_interval INTEGER DEFAULT 16,
+    max_delta_ratio NUMERIC DEFAULT 0.5
+)
+RETURNS INTEGER AS $$
+DECLARE
+    revision RECORD;
+    base_version INTEGER;
+    base_json JSONB;
+    base_text TEXT;
+    delta JSONB;
+    delta_count INTEGER := 0;
+BEGIN
+    PERFORM 1 FROM chapters WHERE id = chapter_id_param FOR NO KEY UPDATE;
+
+    -- The loop query reads every version's full content from the snapshot
+    -- taken when it starts, so rewriting rows as it goes is safe
+    FOR revision IN
+        SELECT f.version_number, f.content_json, f.content_text
+        FROM chapter_revisions r
+        CROSS JOIN LATERAL get_chapter_revision(r.chapter_id, r.version_number) f
+        WHERE r.chapter_id = chapter_id_param
+        ORDER BY r.version_number
+    LOOP
+        delta := chapter_revision_delta(base_json, base_text, revision.version_number - base_version,
+                                        revision.content_json, revision.content_text,
+                                        keyframe_interval, max_delta_ratio);
+        IF delta IS NULL THEN
+            base_version := revision.version_number;
+            base_json := revision.content_json;
+            base_text := revision.content_text;
+            UPDATE chapter_revisions r
+            SET content_json = revision.content_json, content_text = revision.content_text,
+                keyframe_version = NULL, content_delta = NULL
+            WHERE r.chapter_id = chapter_id_param AND r.version_number = revision.version_number
+            AND r.content_delta IS NOT NULL;
+        ELSE
+            delta_count := delta_count + 1;
+            UPDATE chapter_revisions r
+            SET content_json = NULL, content_text = NULL, keyframe_version = base_version, content_delta = delta
+            WHERE r.chapter_id = chapter_id_param AND r.version_number = revision.version_number
+            AND (r.keyframe_version IS DISTINCT FROM base_version OR r.content_delta IS DISTINCT FROM delta);
+        END IF;
+    END LOOP;
+    RETURN delta_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ==================================================
+-- ACTIVITY LOG PARTITIONS AND BATCHED WRITES
+-- ==================================================
+
+-- Function to create the monthly activity_log partitions from the current
+-- month up to months_ahead months ahead (UTC months). Rows of a new month that
+-- already landed in activity_log_default are moved into its partition.
+-- Returns the partitions created.
+CREATE OR REPLACE FUNCTION create_activity_log_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    month_start TIMESTAMP;
+    range_start TIMESTAMPTZ;
+    range_end TIMESTAMPTZ;
+    partition_name TEXT;
+BEGIN
+    FOR month_start IN
+        SELECT generate_series(
+            date_trunc('month', NOW() AT TIME ZONE 'UTC'),
+            date_trunc('month', NOW() AT TIME ZONE 'UTC') + make_interval(months => months_ahead),
+            INTERVAL '1 month'
+        )
+    LOOP
+        partition_name := 'activity_log_' || to_char(month_start, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+        range_start := month_start AT TIME ZONE 'UTC';
+        range_end := (month_start + INTERVAL '1 month') AT TIME ZONE 'UTC';
+
+        -- Created standalone, filled from the default partition, then attached:
+        -- attaching a range the default partition still holds rows for fails
+        EXECUTE format('CREATE TABLE %I (LIKE activity_log INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM activity_log_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            range_start, range_end, partition_name
+        );
+        EXECUTE format('ALTER TABLE activity_log ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                       partition_name, range_start, range_end);
+        -- Partitions are reachable directly; without policies only the owner can read them
+        EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', partition_name);
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Function to detach the monthly activity_log partitions that ended more
+-- than retention_months months ago. Detached partitions are kept as plain
+-- tables (for archiving) unless drop_detached is set. Returns the partitions
+-- detached.
+CREATE OR REPLACE FUNCTION detach_activity_log_partitions(
+    retention_months INTEGER DEFAULT 12,
+    drop_detached BOOLEAN DEFAULT false
+)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    partition_name TEXT;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'activity_log'::regclass
+        AND c.relname ~ '^activity_log_[0-9]{4}_[0-9]{2}$'
+        AND to_timestamp(right(c.relname, 7), 'YYYY_MM')::TIMESTAMP + INTERVAL '1 month'
+            <= date_trunc('month', NOW() AT TIME ZONE 'UTC') - make_interval(months => retention_months)
+        ORDER BY c.relname
+    LOOP
+        EXECUTE format('ALTER TABLE activity_log DETACH PARTITION %I', partition_name);
+        IF drop_detached THEN
+            EXECUTE format('DROP TABLE %I', partition_name);
+        END IF;
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Function for the scheduled partition upkeep; run it daily, e.g. with pg_cron:
+-- SELECT cron.schedule('activity-log-partitions', '0 3 * * *', 'SELECT maintain_activity_log_partitions()');
+CREATE OR REPLACE FUNCTION maintain_activity_log_partitions(
+    months_ahead INTEGER DEFAULT 3,
+    retention_months INTEGER DEFAULT 12
+)
+RETURNS VOID AS $$
+    SELECT create_activity_log_partitions(months_ahead);
+    SELECT detach_activity_log_partitions(retention_months);
+$$ LANGUAGE sql SECURITY DEFINER SET search_path = public;
+
+SELECT create_activity_log_partitions();
+
+-- Function to append a batch of reader activity events for the calling user
+-- (the client-side activity logger flushes its queue through this). Events are
+-- [{action_type, entity_type, entity_id, created_at}, ...]; only reader actions
+-- ('read', 'add_to_library') are accepted, anything else is skipped (content
+-- state changes are logged by the log_content_state_change trigger). created_at
+-- is clamped to at most NOW() and at most a day in the past.
+-- Returns the number of events written.
+CREATE OR REPLACE FUNCTION log_activity_batch(events JSONB)
+RETURNS INTEGER AS $$
+    WITH written AS (
+        INSERT INTO activity_log (user_id, action_type, entity_type, entity_id, created_at)
+        SELECT auth.uid(), e.action_type, e.entity_type, e.entity_id,
+               LEAST(GREATEST(COALESCE(e.created_at, NOW()), NOW() - INTERVAL '1 day'), NOW())
+        FROM jsonb_to_recordset(events) AS e(
+            action_type VARCHAR(50),
+            entity_type VARCHAR(20),
+            entity_id UUID,
+            created_at TIMESTAMPTZ
+        )
+        WHERE auth.uid() IS NOT NULL
+        AND e.action_type IN ('read', 'add_to_library')
+        AND e.entity_type IS NOT NULL AND e.entity_id IS NOT NULL
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM written;
+$$ LANGUAGE sql SECURITY DEFINER SET search_path = public;
+
 -- ==================================================
 -- SAMPLE DATA INSERTION
 -- ==================================================
@@ -0,0 +1,337 @@
+# Migrate chapter_revisions to the keyframe + delta revision store, and
+# benchmark it against full snapshots.
+#
+# The store itself lives in the database (novel_publishing_platform_schema.sql,
+# "CHAPTER REVISION STORE"): revisions are inserted as full snapshots and the
+# encode_chapter_revision trigger keeps every 16th one (or one whose delta
+# would be large) as a keyframe; the others are stored as a line delta against
+# their keyframe, so get_chapter_revision() rebuilds any version from one
+# keyframe and one delta. This tool:
+# - install: brings an existing database's chapter_revisions up to that
+#   layout (columns, constraints, functions, trigger) from the generated schema
+# - migrate: re-encodes existing full-snapshot history, one chapter per
+#   transaction, with compact_chapter_revisions()
+# - bench: seeds synthetic edit histories into a scratch schema and compares
+#   storage and read time before and after migrating
+#
+# Migrated rows free their space for reuse after VACUUM; VACUUM FULL
+# chapter_revisions returns it to the operating system.
+#
+# Usage:
+#   python revision_store.py install --dsn postgresql://localhost/zoroastervers
+#   python revision_store.py migrate --dsn $DATABASE_URL --dry-run
+#   python revision_store.py migrate --dsn $DATABASE_URL --keyframe-interval 16 --max-delta-ratio 0.5
+#   python revision_store.py bench --dsn $DATABASE_URL --chapters 50 --versions 40
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+
+from hierarchy_benchmark import SCHEMA_PATH, schema_statements, setup, summarize
+from schema_model import LEADING_NOISE
+
+BENCH_SCHEMA = "revision_bench"
+DEFAULT_KEYFRAME_INTERVAL = 16
+DEFAULT_MAX_DELTA_RATIO = 0.5
+
+REVISION_FUNCTIONS = (r"(?:revision_delta|apply_revision_delta|chapter_revision_delta|get_chapter_revision"
+                      r"|encode_chapter_revision|compact_chapter_revisions)")
+REVISION_STATEMENTS = re.compile(
+    r"CREATE\s+TABLE\s+chapter_revisions\b"
+    r"|CREATE\s+(?:UNIQUE\s+)?INDEX\s+\w+\s+ON\s+chapter_revisions\s*\("
+    r"|CREATE\s+TRIGGER\s+\w+\s+[^;]*?\s+ON\s+chapter_revisions\s"
+    rf"|CREATE\s+OR\s+REPLACE\s+FUNCTION\s+{REVISION_FUNCTIONS}\(",
+    re.I,
+)
+TABLE_OR_INDEX = re.compile(r"CREATE\s+(?:TABLE|(?:UNIQUE\s+)?INDEX)\b", re.I)
+TRIGGER_NAME = re.compile(r"CREATE\s+TRIGGER\s+(\w+)", re.I)
+
+# Brings a chapter_revisions table created before the revision store up to it
+UPGRADE_SQL = [
+    "ALTER TABLE chapter_revisions ADD COLUMN IF NOT EXISTS keyframe_version INTEGER, "
+    "ADD COLUMN IF NOT EXISTS content_delta JSONB",
+]
+UPGRADE_CONSTRAINTS = {
+    "chapter_revisions_keyframe_fkey":
+        "FOREIGN KEY (chapter_id, keyframe_version) REFERENCES chapter_revisions(chapter_id, version_number)",
+    "chapter_revisions_keyframe_check": "CHECK ((keyframe_version IS NULL) = (content_delta IS NULL))",
+}
+
+# Bytes the revision content takes as stored (after TOAST compression)
+CONTENT_BYTES_SQL = """
+    SELECT COUNT(*),
+           COUNT(*) FILTER (WHERE content_delta IS NULL),
+           COALESCE(SUM(COALESCE(pg_column_size(content_json), 0) + COALESCE(pg_column_size(content_text), 0)
+                        + COALESCE(pg_column_size(content_delta), 0)), 0)
+    FROM chapter_revisions
+"""
+FULL_READ_SQL = """
+    SELECT content_json, content_text FROM chapter_revisions WHERE chapter_id = %s AND version_number = %s
+"""
+STORE_READ_SQL = "SELECT content_json, content_text FROM get_chapter_revision(%s, %s)"
+
+WORDS = (
+    "the a of and to in was he she they it that with for as on at by from his her their light fire ash "
+    "temple river mountain star night dawn silence voice hand eyes path truth order chaos flame ancient "
+    "priest king warrior stranger city gate road wind shadow gold stone water blood oath memory dream "
+    "whispered turned looked remembered waited burned answered fell rose walked carried opened broke "
+    "slowly quietly never always again still beyond beneath across toward against within"
+).split()
+
+
+def connect(dsn):
+    try:
+        import psycopg2
+    except ImportError as exc:
+        raise RuntimeError("The revision store tool requires psycopg2 (pip install psycopg2-binary)") from exc
+    return psycopg2.connect(dsn)
+
+
+def install(cursor, schema_path=SCHEMA_PATH):
+    """Create or upgrade chapter_revisions and the revision store functions/trigger."""
+    statements = schema_statements(REVISION_STATEMENTS, schema_path)
+    cursor.execute("SELECT to_regclass(current_schema() || '.chapter_revisions') IS NOT NULL")
+    exists = cursor.fetchone()[0]
+    if exists:
+        for statement in UPGRADE_SQL:
+            cursor.execute(statement)
+        cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid = 'chapter_revisions'::regclass")
+        present = {row[0] for row in cursor.fetchall()}
+        for name, definition in UPGRADE_CONSTRAINTS.items():
+            if name not in present:
+                cursor.execute(f"ALTER TABLE chapter_revisions ADD CONSTRAINT {name} {definition}")
+
+    for statement in statements:
+        noise = LEADING_NOISE.match(statement)
+        head = statement[noise.end() if noise else 0:]
+        if exists and TABLE_OR_INDEX.match(head):
+            continue
+        trigger = TRIGGER_NAME.match(head)
+        if trigger:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger.group(1)} ON chapter_revisions")
+        cursor.execute(statement)
+
+
+def content_bytes(cursor):
+    """(revisions, keyframes, stored content bytes) of chapter_revisions."""
+    cursor.execute(CONTENT_BYTES_SQL)
+    return cursor.fetchone()
+
+
+def migrate(connection, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL, max_delta_ratio=DEFAULT_MAX_DELTA_RATIO,
+            dry_run=False, progress=None):
+    """Re-encode every chapter's revisions, committing per chapter (or rolling
+    everything back for a dry run). Returns content_bytes() before and after."""
+    with connection.cursor() as cursor:
+        before = content_bytes(cursor)
+        cursor.execute("SELECT DISTINCT chapter_id FROM chapter_revisions")
+        chapter_ids = [row[0] for row in cursor.fetchall()]
+        if not dry_run:
+            connection.commit()
+
+        for index, chapter_id in enumerate(chapter_ids, start=1):
+            cursor.execute("SELECT compact_chapter_revisions(%s, %s, %s)",
+                           (chapter_id, keyframe_interval, max_delta_ratio))
+            if not dry_run:
+                connection.commit()
+            if progress and (index % 100 == 0 or index == len(chapter_ids)):
+                progress(index, len(chapter_ids))
+
+        after = content_bytes(cursor)
+    if dry_run:
+        connection.rollback()
+    else:
+        connection.commit()
+    return before, after
+
+
+def synthetic_history(rng, paragraphs, versions):
+    """[(content_json or None, content_text or None)] per version: a chapter
+    drafted in markdown or in the rich editor, revised a few paragraphs at a
+    time with the occasional larger rewrite."""
+    def paragraph():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 120))).capitalize() + "."
+
+    body = [paragraph() for _ in range(paragraphs)]
+    rich = rng.random() < 0.5
+    history = []
+    for _ in range(versions):
+        edits = rng.randint(1, 4) if rng.random() > 0.05 else paragraphs // 3
+        for _ in range(edits):
+            position, roll = rng.randrange(len(body)), rng.random()
+            if roll < 0.6:
+                words = body[position].split()
+                words[rng.randrange(len(words))] = rng.choice(WORDS)
+                body[position] = " ".join(words)
+            elif roll < 0.85 or len(body) < 2:
+                body.insert(position, paragraph())
+            else:
+                del body[position]
+        if rich:
+            history.append(({"type": "doc", "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": text}]} for text in body
+            ]}, None))
+        else:
+            history.append((None, "\n\n".join(body)))
+    return history
+
+
+def time_reads(cursor, sql, samples):
+    latencies = []
+    for chapter_id, version in samples:
+        start = time.perf_counter()
+        cursor.execute(sql, (chapter_id, version))
+        cursor.fetchall()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def bench(connection, chapters, versions, paragraphs, sample_count, seed, keyframe_interval, max_delta_ratio,
+          schema_path=SCHEMA_PATH):
+    """Storage and read latency of full snapshots vs the migrated store."""
+    from psycopg2.extras import execute_values
+
+    rng = random.Random(seed)
+    results = {}
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        shape = {"books": 1, "volumes": 1, "sagas": 1, "arcs": 1, "issues": 1, "chapters": chapters}
+        setup(cursor, shape, schema_path, schema=BENCH_SCHEMA)
+        install(cursor, schema_path)
+        cursor.execute("SELECT id FROM chapters ORDER BY order_index")
+        chapter_ids = [row[0] for row in cursor.fetchall()]
+
+        # Today's layout: every revision a full snapshot
+        cursor.execute("ALTER TABLE chapter_revisions DISABLE TRIGGER encode_chapter_revision")
+        for chapter_id in chapter_ids:
+            rows = [(chapter_id, version, json.dumps(content_json) if content_json is not None else None, content_text)
+                    for version, (content_json, content_text)
+                    in enumerate(synthetic_history(rng, paragraphs, versions), start=1)]
+            execute_values(cursor, "INSERT INTO chapter_revisions (chapter_id, version_number, content_json, "
+                                   "content_text) VALUES %s", rows, template="(%s, %s, %s::jsonb, %s)")
+        cursor.execute("ALTER TABLE chapter_revisions ENABLE TRIGGER encode_chapter_revision")
+        cursor.execute("VACUUM ANALYZE chapter_revisions")
+        cursor.execute("SELECT pg_total_relation_size('chapter_revisions')")
+        table_before = cursor.fetchone()[0]
+
+        samples = [(rng.choice(chapter_ids), rng.randint(1, versions)) for _ in range(sample_count)]
+        expected = {}
+        for sample in samples:
+            cursor.execute(FULL_READ_SQL, sample)
+            expected[sample] = cursor.fetchone()
+        results["read a full snapshot"] = time_reads(cursor, FULL_READ_SQL, samples)
+
+    connection.autocommit = False
+    start = time.perf_counter()
+    before, after = migrate(connection, keyframe_interval, max_delta_ratio)
+    migrate_seconds = time.perf_counter() - start
+
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        cursor.execute("VACUUM FULL ANALYZE chapter_revisions")
+        cursor.execute("SELECT pg_total_relation_size('chapter_revisions')")
+        table_after = cursor.fetchone()[0]
+
+        # The store must give back exactly what was stored
+        for sample in samples:
+            cursor.execute(STORE_READ_SQL, sample)
+            if cursor.fetchone() != expected[sample]:
+                raise RuntimeError(f"get_chapter_revision{sample} differs from the stored snapshot")
+        results["read via get_chapter_revision"] = time_reads(cursor, STORE_READ_SQL, samples)
+
+        # Encoding cost on the write path: one new revision per chapter
+        rows = []
+        for chapter_id in chapter_ids:
+            cursor.execute(STORE_READ_SQL, (chapter_id, versions))
+            content_json, content_text = cursor.fetchone()
+            rows.append((chapter_id, versions + 1, json.dumps(content_json) if content_json is not None else None,
+                         content_text + "\n\nOne more paragraph." if content_text is not None else None))
+        latencies = []
+        for row in rows:
+            start = time.perf_counter()
+            cursor.execute("INSERT INTO chapter_revisions (chapter_id, version_number, content_json, content_text) "
+                           "VALUES (%s, %s, %s::jsonb, %s)", row)
+            latencies.append((time.perf_counter() - start) * 1000)
+        results["insert a revision (trigger encodes)"] = latencies
+
+    storage = {
+        "revisions": before[0],
+        "keyframes": after[1],
+        "content bytes": (before[2], after[2]),
+        "table bytes (with TOAST and indexes)": (table_before, table_after),
+        "migrate seconds": migrate_seconds,
+    }
+    return storage, results
+
+
+def _size(count):
+    return f"{count / 1024 / 1024:,.1f} MB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Migrate and benchmark the keyframe + delta chapter revision store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("install", "Add the revision store to an existing database"),
+                            ("migrate", "Re-encode existing revisions as keyframes + deltas"),
+                            ("bench", "Compare full snapshots with the revision store in a scratch schema")):
+        command = subparsers.add_parser(name, help=help_text)
+        command.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+        command.add_argument("--schema", default=SCHEMA_PATH, help="Generated schema SQL (script.py)")
+        if name != "install":
+            command.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL)
+            command.add_argument("--max-delta-ratio", type=float, default=DEFAULT_MAX_DELTA_RATIO)
+    subparsers.choices["migrate"].add_argument("--dry-run", action="store_true",
+                                               help="Report the savings, then roll back")
+    bench_parser = subparsers.choices["bench"]
+    bench_parser.add_argument("--chapters", type=int, default=50)
+    bench_parser.add_argument("--versions", type=int, default=40, help="Revisions per chapter")
+    bench_parser.add_argument("--paragraphs", type=int, default=80, help="Paragraphs per chapter")
+    bench_parser.add_argument("--samples", type=int, default=500, help="Reads timed per layout")
+    bench_parser.add_argument("--seed", type=int, default=7)
+    bench_parser.add_argument("--keep", action="store_true", help=f"Keep the {BENCH_SCHEMA} schema afterwards")
+    args = parser.parse_args(argv)
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    connection = connect(args.dsn)
+    try:
+        if args.command == "install":
+            with connection.cursor() as cursor:
+                install(cursor, args.schema)
+            connection.commit()
+            print("✅ chapter_revisions uses the keyframe + delta revision store")
+            return
+
+        if args.command == "migrate":
+            before, after = migrate(
+                connection, args.keyframe_interval, args.max_delta_ratio, args.dry_run,
+                progress=lambda done, total: print(f"- {done:,}/{total:,} chapters"),
+            )
+            action = "Would store" if args.dry_run else "Stored"
+            print(f"✅ {action} {after[0]:,} revisions as {after[1]:,} keyframes + {after[0] - after[1]:,} deltas: "
+                  f"{_size(before[2])} -> {_size(after[2])} of content")
+            return
+
+        print(f"Seeding {args.chapters * args.versions:,} revisions into {BENCH_SCHEMA}...")
+        storage, results = bench(connection, args.chapters, args.versions, args.paragraphs, args.samples,
+                                 args.seed, args.keyframe_interval, args.max_delta_ratio, args.schema)
+        print(f"- {storage['revisions']:,} revisions, {storage['keyframes']:,} keyframes after migrating "
+              f"({storage['migrate seconds']:.1f}s)")
+        for name in ("content bytes", "table bytes (with TOAST and indexes)"):
+            full, store = storage[name]
+            print(f"✅ {name:<38} {_size(full)} -> {_size(store)} ({1 - store / full:.0%} saved)")
+        for name, latencies in results.items():
+            print(f"✅ {name:<38} {summarize(latencies)}")
+
+        if not args.keep:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP SCHEMA {BENCH_SCHEMA} CASCADE")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
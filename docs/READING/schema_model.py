@@ -0,0 +1,479 @@
+# Table / column / foreign key model of a SQL schema, for the ER diagram.
+#
+# chart_script.py used to hardcode the entities and relationships of the
+# schema that script.py generates, and drifted from it (activity_log and
+# chapter_revisions were missing). This module reads the schema itself:
+# hand-written DDL like novel_publishing_platform_schema.sql as well as
+# pg_dump output like all_schemas.sql (UTF-16, quoted identifiers, keys added
+# by ALTER TABLE ... ADD CONSTRAINT).
+#
+# Parsing is incremental. The file is split into top-level statements (aware
+# of quotes, comments and $$ function bodies) and each statement is parsed
+# into a small fragment; both are cached in .build_cache/. After an edit only
+# the statements around the changed bytes are re-split, splitting stops as
+# soon as a statement boundary lines up with the old ones again, and only
+# statements whose text changed are re-parsed. An unchanged file is a single
+# digest comparison.
+#
+# Usage:
+#   python schema_model.py novel_publishing_platform_schema.sql
+#   python schema_model.py ../../all_schemas.sql --no-cache
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from bisect import bisect_right
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".build_cache")
+CACHE_VERSION = 2
+
+# Tokens that can hide a ";" from the statement splitter
+TOKEN = re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/|\$(?:[A-Za-z_]\w*)?\$|;""", re.S)
+LEADING_NOISE = re.compile(r"(?:\s+|--[^\n]*|/\*.*?\*/)+", re.S)
+# Comments go before a definition is split, or their commas, parentheses and
+# apostrophes would be read as SQL; quoted text is matched so it is kept
+COMMENT_OR_QUOTED = re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/""", re.S)
+NAME = r'(?:"(?:[^"]|"")+"|[\w$]+)(?:\s*\.\s*(?:"(?:[^"]|"")+"|[\w$]+))?'
+
+CREATE_TABLE = re.compile(
+    rf"CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?({NAME})\s*",
+    re.I,
+)
+PARTITION_OF = re.compile(rf"PARTITION\s+OF\s+({NAME})", re.I)
+ALTER_TABLE = re.compile(rf"ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?({NAME})\s+(.*)", re.I | re.S)
+DROP_TABLE = re.compile(rf"DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?({NAME}(?:\s*,\s*{NAME})*)", re.I)
+ADD_CONSTRAINT = re.compile(rf"ADD\s+(?:CONSTRAINT\s+{NAME}\s+)?(.*)", re.I | re.S)
+ADD_TABLE_CONSTRAINT = re.compile(r"ADD\s+(?:CONSTRAINT|PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|CHECK|EXCLUDE)\b", re.I)
+ADD_COLUMN = re.compile(r"ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(.*)", re.I | re.S)
+DROP_COLUMN = re.compile(rf"DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?({NAME})", re.I)
+PRIMARY_KEY = re.compile(r"PRIMARY\s+KEY\s*\(([^)]*)\)", re.I)
+FOREIGN_KEY = re.compile(rf"FOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+({NAME})\s*(?:\(([^)]*)\))?", re.I)
+INLINE_REFERENCES = re.compile(rf"REFERENCES\s+({NAME})\s*(?:\(([^)]*)\))?", re.I)
+INLINE_PRIMARY_KEY = re.compile(r"\bPRIMARY\s+KEY\b", re.I)
+TABLE_CONSTRAINT = re.compile(r"(?:CONSTRAINT|PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|CHECK|EXCLUDE|LIKE)\b", re.I)
+# Where a column's type ends and its constraints begin
+COLUMN_OPTIONS = re.compile(
+    r"\s(?:NOT\s+NULL|NULL|DEFAULT|PRIMARY\s+KEY|REFERENCES|UNIQUE|CHECK|CONSTRAINT|GENERATED|COLLATE)\b", re.I
+)
+
+
+def read_schema(path):
+    """Schema text, whichever of UTF-8 / UTF-16 (pg_dump on Windows) it is in."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return raw.decode("utf-16")
+    return raw.decode("utf-8-sig")
+
+
+def identifier(name):
+    """`"public"."Books"` -> `Books`; tables outside public keep their schema."""
+    parts = [part.strip() for part in re.findall(r'"(?:[^"]|"")+"|[^."\s]+', name)]
+    parts = [part[1:-1].replace('""', '"') if part.startswith('"') else part.lower() for part in parts]
+    if len(parts) == 2 and parts[0] == "public":
+        parts = parts[1:]
+    return ".".join(parts)
+
+
+def column_list(text):
+    return [identifier(name) for name in text.split(",") if name.strip()] if text else []
+
+
+def strip_comments(text):
+    return COMMENT_OR_QUOTED.sub(lambda match: " " if match.group()[0] in "-/" else match.group(), text)
+
+
+def split_top_level(body):
+    """Split a parenthesised definition list at commas outside parentheses."""
+    items, depth, start = [], 0, 0
+    for match in re.finditer(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|[(),]""", body):
+        token = match.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif token == "," and depth == 0:
+            items.append(body[start:match.start()].strip())
+            start = match.end()
+    items.append(body[start:].strip())
+    return [item for item in items if item]
+
+
+def _closing_paren(text, start):
+    depth = 0
+    for match in re.finditer(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|[()]""", text[start:]):
+        if match.group() == "(":
+            depth += 1
+        elif match.group() == ")":
+            depth -= 1
+            if depth == 0:
+                return start + match.start()
+    return len(text)
+
+
+def split_statements(text, start=0, stop_at=None):
+    """End offsets of the top-level statements from `start` on.
+
+    `stop_at(end)` is asked after every boundary; when it returns True the
+    caller already knows the boundaries that follow and splitting stops.
+    """
+    ends, pos = [], start
+    search = TOKEN.search
+    while True:
+        match = search(text, pos)
+        if match is None:
+            break
+        token = match.group()
+        if token == ";":
+            pos = match.end()
+            ends.append(pos)
+            if stop_at is not None and stop_at(pos):
+                return ends, True
+        elif token[0] == "$":
+            close = text.find(token, match.end())
+            pos = len(text) if close < 0 else close + len(token)
+        else:
+            pos = match.end()
+    if text[pos:].strip() and (not ends or ends[-1] != len(text)):
+        ends.append(len(text))
+    return ends, False
+
+
+def _parse_column(item):
+    match = re.match(r'("(?:[^"]|"")+"|[\w$]+)\s+(.*)', item, re.S)
+    if not match:
+        return None
+    rest = " " + match.group(2)
+    options = COLUMN_OPTIONS.search(rest)
+    column_type = rest[:options.start() if options else len(rest)].strip()
+    column = {
+        "name": identifier(match.group(1)),
+        "type": re.sub(r'"([^"]+)"', r"\1", " ".join(column_type.split())),
+        "primary_key": bool(INLINE_PRIMARY_KEY.search(rest)),
+    }
+    references = INLINE_REFERENCES.search(rest)
+    if references:
+        column["references"] = [identifier(references.group(1)), column_list(references.group(2))]
+    return column
+
+
+def _parse_constraint(item):
+    primary = PRIMARY_KEY.search(item)
+    if primary:
+        return {"kind": "primary_key", "columns": column_list(primary.group(1))}
+    foreign = FOREIGN_KEY.search(item)
+    if foreign:
+        return {"kind": "foreign_key", "columns": column_list(foreign.group(1)),
+                "references": identifier(foreign.group(2)), "ref_columns": column_list(foreign.group(3))}
+    return None
+
+
+def parse_statement(statement):
+    """Fragment for one statement, or None when it does not shape the model."""
+    noise = LEADING_NOISE.match(statement)
+    if noise:
+        statement = statement[noise.end():]
+    head = statement[:12].upper()
+
+    if head.startswith("CREATE"):
+        match = CREATE_TABLE.match(statement)
+        if not match:
+            return None
+        table = identifier(match.group(1))
+        rest = strip_comments(statement[match.end():])
+        partition = PARTITION_OF.match(rest)
+        if partition:
+            return {"op": "partition", "table": table, "parent": identifier(partition.group(1))}
+        if not rest.startswith("("):
+            return None
+        close = _closing_paren(rest, 0)
+        columns, constraints = [], []
+        for item in split_top_level(rest[1:close]):
+            if TABLE_CONSTRAINT.match(item):
+                constraint = _parse_constraint(item)
+                if constraint:
+                    constraints.append(constraint)
+            else:
+                column = _parse_column(item)
+                if column:
+                    columns.append(column)
+        partitioned = bool(re.match(r"\s*PARTITION\s+BY", rest[close + 1:], re.I))
+        return {"op": "create", "table": table, "columns": columns, "constraints": constraints,
+                "partitioned": partitioned}
+
+    if head.startswith("ALTER"):
+        match = ALTER_TABLE.match(strip_comments(statement))
+        if not match:
+            return None
+        table, actions = identifier(match.group(1)), []
+        for action in split_top_level(match.group(2).rstrip(" ;\n")):
+            upper = action[:16].upper()
+            if ADD_TABLE_CONSTRAINT.match(action):
+                constraint = _parse_constraint(ADD_CONSTRAINT.match(action).group(1))
+                if constraint:
+                    actions.append(constraint)
+            elif upper.startswith("ADD"):
+                column = _parse_column(ADD_COLUMN.match(action).group(1))
+                if column:
+                    actions.append({"kind": "column", "column": column})
+            elif upper.startswith("DROP") and not upper.startswith("DROP CONSTRAINT"):
+                drop = DROP_COLUMN.match(action)
+                if drop:
+                    actions.append({"kind": "drop_column", "column": identifier(drop.group(1))})
+        return {"op": "alter", "table": table, "actions": actions} if actions else None
+
+    if head.startswith("DROP"):
+        match = DROP_TABLE.match(statement)
+        if match:
+            return {"op": "drop", "tables": [identifier(name) for name in re.findall(NAME, match.group(1))]}
+    return None
+
+
+def statement_key(statement):
+    return hashlib.sha1(statement.encode("utf-8")).hexdigest()
+
+
+def build_model(fragments):
+    """Apply fragments in file order: {"tables": {name: {...}}, "foreign_keys": [...]}."""
+    tables = {}
+
+    def add_constraint(table, constraint):
+        entry = tables.get(table)
+        if entry is None:
+            return
+        if constraint["kind"] == "primary_key":
+            entry["primary_key"] = constraint["columns"]
+        elif constraint["kind"] == "foreign_key":
+            entry["foreign_keys"].append({"columns": constraint["columns"], "references": constraint["references"],
+                                          "ref_columns": constraint["ref_columns"]})
+
+    def add_column(table, column):
+        tables[table]["columns"].append(column)
+        if column["primary_key"]:
+            add_constraint(table, {"kind": "primary_key", "columns": [column["name"]]})
+        if "references" in column:
+            table_name, ref_columns = column["references"]
+            add_constraint(table, {"kind": "foreign_key", "columns": [column["name"]],
+                                   "references": table_name, "ref_columns": ref_columns})
+
+    for fragment in fragments:
+        if fragment is None:
+            continue
+        op = fragment["op"]
+        if op == "create":
+            tables[fragment["table"]] = {"columns": [], "primary_key": [], "foreign_keys": [],
+                                         "partitioned": fragment["partitioned"], "partitions": []}
+            for column in fragment["columns"]:
+                add_column(fragment["table"], column)
+            for constraint in fragment["constraints"]:
+                add_constraint(fragment["table"], constraint)
+        elif op == "partition":
+            if fragment["parent"] in tables:
+                tables[fragment["parent"]]["partitions"].append(fragment["table"])
+        elif op == "alter" and fragment["table"] in tables:
+            entry = tables[fragment["table"]]
+            for action in fragment["actions"]:
+                if action["kind"] == "column":
+                    add_column(fragment["table"], action["column"])
+                elif action["kind"] == "drop_column":
+                    entry["columns"] = [column for column in entry["columns"] if column["name"] != action["column"]]
+                else:
+                    add_constraint(fragment["table"], action)
+        elif op == "drop":
+            for table in fragment["tables"]:
+                tables.pop(table, None)
+
+    foreign_keys = [
+        {"table": name, **foreign_key}
+        for name, entry in tables.items()
+        for foreign_key in entry["foreign_keys"]
+    ]
+    return {"tables": tables, "foreign_keys": foreign_keys}
+
+
+def _common_prefix(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix(a, b, limit):
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:] == b[len(b) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def resplit(old_text, old_ends, text):
+    """Statement ends of `text`, re-splitting only around what changed since `old_text`."""
+    prefix = _common_prefix(old_text, text)
+    suffix = _common_suffix(old_text, text, min(len(old_text), len(text)) - prefix)
+    shift = len(text) - len(old_text)
+
+    # Boundaries before the first changed byte still hold; restart from the last one
+    kept = old_ends[:bisect_right(old_ends, prefix)]
+    # Old boundaries inside the unchanged tail, in new offsets: reaching one of
+    # them means the rest of the file splits exactly as before
+    tail_start = len(text) - suffix
+    old_tail = {end + shift for end in old_ends if end + shift > tail_start}
+
+    ends, synced = split_statements(text, kept[-1] if kept else 0, lambda end: end in old_tail)
+    if synced:
+        ends += [end + shift for end in old_ends if end + shift > ends[-1]]
+    return kept + ends
+
+
+def _cache_path(path, cache_dir):
+    name = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"schema_model-{name}.json")
+
+
+def load_model(path, cache_dir=DEFAULT_CACHE_DIR, use_cache=True, stats=None):
+    """Model of the schema in `path`, reusing what the cache knows about it.
+
+    `stats`, when given, is filled with how many statements were re-parsed.
+    """
+    text = read_schema(path)
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    cache_path = _cache_path(path, cache_dir)
+
+    cache = None
+    if use_cache and os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") != CACHE_VERSION:
+            cache = None
+    if cache and cache["digest"] == digest:
+        if stats is not None:
+            stats.update(statements=len(cache["ends"]), parsed=0)
+        return cache["model"]
+
+    if cache:
+        ends = resplit(cache["text"], cache["ends"], text)
+        known = cache["fragments"]
+    else:
+        ends, known = split_statements(text)[0], {}
+
+    fragments, keys, parsed = {}, [], 0
+    start = 0
+    for end in ends:
+        statement = text[start:end]
+        start = end
+        key = statement_key(statement)
+        keys.append(key)
+        if key in fragments:
+            continue
+        if key in known:
+            fragments[key] = known[key]
+        else:
+            fragments[key] = parse_statement(statement)
+            parsed += 1
+
+    model = build_model(fragments[key] for key in keys)
+    if stats is not None:
+        stats.update(statements=len(ends), parsed=parsed)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        # json.dumps (C encoder) rather than json.dump: several times faster here
+        f.write(json.dumps({"version": CACHE_VERSION, "digest": digest, "text": text, "ends": ends,
+                            "fragments": fragments, "model": model}))
+    os.replace(tmp_path, cache_path)
+    return model
+
+
+def layers(model):
+    """Depth of each table below the tables it references (roots are 0).
+
+    Self references and references to tables outside the schema are ignored;
+    a reference that closes a cycle does not add depth.
+    """
+    tables = model["tables"]
+    parents = {
+        name: sorted({foreign_key["references"] for foreign_key in entry["foreign_keys"]
+                      if foreign_key["references"] in tables and foreign_key["references"] != name})
+        for name, entry in tables.items()
+    }
+    depth, visiting = {}, set()
+
+    def visit(name):
+        if name in depth:
+            return depth[name]
+        if name in visiting:
+            return -1
+        visiting.add(name)
+        depth[name] = 1 + max((visit(parent) for parent in parents[name]), default=-1)
+        visiting.discard(name)
+        return depth[name]
+
+    for name in tables:
+        visit(name)
+    return depth
+
+
+def layered_positions(model, spacing=1.5):
+    """{table: (x, y)}: one row per layer (top to bottom), each row centred and
+    ordered by the mean x of the tables it references to keep lines short."""
+    depth = layers(model)
+    parents = {
+        name: [foreign_key["references"] for foreign_key in entry["foreign_keys"]
+               if foreign_key["references"] in depth and foreign_key["references"] != name]
+        for name, entry in model["tables"].items()
+    }
+    positions = {}
+    for layer in range(max(depth.values(), default=-1) + 1):
+        row = [name for name in model["tables"] if depth[name] == layer]
+
+        def barycenter(name):
+            xs = [positions[parent][0] for parent in parents[name] if parent in positions]
+            return sum(xs) / len(xs) if xs else 0.0
+
+        row.sort(key=barycenter)
+        for index, name in enumerate(row):
+            positions[name] = ((index - (len(row) - 1) / 2) * spacing, -layer)
+    return positions
+
+
+def relationships(model):
+    """(parent, child) pairs, one per referencing table pair, for 1:M lines."""
+    pairs = []
+    for foreign_key in model["foreign_keys"]:
+        pair = (foreign_key["references"], foreign_key["table"])
+        if pair[0] in model["tables"] and pair[0] != pair[1] and pair not in pairs:
+            pairs.append(pair)
+    return pairs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parse a SQL schema into the ER diagram model")
+    parser.add_argument("path", help="Schema SQL file (UTF-8 or UTF-16)")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every statement again")
+    args = parser.parse_args(argv)
+
+    stats = {}
+    start = time.perf_counter()
+    model = load_model(args.path, use_cache=not args.no_cache, stats=stats)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {len(model['tables'])} tables, {len(model['foreign_keys'])} foreign keys "
+          f"({stats['parsed']}/{stats['statements']} statements parsed in {elapsed * 1000:.1f} ms)")
+    for name, layer in sorted(layers(model).items(), key=lambda item: (item[1], item[0])):
+        print(f"- [{layer}] {name} ({len(model['tables'][name]['columns'])} columns)")
+
+
+if __name__ == "__main__":
+    main()
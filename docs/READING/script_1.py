@@ -80,6 +80,7 @@ export interface Database {
           content_url: string | null
           release_date: string | null
           subscription_required: boolean | null
+          effective_subscription_required: boolean
           state: 'draft' | 'scheduled' | 'published' | 'archived'
           word_count: number
           estimated_reading_time: number
@@ -188,6 +189,23 @@ export interface Database {
           added_at?: string
         }
       }
+      user_entitlements: {
+        Row: {
+          user_id: string
+          premium_until: string | null
+          refreshed_at: string
+        }
+        Insert: {
+          user_id: string
+          premium_until?: string | null
+          refreshed_at?: string
+        }
+        Update: {
+          user_id?: string
+          premium_until?: string | null
+          refreshed_at?: string
+        }
+      }
     }
   }
 }
@@ -201,11 +219,26 @@ type Json = string | number | boolean | null | { [key: string]: Json | undefined
 // lib/services/content.ts
 import { supabase } from '../supabase'
 import { Database } from '../database.types'
+import { readingProgressBuffer } from './readingProgress'
+import { activityLogger } from './activityLog'
 
 type Book = Database['public']['Tables']['books']['Row']
 type Chapter = Database['public']['Tables']['chapters']['Row']
 type Profile = Database['public']['Tables']['profiles']['Row']
 
+// Table-of-contents entry (get_book_skeleton / get_content_children)
+type ContentNodeRow = {
+  id: string
+  parent_id: string | null
+  node_type: 'book' | 'volume' | 'saga' | 'arc' | 'issue' | 'chapter'
+  title: string
+  slug: string
+  order_index: number
+  state: 'draft' | 'scheduled' | 'published' | 'archived'
+  chapter_count?: number | null
+}
+type ContentNode = ContentNodeRow & { children: ContentNode[] }
+
 export class ContentService {
   // Get all published books for library
   static async getPublishedBooks(): Promise<Book[]> {
@@ -219,32 +252,70 @@ export class ContentService {
     return data || []
   }
 
-  // Get book with full hierarchy
-  static async getBookWithHierarchy(bookSlug: string) {
-    const { data: book, error: bookError } = await supabase
-      .from('books')
-      .select(`
-        *,
-        volumes(
-          *,
-          sagas(
-            *,
-            arcs(
-              *,
-              issues(
-                *,
-                chapters(*)
-              )
-            )
-          )
-        )
-      `)
-      .eq('slug', bookSlug)
-      .eq('state', 'published')
-      .single()
+  // Get a book's table of contents: the skeleton of every published level
+  // down to issues (ids, titles, slugs, order, state, chapter counts), never
+  // any chapter content. Chapters are loaded per issue with getChildren().
+  static async getBookSkeleton(
+    bookSlug: string
+  ): Promise<(ContentNode & Pick<Book, 'subtitle' | 'description' | 'cover_image'>) | null> {
+    const [{ data, error }, { data: header, error: headerError }] = await Promise.all([
+      supabase.rpc('get_book_skeleton', { book_slug: bookSlug }),
+      supabase
+        .from('books')
+        .select('subtitle, description, cover_image')
+        .eq('slug', bookSlug)
+        .eq('state', 'published')
+        .maybeSingle()
+    ])
+
+    if (error) throw error
+    if (headerError) throw headerError
+    if (!data || data.length === 0 || !header) return null
+
+    const nodes = new Map<string, ContentNode>()
+    for (const row of data as ContentNodeRow[]) {
+      nodes.set(row.id, { ...row, children: [] })
+    }
+
+    let book: ContentNode | null = null
+    for (const node of nodes.values()) {
+      const parent = node.parent_id ? nodes.get(node.parent_id) : undefined
+      if (parent) {
+        parent.children.push(node)
+      } else if (node.node_type === 'book') {
+        book = node
+      }
+    }
+    for (const node of nodes.values()) {
+      node.children.sort((a, b) => a.order_index - b.order_index || a.id.localeCompare(b.id))
+    }
+    return book && { ...book, ...header }
+  }
+
+  // Get one page of a node's published children (a book's volumes ... an
+  // issue's chapters); pass the returned cursor to get the next page
+  static async getChildren(
+    parentId: string,
+    cursor?: string | null,
+    pageSize: number = 50
+  ): Promise<{ items: ContentNodeRow[]; nextCursor: string | null }> {
+    // get_content_children caps pages at 200 rows
+    const size = Math.min(Math.max(pageSize, 1), 200)
+    const [afterOrderIndex, afterId] = cursor ? cursor.split(':') : [null, null]
+    const { data, error } = await supabase.rpc('get_content_children', {
+      parent_id_param: parentId,
+      after_order_index: afterOrderIndex === null ? null : Number(afterOrderIndex),
+      after_id: afterId,
+      page_size: size
+    })
 
-    if (bookError) throw bookError
-    return book
+    if (error) throw error
+    const items = (data || []) as ContentNodeRow[]
+    const last = items[items.length - 1]
+    return {
+      items,
+      nextCursor: items.length === size && last ? `${last.order_index}:${last.id}` : null
+    }
   }
 
   // Get chapter content with access control
@@ -257,45 +328,35 @@ export class ContentService {
     chapterSlug: string,
     userId?: string
   ): Promise<Chapter | null> {
-    // Build the query with all joins to validate the full path
+    // One round trip: path resolution, publish checks and the access decision
+    // all happen in get_chapter_by_path
     const { data, error } = await supabase
-      .from('chapters')
-      .select(`
-        *,
-        issues!inner(
-          *,
-          arcs!inner(
-            *,
-            sagas!inner(
-              *,
-              volumes!inner(
-                *,
-                books!inner(slug)
-              )
-            )
-          )
-        )
-      `)
-      .eq('slug', chapterSlug)
-      .eq('issues.slug', issueSlug)
-      .eq('issues.arcs.slug', arcSlug)
-      .eq('issues.arcs.sagas.slug', sagaSlug)
-      .eq('issues.arcs.sagas.volumes.slug', volumeSlug)
-      .eq('issues.arcs.sagas.volumes.books.slug', bookSlug)
-      .single()
+      .rpc('get_chapter_by_path', {
+        book_slug: bookSlug,
+        volume_slug: volumeSlug,
+        saga_slug: sagaSlug,
+        arc_slug: arcSlug,
+        issue_slug: issueSlug,
+        chapter_slug: chapterSlug,
+        user_id_param: userId ?? null
+      })
+      .maybeSingle()
 
     if (error) {
       console.error('Chapter access error:', error)
       return null
     }
 
-    // Check access permissions
-    const hasAccess = await this.checkContentAccess(data.id, 'chapter', userId)
-    if (!hasAccess) {
+    // Not found, or no access (the row then has no content fields)
+    if (!data?.has_access) {
       return null
     }
 
-    return data
+    const chapter = data.chapter as Chapter
+    if (userId) {
+      activityLogger.log(userId, { action_type: 'read', entity_type: 'chapter', entity_id: chapter.id })
+    }
+    return chapter
   }
 
   // Check if user has access to specific content
@@ -309,14 +370,11 @@ export class ContentService {
       if (contentType === 'chapter') {
         const { data } = await supabase
           .from('chapters')
-          .select(`
-            subscription_required,
-            issues!inner(subscription_required)
-          `)
+          .select('effective_subscription_required')
           .eq('id', contentId)
           .single()
 
-        return !data?.subscription_required && !data?.issues?.subscription_required
+        return data?.effective_subscription_required === false
       }
     }
 
@@ -350,6 +408,7 @@ export class ContentService {
       })
 
     if (error) throw error
+    activityLogger.log(userId, { action_type: 'add_to_library', entity_type: workType, entity_id: workId })
     return data
   }
 
@@ -365,29 +424,211 @@ export class ContentService {
     return data || []
   }
 
-  // Update reading progress
-  static async updateReadingProgress(
+  // Update reading progress. Buffered: the latest position and highest
+  // percentage per (user, chapter) are written in bulk by readingProgressBuffer
+  static updateReadingProgress(
     userId: string,
     chapterId: string,
     progressPercentage: number,
     lastReadPosition: number = 0
   ) {
-    const { data, error } = await supabase
-      .from('reading_progress')
-      .upsert({
-        user_id: userId,
-        chapter_id: chapterId,
-        progress_percentage: progressPercentage,
-        last_read_position: lastReadPosition,
-        completed: progressPercentage >= 100,
-        last_read_at: new Date().toISOString()
-      })
+    readingProgressBuffer.record(userId, chapterId, progressPercentage, lastReadPosition)
+  }
+}
 
-    if (error) throw error
-    return data
+// lib/services/readingProgress.ts
+// Coalesces reading progress updates in the browser. The reader reports its
+// position on every scroll event; instead of one reading_progress upsert per
+// event, only the latest position and the highest percentage per
+// (user, chapter) are kept and sent to /api/reading-progress/batch every
+// FLUSH_INTERVAL_MS and when the page is hidden or unloaded.
+import { supabase } from '../supabase'
+
+export type ReadingProgressUpdate = {
+  chapter_id: string
+  progress_percentage: number
+  last_read_position: number
+  last_read_at: string
+}
+
+const BATCH_ENDPOINT = '/api/reading-progress/batch'
+const FLUSH_INTERVAL_MS = 15000
+const MAX_BATCH_SIZE = 100 // keeps keepalive requests well under the 64 KB body limit
+
+class ReadingProgressBuffer {
+  private pending = new Map<string, ReadingProgressUpdate & { user_id: string }>()
+  private accessToken: string | null = null
+  private userId: string | null = null
+  private timer: ReturnType<typeof setInterval> | null = null
+
+  record(userId: string, chapterId: string, progressPercentage: number, lastReadPosition: number = 0) {
+    this.merge({
+      user_id: userId,
+      chapter_id: chapterId,
+      progress_percentage: Math.min(100, Math.max(0, progressPercentage)),
+      last_read_position: Math.round(lastReadPosition),
+      last_read_at: new Date().toISOString()
+    })
+    this.start()
+  }
+
+  // Send everything pending. keepalive lets the request outlive the page
+  // (pagehide); batches that fail to send or hit a server error go back into
+  // the buffer for the next flush.
+  async flush({ keepalive = false } = {}) {
+    if (!this.accessToken || this.pending.size === 0) return
+    const token = this.accessToken
+    const updates = Array.from(this.pending.values()).filter((update) => update.user_id === this.userId)
+    this.pending.clear()
+
+    for (let start = 0; start < updates.length; start += MAX_BATCH_SIZE) {
+      const batch = updates.slice(start, start + MAX_BATCH_SIZE)
+      try {
+        const response = await fetch(BATCH_ENDPOINT, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json', Authorization: `Bearer ${token}` },
+          body: JSON.stringify({ updates: batch.map(({ user_id, ...update }) => update) }),
+          keepalive
+        })
+        if (response.status >= 500) batch.forEach((update) => this.merge(update))
+      } catch (error) {
+        batch.forEach((update) => this.merge(update))
+      }
+    }
+  }
+
+  private merge(update: ReadingProgressUpdate & { user_id: string }) {
+    const key = `${update.user_id}:${update.chapter_id}`
+    const previous = this.pending.get(key)
+    if (!previous) {
+      this.pending.set(key, update)
+      return
+    }
+    const latest = update.last_read_at >= previous.last_read_at ? update : previous
+    this.pending.set(key, {
+      ...latest,
+      progress_percentage: Math.max(previous.progress_percentage, update.progress_percentage)
+    })
+  }
+
+  private start() {
+    if (this.timer || typeof window === 'undefined') return
+    this.timer = setInterval(() => this.flush(), FLUSH_INTERVAL_MS)
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush({ keepalive: true })
+    })
+    window.addEventListener('pagehide', () => this.flush({ keepalive: true }))
+
+    // The token is needed synchronously on pagehide, so track it here; a
+    // previous user's pending updates are sent with their token before it changes
+    supabase.auth.onAuthStateChange((_event, session) => {
+      if (session?.user.id !== this.userId) this.flush({ keepalive: true })
+      this.accessToken = session?.access_token ?? null
+      this.userId = session?.user.id ?? null
+    })
+  }
+}
+
+export const readingProgressBuffer = new ReadingProgressBuffer()
+
+// lib/services/activityLog.ts
+// Fire-and-forget activity logging. log() only queues the event under the
+// user it belongs to; the current user's queue is written with one
+// log_activity_batch call when it reaches MAX_BATCH_SIZE events, every
+// FLUSH_INTERVAL_MS, and when the page is hidden or unloaded, so no action
+// waits on an activity_log insert.
+import { supabase } from '../supabase'
+
+// Reader actions only; content state changes are logged by a database trigger
+export type ActivityEvent = {
+  action_type: 'read' | 'add_to_library'
+  entity_type: 'book' | 'volume' | 'saga' | 'arc' | 'issue' | 'chapter'
+  entity_id: string
+}
+
+type QueuedActivityEvent = ActivityEvent & { created_at: string }
+
+const RPC_ENDPOINT = `${process.env.NEXT_PUBLIC_SUPABASE_URL}/rest/v1/rpc/log_activity_batch`
+const MAX_BATCH_SIZE = 50
+const MAX_QUEUE_SIZE = 1000 // per user; oldest events are dropped beyond this (e.g. while offline)
+const FLUSH_INTERVAL_MS = 5000
+
+class ActivityLogger {
+  private queues = new Map<string, QueuedActivityEvent[]>()
+  private accessToken: string | null = null
+  private userId: string | null = null
+  private timer: ReturnType<typeof setInterval> | null = null
+
+  log(userId: string, event: ActivityEvent) {
+    const queue = this.queues.get(userId) ?? []
+    queue.push({ ...event, created_at: new Date().toISOString() })
+    if (queue.length > MAX_QUEUE_SIZE) queue.splice(0, queue.length - MAX_QUEUE_SIZE)
+    this.queues.set(userId, queue)
+    this.start()
+    if (queue.length >= MAX_BATCH_SIZE) this.flush()
+  }
+
+  // Send the signed-in user's queue with their own token, so events are
+  // always credited to the user who caused them. keepalive lets the request
+  // outlive the page (pagehide); batches that fail to send or hit a server
+  // error go back to the front of that user's queue. Events queued for
+  // anyone else cannot be written with this session and are dropped.
+  async flush({ keepalive = false } = {}) {
+    if (!this.accessToken || !this.userId) return
+    const token = this.accessToken
+    const userId = this.userId
+    const events = this.queues.get(userId) ?? []
+    this.queues.clear()
+
+    for (let start = 0; start < events.length; start += MAX_BATCH_SIZE) {
+      const batch = events.slice(start, start + MAX_BATCH_SIZE)
+      try {
+        const response = await fetch(RPC_ENDPOINT, {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            apikey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+            Authorization: `Bearer ${token}`
+          },
+          body: JSON.stringify({ events: batch }),
+          keepalive
+        })
+        if (response.status < 500) continue
+      } catch (error) {
+        console.error('Activity log error:', error)
+      }
+      this.requeue(userId, events.slice(start))
+      return
+    }
+  }
+
+  private requeue(userId: string, events: QueuedActivityEvent[]) {
+    const queue = [...events, ...(this.queues.get(userId) ?? [])]
+    if (queue.length > MAX_QUEUE_SIZE) queue.splice(0, queue.length - MAX_QUEUE_SIZE)
+    this.queues.set(userId, queue)
+  }
+
+  private start() {
+    if (this.timer || typeof window === 'undefined') return
+    this.timer = setInterval(() => this.flush(), FLUSH_INTERVAL_MS)
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush({ keepalive: true })
+    })
+    window.addEventListener('pagehide', () => this.flush({ keepalive: true }))
+
+    // The token is needed synchronously on pagehide, so track it here; a
+    // previous user's queued events are sent with their token before it
+    // changes (sign-out or account switch)
+    supabase.auth.onAuthStateChange((_event, session) => {
+      if (session?.user.id !== this.userId) this.flush({ keepalive: true })
+      this.accessToken = session?.access_token ?? null
+      this.userId = session?.user.id ?? null
+    })
   }
 }
 
+export const activityLogger = new ActivityLogger()
+
 // ==================================================
 // ADMIN SERVICE
 // ==================================================
@@ -435,7 +676,7 @@ export class AdminService {
 
   // Update content state
   static async updateContentState(
-    table: string,
+    table: 'books' | 'volumes' | 'sagas' | 'arcs' | 'issues' | 'chapters',
     id: string,
     state: 'draft' | 'scheduled' | 'published' | 'archived',
     publishAt?: string
@@ -451,6 +692,7 @@ export class AdminService {
       .single()
 
     if (error) throw error
+    // The log_content_state_change trigger records the change in activity_log
     return data
   }
 
@@ -692,6 +934,7 @@ export const LibraryCard: React.FC<LibraryCardProps> = ({
 // components/EbookReader.tsx
 import React, { useState, useEffect } from 'react'
 import { ContentService } from '../lib/services/content'
+import { readingProgressBuffer } from '../lib/services/readingProgress'
 import { useAuth } from '../hooks/useAuth'
 
 interface EbookReaderProps {
@@ -711,6 +954,10 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
 
   useEffect(() => {
     loadChapter()
+    // Progress is buffered; send this chapter's last position when leaving it
+    return () => {
+      readingProgressBuffer.flush()
+    }
   }, [chapterId])
 
   const loadChapter = async () => {
@@ -733,7 +980,7 @@ export const EbookReader: React.FC<EbookReaderProps> = ({
       onProgressUpdate(scrollPercentage)
     }
 
-    // Update reading progress in database
+    // Record reading progress (coalesced and written in batches)
     if (user && chapter) {
       ContentService.updateReadingProgress(
         user.id,
@@ -971,15 +1218,15 @@ export default function BookPage({ content, contentType, slugs }: BookPageProps)
         <p className="text-gray-700 mb-8">{content.description}</p>
       )}
 
-      {/* Navigation and children listing */}
-      {contentType === 'book' && content.volumes && (
+      {/* Navigation and children listing (table of contents skeleton) */}
+      {contentType === 'book' && content.children && (
         <div>
           <h3 className="text-2xl font-bold mb-4">Volumes</h3>
           <div className="grid gap-4">
-            {content.volumes.map((volume: any) => (
+            {content.children.map((volume: any) => (
               <div key={volume.id} className="border p-4 rounded">
                 <h4 className="font-bold">{volume.title}</h4>
-                {volume.description && <p className="text-gray-600">{volume.description}</p>}
+                <p className="text-gray-600">{volume.children.length} sagas</p>
               </div>
             ))}
           </div>
@@ -1000,7 +1247,11 @@ export const getServerSideProps: GetServerSideProps = async ({ params, req }) =>
     // Determine content type and fetch appropriate data
     if (slugs.length === 2 && slugs[0] === 'books') {
       // Book detail page: /library/books/[bookSlug]
-      const book = await ContentService.getBookWithHierarchy(slugs[1])
+      const book = await ContentService.getBookSkeleton(slugs[1])
+
+      if (!book) {
+        return { notFound: true }
+      }
       
       return {
         props: {
@@ -1038,6 +1289,44 @@ export const getServerSideProps: GetServerSideProps = async ({ params, req }) =>
   }
 }
 
+// pages/api/reading-progress/batch.ts
+// Batch endpoint for readingProgressBuffer: accepts { updates: [...] } (or a
+// bare array) and records them for the caller in one record_reading_progress
+// call. The user comes from the bearer token, never from the payload.
+import type { NextApiRequest, NextApiResponse } from 'next'
+import { createClient } from '@supabase/supabase-js'
+import { Database } from '../../../lib/database.types'
+
+const MAX_UPDATES = 500
+
+export default async function handler(req: NextApiRequest, res: NextApiResponse) {
+  if (req.method !== 'POST') {
+    res.setHeader('Allow', 'POST')
+    return res.status(405).json({ error: 'Method not allowed' })
+  }
+
+  const authorization = req.headers.authorization
+  if (!authorization?.startsWith('Bearer ')) {
+    return res.status(401).json({ error: 'Missing access token' })
+  }
+
+  const updates = Array.isArray(req.body) ? req.body : req.body?.updates
+  if (!Array.isArray(updates) || updates.length === 0 || updates.length > MAX_UPDATES) {
+    return res.status(400).json({ error: `Expected 1-${MAX_UPDATES} updates` })
+  }
+
+  // A per-request client acting as the reader, so auth.uid() is theirs
+  const supabase = createClient<Database>(
+    process.env.NEXT_PUBLIC_SUPABASE_URL!,
+    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    { global: { headers: { Authorization: authorization } }, auth: { persistSession: false } }
+  )
+  const { data, error } = await supabase.rpc('record_reading_progress', { updates })
+
+  if (error) return res.status(500).json({ error: error.message })
+  return res.status(200).json({ received: updates.length, written: data })
+}
+
 // ==================================================
 // ADMIN DASHBOARD COMPONENT
 // ==================================================
@@ -1149,8 +1438,8 @@ print(f"📄 Code file size: {len(nextjs_code_examples)} characters")
 print("\n🔍 Code examples include:")
 print("- Supabase client configuration")
 print("- TypeScript database types")
-print("- Data access layer (ContentService, AdminService)")
+print("- Data access layer (ContentService, AdminService, buffered reading progress)")
 print("- React hooks (useAuth, useLibrary)")
 print("- React components (LibraryCard, EbookReader)")
-print("- Next.js pages with SSR")
+print("- Next.js pages with SSR and a batch reading progress API route")
 print("- Admin dashboard functionality")
\ No newline at end of file
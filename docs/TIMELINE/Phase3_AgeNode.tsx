@@ -12,24 +12,24 @@ interface AgeNodeProps {
 
 export const AgeNode: React.FC<AgeNodeProps> = ({ age, radius, angle, index }) => {
   const { setSelectedAge, toggleExpansion, selectedAge } = useTimelineContext();
-
+  
   // Calculate position on the ring
   const radianAngle = (angle * Math.PI) / 180;
   const x = 192 + radius * Math.cos(radianAngle);
   const y = 192 + radius * Math.sin(radianAngle);
-
+  
   const GlyphComponent = AgeGlyphs[age.glyph as keyof typeof AgeGlyphs];
   const isSelected = selectedAge?.id === age.id;
-
+  
   const handleClick = () => {
     setSelectedAge(age);
     if (!isExpanded) toggleExpansion();
   };
-
+  
   return (
     <g className="age-node cursor-pointer group" onClick={handleClick}
        style={{ transformOrigin: '192px 192px' }}>
-
+      
       {/* Node Background Circle */}
       <circle
         cx={x} cy={y}
@@ -39,14 +39,14 @@ export const AgeNode: React.FC<AgeNodeProps> = ({ age, radius, angle, index }) =
         strokeWidth={isSelected ? 3 : 2}
         className="transition-all duration-300"
       />
-
+      
       {/* Glyph Icon */}
       <foreignObject x={x - 8} y={y - 8} width="16" height="16" className="pointer-events-none">
         {GlyphComponent && (
           <GlyphComponent className={`w-4 h-4 ${isSelected ? 'text-white' : 'text-timeline-gold'}`} />
         )}
       </foreignObject>
-
+      
       {/* Age Title on hover */}
       <text x={x} y={y + 35} textAnchor="middle"
             className="fill-current text-timeline-text font-medium text-xs opacity-0 group-hover:opacity-100 transition-opacity duration-300">
@@ -3,7 +3,7 @@ import { useTimelineContext } from '../../../contexts/TimelineContext';
 
 export const BreadcrumbCompass: React.FC = () => {
   const { selectedAge, setSelectedAge } = useTimelineContext();
-
+  
   return (
     <nav className="bg-timeline-card rounded-lg px-4 py-2 border border-timeline-border shadow-lg">
       <div className="flex items-center space-x-2 text-sm">
@@ -16,7 +16,7 @@ export const BreadcrumbCompass: React.FC = () => {
           </svg>
           Cosmic Timeline
         </button>
-
+        
         {/* Separator & Current Age */}
         {selectedAge && (
           <>
@@ -10,7 +10,7 @@ interface CodexEntryProps {
 
 export const CodexEntry: React.FC<CodexEntryProps> = ({ event, ageColor, onClose }) => {
   const GlyphComponent = AgeGlyphs[event.glyph as keyof typeof AgeGlyphs];
-
+  
   return (
     <div className="fixed inset-0 bg-black bg-opacity-70 flex items-center justify-center p-4 z-50">
       <div className="bg-timeline-card rounded-lg max-w-4xl w-full max-h-[90vh] overflow-auto border border-timeline-border shadow-2xl">
@@ -50,13 +50,13 @@ export const CodexEntry: React.FC<CodexEntryProps> = ({ event, ageColor, onClose
             </button>
           </div>
         </div>
-
+        
         {/* Content */}
         <div className="p-8">
           <div className="mb-6">
             <p className="text-timeline-text leading-relaxed text-lg">{event.description}</p>
           </div>
-
+          
           {event.details && (
             <div className="mb-6">
               <h3 className="text-xl font-semibold text-timeline-text mb-3">Chronicle Details</h3>
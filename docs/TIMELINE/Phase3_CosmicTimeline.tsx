@@ -7,7 +7,7 @@ import { useTimelineContext } from '../../contexts/TimelineContext';
 
 export const CosmicTimeline: React.FC = () => {
   const { isExpanded } = useTimelineContext();
-
+  
   return (
     <div className={`min-h-screen transition-all duration-700 ${
       isExpanded ? 'grid grid-cols-1 lg:grid-cols-3' : 'flex flex-col items-center justify-center'
@@ -25,13 +25,13 @@ export const CosmicTimeline: React.FC = () => {
           }} />
         ))}
       </div>
-
+      
       {/* Navigation Controls */}
       <div className="fixed top-4 right-4 z-50 flex space-x-4">
         <BreadcrumbCompass />
         <ModeToggle />
       </div>
-
+      
       {/* Main Content Area */}
       <div className={`flex items-center justify-center p-8 ${
         isExpanded ? 'lg:col-span-1' : ''
@@ -41,7 +41,7 @@ export const CosmicTimeline: React.FC = () => {
           <RingDial />
         </div>
       </div>
-
+      
       {/* Expandable Timeline Panel */}
       {isExpanded && (
         <div className="lg:col-span-2">
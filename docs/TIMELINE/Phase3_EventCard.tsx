@@ -12,7 +12,7 @@ interface EventCardProps {
 export const EventCard: React.FC<EventCardProps> = ({ event, index, ageColor }) => {
   const [isExpanded, setIsExpanded] = useState(false);
   const GlyphComponent = AgeGlyphs[event.glyph as keyof typeof AgeGlyphs];
-
+  
   return (
     <>
       <div className="event-card bg-timeline-card rounded-lg p-6 w-80 shadow-lg border border-timeline-border cursor-pointer"
@@ -22,7 +22,7 @@ export const EventCard: React.FC<EventCardProps> = ({ event, index, ageColor })
              borderLeftColor: ageColor,
              borderLeftWidth: '4px'
            }}>
-
+        
         {/* Event Header */}
         <div className="flex items-center mb-4">
           {GlyphComponent && (
@@ -35,10 +35,10 @@ export const EventCard: React.FC<EventCardProps> = ({ event, index, ageColor })
             <p className="text-sm text-timeline-text opacity-60">{event.date}</p>
           </div>
         </div>
-
+        
         {/* Event Description */}
         <p className="text-sm text-timeline-text mb-4 line-clamp-3">{event.description}</p>
-
+        
         {/* Event Tags */}
         <div className="flex flex-wrap gap-2 mb-4">
           {event.sagaarc && (
@@ -53,13 +53,13 @@ export const EventCard: React.FC<EventCardProps> = ({ event, index, ageColor })
             </span>
           )}
         </div>
-
+        
         {/* Hover Indicator */}
         <div className="text-xs text-timeline-text opacity-40 mt-4 text-center group-hover:opacity-100">
           Click to expand
         </div>
       </div>
-
+      
       {/* Expanded Modal */}
       {isExpanded && (
         <CodexEntry 
@@ -3,7 +3,7 @@ import { useTimelineContext } from '../../../contexts/TimelineContext';
 
 export const ModeToggle: React.FC = () => {
   const { themeMode, toggleTheme } = useTimelineContext();
-
+  
   return (
     <button onClick={toggleTheme} 
             className="bg-timeline-card border border-timeline-border rounded-lg p-2 shadow-lg hover:bg-timeline-border transition-colors"
@@ -7,7 +7,7 @@ import { useCosmicAnimation } from '../hooks/useCosmicAnimation';
 export const RingDial: React.FC = () => {
   const { ages, books, loading } = useTimelineData();
   const { rotationAngle } = useCosmicAnimation();
-
+  
   if (loading) {
     return (
       <div className="relative w-96 h-96 mx-auto flex items-center justify-center">
@@ -16,7 +16,7 @@ export const RingDial: React.FC = () => {
       </div>
     );
   }
-
+  
   return (
     <div className="relative w-96 h-96 mx-auto">
       <svg width="384" height="384" viewBox="0 0 384 384" 
@@ -25,7 +25,7 @@ export const RingDial: React.FC = () => {
              transform: `rotate(${rotationAngle}deg)`,
              filter: 'drop-shadow(0 0 20px var(--timeline-gold))'
            }}>
-
+        
         {/* Background Cosmic Circles */}
         {Array.from({ length: 9 }).map((_, index) => (
           <circle key={`bg-ring-${index}`}
@@ -33,7 +33,7 @@ export const RingDial: React.FC = () => {
                   fill="none" stroke="var(--timeline-gold)" strokeWidth="1"
                   opacity={0.1 + index * 0.05} />
         ))}
-
+        
         {/* Age Rings with Nodes */}
         {ages.map((age, index) => (
           <g key={age.id}>
@@ -41,7 +41,7 @@ export const RingDial: React.FC = () => {
             <circle cx="192" cy="192" r={60 + index * 25}
                     fill="none" stroke="var(--timeline-gold)" strokeWidth="2"
                     opacity="0.6" className="age-ring" />
-
+            
             {/* Age Node */}
             <AgeNode 
               age={age} 
@@ -51,7 +51,7 @@ export const RingDial: React.FC = () => {
             />
           </g>
         ))}
-
+        
         {/* Center Hub */}
         <circle cx="192" cy="192" r="30" fill="var(--timeline-gold)" opacity="0.8" />
         <circle cx="192" cy="192" r="20" fill="var(--timeline-bg)" 
@@ -61,7 +61,7 @@ export const RingDial: React.FC = () => {
           AXIS
         </text>
       </svg>
-
+      
       {/* Book Overlay */}
       <BookOverlay books={books} />
     </div>
@@ -6,11 +6,11 @@ import { useEventsByAge } from '../hooks/useTimelineData';
 export const TimelinePanel: React.FC = () => {
   const { selectedAge, isExpanded, setSelectedAge } = useTimelineContext();
   const { events, loading } = useEventsByAge(selectedAge?.id || 0);
-
+  
   if (!selectedAge || !isExpanded) return null;
-
+  
   const handleClose = () => setSelectedAge(null);
-
+  
   return (
     <div className="fixed right-0 top-0 h-full w-full lg:w-2/3 bg-timeline-bg z-40 shadow-2xl timeline-panel-enter-active">
       {/* Header */}
@@ -32,7 +32,7 @@ export const TimelinePanel: React.FC = () => {
           </svg>
         </button>
       </div>
-
+      
       {/* Timeline Events */}
       <div className="h-full overflow-x-auto bg-timeline-bg">
         {loading ? (
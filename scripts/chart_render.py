@@ -0,0 +1,290 @@
+"""Shared, warm image export for the plotly chart scripts.
+
+Every chart script (IDEAS FROM PERPLEXITY/chart_script.py,
+docs/READING/chart_script.py, docs/READING/chart_script_1.py) calls
+`fig.write_image`, and run on its own each call pays for starting a fresh
+kaleido/Chromium export. This runner executes the chart scripts in one
+process instead:
+
+- while they run, `fig.write_image` is redirected to `render_figure(fig,
+  path)`, which only queues the export;
+- after the scripts ran, the queue is rendered in batches through a single
+  kaleido server that stays warm for the whole run;
+- each output is cached by a hash of the figure JSON plus the export options
+  and the plotly/kaleido versions, so unchanged diagrams are not exported
+  again as long as the file on disk still matches.
+
+Chart scripts need nothing from this module: run on their own,
+`fig.write_image` exports as usual. A chart script that fails is reported and skipped (its
+exports are dropped); the others still render, and `run` exits non-zero.
+
+The manifest lives in .build_cache/chart_render_manifest.json (git-ignored).
+
+Usage:
+    python scripts/chart_render.py run              # all chart scripts
+    python scripts/chart_render.py run docs/READING/chart_script.py --force
+    python scripts/chart_render.py bench            # cold vs warm vs cached timings
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import metadata
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(REPO_ROOT, ".build_cache", "chart_render_manifest.json")
+IDEAS_DIR = "apps/frontend/public/docs/Documentation for Zoroasterverse Website/IDEAS FROM PERPLEXITY"
+CHART_SCRIPTS = [
+    f"{IDEAS_DIR}/chart_script.py",
+    "docs/READING/chart_script.py",
+    "docs/READING/chart_script_1.py",
+]
+DEFAULT_BATCH_SIZE = 16
+
+# bench: export one figure the way a standalone chart script does
+COLD_EXPORT = """
+import sys
+import plotly.io as pio
+fig = pio.from_json(sys.stdin.read(), skip_invalid=True)
+pio.write_image(fig, sys.argv[1], format=sys.argv[2])
+"""
+
+# Exports queued by render_figure() until flush()
+_queue = []
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _version(package):
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "missing"
+
+
+def figure_key(fig_json, options):
+    digest = hashlib.sha256()
+    digest.update(fig_json.encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    digest.update(f"plotly {_version('plotly')} kaleido {_version('kaleido')}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def render_figure(fig, path, format=None, width=None, height=None, scale=None):
+    """Queue `fig` for export to `path` (relative to the current directory)."""
+    import plotly.io as pio
+
+    path = os.path.abspath(path)
+    format = format or os.path.splitext(path)[1].lstrip(".") or "png"
+    options = {"format": format, "width": width, "height": height, "scale": scale}
+    fig_json = pio.to_json(fig, validate=False, pretty=False)
+    _queue.append({"fig": fig, "path": path, "options": options, "key": figure_key(fig_json, options)})
+
+
+def _queue_write_image(fig, file, format=None, scale=None, width=None, height=None, **kwargs):
+    # Stands in for BaseFigure.write_image (same argument order) inside collect()
+    render_figure(fig, file, format=format, width=width, height=height, scale=scale)
+
+
+def _start_server():
+    # kaleido >= 1 exports through a browser; start one and reuse it for every
+    # call. kaleido 0.2 keeps its own Chromium scope alive between calls.
+    try:
+        import kaleido
+    except ImportError as exc:
+        raise RuntimeError("Image export requires kaleido (pip install kaleido)") from exc
+    if hasattr(kaleido, "start_sync_server"):
+        kaleido.start_sync_server(silence_warnings=True)
+        return lambda: kaleido.stop_sync_server(silence_warnings=True)
+    return lambda: None
+
+
+def _write_batch(jobs):
+    import plotly.io as pio
+
+    tmp_paths = [f"{job['path']}.render.tmp.{job['options']['format']}" for job in jobs]
+    if hasattr(pio, "write_images"):
+        pio.write_images(
+            [job["fig"] for job in jobs], tmp_paths,
+            format=[job["options"]["format"] for job in jobs],
+            width=[job["options"]["width"] for job in jobs],
+            height=[job["options"]["height"] for job in jobs],
+            scale=[job["options"]["scale"] for job in jobs],
+            validate=False,
+        )
+    else:
+        for job, tmp_path in zip(jobs, tmp_paths):
+            pio.write_image(job["fig"], tmp_path, validate=False, **job["options"])
+    for job, tmp_path in zip(jobs, tmp_paths):
+        os.replace(tmp_path, job["path"])
+
+
+def flush(use_cache=True, batch_size=DEFAULT_BATCH_SIZE, manifest_path=MANIFEST_PATH):
+    """Render every queued export that is not cached; returns {"cached": n, "rendered": n}."""
+    manifest = load_manifest(manifest_path)
+    jobs, counts = [], {"cached": 0, "rendered": 0}
+
+    while _queue:
+        job = _queue.pop(0)
+        name = os.path.relpath(job["path"], REPO_ROOT)
+        record = manifest.get(name)
+        if (use_cache and record and record["key"] == job["key"] and os.path.exists(job["path"])
+                and file_digest(job["path"]) == record["output"]):
+            counts["cached"] += 1
+        else:
+            jobs.append((name, job))
+
+    if jobs:
+        stop_server = _start_server()
+        try:
+            for start in range(0, len(jobs), batch_size):
+                batch = jobs[start:start + batch_size]
+                _write_batch([job for _, job in batch])
+                for name, job in batch:
+                    manifest[name] = {"key": job["key"], "output": file_digest(job["path"])}
+                counts["rendered"] += len(batch)
+        finally:
+            stop_server()
+        save_manifest(manifest, manifest_path)
+    return counts
+
+
+def collect(scripts, verbose=False):
+    """Execute chart scripts in this process; their exports end up in the queue.
+
+    Returns {script: error message} for the scripts that failed; whatever a
+    failed script queued before failing is discarded.
+    """
+    from plotly.basedatatypes import BaseFigure
+
+    # Figures are only exported; fig.show() must not open a browser per script,
+    # and fig.write_image() queues the export for flush()
+    show, write_image = BaseFigure.show, BaseFigure.write_image
+    BaseFigure.show = lambda self, *args, **kwargs: None
+    BaseFigure.write_image = _queue_write_image
+
+    previous_cwd, previous_path = os.getcwd(), list(sys.path)
+    failures = {}
+    try:
+        for script in scripts:
+            path = os.path.join(REPO_ROOT, script)
+            directory = os.path.dirname(path)
+            queued = len(_queue)
+            os.chdir(directory)
+            sys.path.insert(0, directory)
+            output = None if verbose else io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output or sys.stdout):
+                    runpy.run_path(path, run_name="__main__")
+            except (Exception, SystemExit) as exc:
+                failures[script] = f"{type(exc).__name__}: {exc}"
+                del _queue[queued:]
+            sys.path[:] = previous_path
+    finally:
+        BaseFigure.show = show
+        BaseFigure.write_image = write_image
+        os.chdir(previous_cwd)
+        sys.path[:] = previous_path
+    return failures
+
+
+def run_scripts(scripts, use_cache=True, verbose=False, manifest_path=MANIFEST_PATH):
+    """Execute chart scripts in this process, then export their figures together.
+
+    Returns the flush() counts plus {"failed": {script: error message}}.
+    """
+    failures = collect(scripts, verbose)
+    counts = flush(use_cache=use_cache, manifest_path=manifest_path)
+    counts["failed"] = failures
+    return counts
+
+
+def bench(scripts):
+    """Seconds to export the scripts' figures cold (a fresh python + kaleido per
+    figure, as running each script with fig.write_image did), warm (one
+    process, one kaleido server, cache disabled) and cached. Outputs go to a
+    temporary directory."""
+    import plotly.io as pio
+
+    collect(scripts)
+    jobs = list(_queue)
+    _queue.clear()
+    timings = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, "manifest.json")
+        for index, job in enumerate(jobs):
+            job["path"] = os.path.join(tmp_dir, f"{index}.{job['options']['format']}")
+
+        start = time.perf_counter()
+        for job in jobs:
+            subprocess.run([sys.executable, "-c", COLD_EXPORT, job["path"], job["options"]["format"]],
+                           input=pio.to_json(job["fig"], validate=False), text=True, check=True)
+        timings["cold"] = time.perf_counter() - start
+
+        for label, use_cache in (("warm", False), ("cached", True)):
+            _queue.extend(jobs)
+            start = time.perf_counter()
+            flush(use_cache=use_cache, manifest_path=manifest_path)
+            timings[label] = time.perf_counter() - start
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the plotly chart scripts with one warm exporter")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run chart scripts and export changed figures")
+    run.add_argument("scripts", nargs="*", default=CHART_SCRIPTS, help="Paths relative to the repo root")
+    run.add_argument("--force", action="store_true", help="Export even if the cache is fresh")
+    run.add_argument("--verbose", action="store_true", help="Show chart script output")
+
+    timing = subparsers.add_parser("bench", help="Compare cold, warm and cached rendering")
+    timing.add_argument("scripts", nargs="*", default=CHART_SCRIPTS)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        counts = run_scripts(args.scripts, use_cache=not args.force, verbose=args.verbose)
+        for script, error in counts["failed"].items():
+            print(f"failed  {script}: {error}", file=sys.stderr)
+        print(f"{counts['rendered']} rendered, {counts['cached']} cached, {len(counts['failed'])} failed")
+        if counts["failed"]:
+            sys.exit(1)
+        return
+
+    for name, seconds in bench(args.scripts).items():
+        print(f"{name:>7}: {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
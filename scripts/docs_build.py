@@ -0,0 +1,192 @@
+"""Content-addressed build runner for the Python docs generators.
+
+Each generator is one or more notebook-exported scripts that write artifacts
+(SQL schemas, TypeScript examples, Phase 3 components, the beta reader app)
+into their own folder. Running them unconditionally rewrites every artifact
+and bumps its mtime, which makes the Vite/Vercel builds redo work.
+
+This runner hashes each generator's inputs (its scripts' source). When the
+hash and every recorded output hash still match, the generator is skipped
+without running. Otherwise the scripts run in a scratch directory and only
+outputs whose content actually changed are moved into place; unchanged
+outputs are left untouched, so their mtimes survive.
+
+The manifest lives in .build_cache/docs_manifest.json (git-ignored).
+Generators only write under their single source folder; afterwards the public
+docs tree is mirrored into dist/docs by publish_docs.py.
+
+Usage:
+    python scripts/docs_build.py              # build everything that changed
+    python scripts/docs_build.py --force      # re-run every generator
+    python scripts/docs_build.py --only reading-schema --verbose
+    python scripts/docs_build.py --no-publish # skip the dist/docs mirror
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(REPO_ROOT, ".build_cache", "docs_manifest.json")
+IDEAS_DIR = "apps/frontend/public/docs/Documentation for Zoroasterverse Website/IDEAS FROM PERPLEXITY"
+
+# name -> (working directory, scripts run in order in one shared namespace);
+# a script given as a list is [script, *command-line arguments]
+GENERATORS = {
+    "reading-schema": ("docs/READING", ["script.py"]),
+    "reading-code-examples": ("docs/READING", ["script_1.py"]),
+    "timeline-phase3": ("docs/TIMELINE", ["script.py", "script_1.py"]),
+    "store-migration": ("docs/New folder", ["script_2.py"]),
+    "beta-reader-config": (IDEAS_DIR, [
+        "script.py",
+        ["beta_reader_table.py", "--config", "beta_reader_application_system.json",
+         "--output", "beta_reader_scoring_table.js"],
+    ]),
+    "beta-reader-app": (IDEAS_DIR, ["script 2.py"]),
+    "beta-reader-page": (IDEAS_DIR, ["script 3.py"]),
+}
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def script_command(entry):
+    """[script, *arguments] for a GENERATORS script entry."""
+    return [entry] if isinstance(entry, str) else list(entry)
+
+
+def input_digest(directory, scripts):
+    digest = hashlib.sha256()
+    for entry in scripts:
+        script, *arguments = script_command(entry)
+        digest.update("\0".join([script] + arguments).encode("utf-8") + b"\0")
+        with open(os.path.join(directory, script), "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_fresh(record, key, directory):
+    """True when `record` was built from `key` and every output is still intact."""
+    if not record or record.get("input") != key:
+        return False
+    for name, digest in record.get("outputs", {}).items():
+        path = os.path.join(directory, name)
+        if not os.path.exists(path) or file_digest(path) != digest:
+            return False
+    return True
+
+
+def run_scripts(directory, scripts, scratch, verbose=False):
+    """Execute `scripts` with `scratch` as cwd; returns {relative output path: digest}."""
+    namespace = {}
+    previous_cwd, previous_argv = os.getcwd(), sys.argv
+    output = None if verbose else io.StringIO()
+    os.chdir(scratch)
+    try:
+        with contextlib.redirect_stdout(output or sys.stdout):
+            for entry in scripts:
+                script, *arguments = script_command(entry)
+                # Scripts with an argparse main() must see their own arguments, not ours
+                sys.argv = [script] + arguments
+                namespace = runpy.run_path(os.path.join(directory, script), init_globals=namespace,
+                                           run_name="__main__")
+    finally:
+        os.chdir(previous_cwd)
+        sys.argv = previous_argv
+
+    produced = {}
+    for root, _, files in os.walk(scratch):
+        for name in files:
+            path = os.path.join(root, name)
+            produced[os.path.relpath(path, scratch)] = file_digest(path)
+    return produced
+
+
+def move_changed_outputs(produced, scratch, directory):
+    """Move changed outputs into `directory`; returns the names actually replaced."""
+    changed = []
+    for name, digest in sorted(produced.items()):
+        target = os.path.join(directory, name)
+        if os.path.exists(target) and file_digest(target) == digest:
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(os.path.join(scratch, name), target)
+        changed.append(name)
+    return changed
+
+
+def build(names=None, force=False, verbose=False, manifest_path=MANIFEST_PATH):
+    """Run the selected generators; returns {name: (status, changed outputs)}."""
+    manifest = load_manifest(manifest_path)
+    results = {}
+
+    for name in names or GENERATORS:
+        relative_dir, scripts = GENERATORS[name]
+        directory = os.path.join(REPO_ROOT, relative_dir)
+        key = input_digest(directory, scripts)
+
+        if not force and is_fresh(manifest.get(name), key, directory):
+            results[name] = ("skipped", [])
+            continue
+
+        with tempfile.TemporaryDirectory(prefix="docs_build_") as scratch:
+            produced = run_scripts(directory, scripts, scratch, verbose)
+            changed = move_changed_outputs(produced, scratch, directory)
+
+        manifest[name] = {"input": key, "outputs": produced}
+        results[name] = ("updated" if changed else "unchanged", changed)
+
+    save_manifest(manifest, manifest_path)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the docs generators, skipping unchanged ones")
+    parser.add_argument("--only", action="append", choices=sorted(GENERATORS),
+                        help="Generator to run (repeatable)")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and re-run")
+    parser.add_argument("--verbose", action="store_true", help="Show generator output")
+    parser.add_argument("--no-publish", action="store_true", help="Do not mirror docs into dist/docs")
+    args = parser.parse_args(argv)
+
+    for name, (status, changed) in build(args.only, args.force, args.verbose).items():
+        detail = f": {', '.join(changed)}" if changed else ""
+        print(f"{status:>9}  {name}{detail}")
+
+    if not args.no_publish:
+        import publish_docs
+
+        counts = publish_docs.publish()
+        print("dist/docs: " + ", ".join(f"{count} {action}" for action, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Publish apps/frontend/public/docs to dist/docs from a single source tree.
+
+dist/docs used to be a committed, byte-for-byte second copy of the public docs
+(generators included), so every build hashed and shipped the tree twice. The
+docs generators now only run against apps/frontend/public/docs and this step
+mirrors the result into dist/docs:
+
+- files are hardlinked when source and target share a filesystem, and copied
+  otherwise (or with --copy);
+- every source file's SHA-256 is recorded in a manifest and reused while the
+  file's size and mtime are unchanged, so untouched files are never re-hashed;
+- copies are verified against the manifest hash, hardlinks by inode;
+- files that disappeared from the source are removed from dist/docs.
+
+The manifest lives in .build_cache/docs_publish_manifest.json (git-ignored).
+
+Usage:
+    python scripts/publish_docs.py
+    python scripts/publish_docs.py --copy --target /tmp/docs
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(REPO_ROOT, "apps", "frontend", "public", "docs")
+TARGET_DIR = os.path.join(REPO_ROOT, "dist", "docs")
+MANIFEST_PATH = os.path.join(REPO_ROOT, ".build_cache", "docs_publish_manifest.json")
+EXCLUDED_DIRS = {"__pycache__", ".build_cache"}
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def scan_source(source_dir, previous):
+    """{relative path: {sha256, size, mtime_ns}}, reusing hashes of unchanged files."""
+    files = {}
+    for root, dirs, names in os.walk(source_dir):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, source_dir)
+            stat = os.stat(path)
+            known = previous.get(relative)
+            if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+                files[relative] = known
+            else:
+                files[relative] = {"sha256": file_digest(path), "size": stat.st_size,
+                                   "mtime_ns": stat.st_mtime_ns}
+    return files
+
+
+def _place(source, target, copy):
+    tmp_path = target + ".publish.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    if not copy:
+        try:
+            os.link(source, tmp_path)
+            os.replace(tmp_path, target)
+            return "linked"
+        except OSError:
+            pass
+    shutil.copy2(source, tmp_path)
+    os.replace(tmp_path, target)
+    return "copied"
+
+
+def publish(source_dir=SOURCE_DIR, target_dir=TARGET_DIR, copy=False, manifest_path=MANIFEST_PATH):
+    """Mirror `source_dir` into `target_dir`; returns counts per action."""
+    manifest = load_manifest(manifest_path)
+    files = scan_source(source_dir, manifest.get("files", {}))
+    counts = {"unchanged": 0, "linked": 0, "copied": 0, "removed": 0}
+
+    for relative, info in files.items():
+        source = os.path.join(source_dir, relative)
+        target = os.path.join(target_dir, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        if os.path.exists(target):
+            if os.path.samefile(source, target):
+                counts["unchanged"] += 1
+                continue
+            if copy and os.path.getsize(target) == info["size"] and file_digest(target) == info["sha256"]:
+                counts["unchanged"] += 1
+                continue
+
+        action = _place(source, target, copy)
+        if action == "copied" and file_digest(target) != info["sha256"]:
+            raise RuntimeError(f"Published copy of {relative} does not match its source hash")
+        counts[action] += 1
+
+    for root, dirs, names in os.walk(target_dir, topdown=False):
+        for name in names:
+            path = os.path.join(root, name)
+            if os.path.relpath(path, target_dir) not in files:
+                os.remove(path)
+                counts["removed"] += 1
+        if root != target_dir and not os.listdir(root):
+            os.rmdir(root)
+
+    save_manifest({"source": os.path.relpath(source_dir, REPO_ROOT), "files": files}, manifest_path)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish the public docs tree into dist/docs")
+    parser.add_argument("--source", default=SOURCE_DIR)
+    parser.add_argument("--target", default=TARGET_DIR)
+    parser.add_argument("--copy", action="store_true", help="Copy files instead of hardlinking")
+    args = parser.parse_args(argv)
+
+    counts = publish(args.source, args.target, args.copy)
+    print(", ".join(f"{count} {action}" for action, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
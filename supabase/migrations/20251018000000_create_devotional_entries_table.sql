@@ -0,0 +1,33 @@
+-- =====================================================
+-- DEVOTIONAL ENTRIES TABLE
+-- Gathic devotional calendar entries, one row per (locale, year, day).
+-- Loaded in batches by apps/frontend/public/docs/gatha/calendar_export.py;
+-- year 0 is the evergreen calendar that is not tied to a specific year.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS devotional_entries (
+    locale TEXT NOT NULL DEFAULT 'en',
+    year INTEGER NOT NULL DEFAULT 0 CHECK (year >= 0),
+    day INTEGER NOT NULL CHECK (day BETWEEN 1 AND 366),
+
+    text TEXT NOT NULL,
+    tags TEXT[] NOT NULL DEFAULT '{}',
+    source TEXT NOT NULL CHECK (source IN ('yasna', 'gathic-inspired')),
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    PRIMARY KEY (locale, year, day)
+);
+
+-- Tag filters ("entries tagged asha") from the tag browser
+CREATE INDEX IF NOT EXISTS idx_devotional_entries_tags ON devotional_entries USING GIN (tags);
+
+-- Enable RLS
+ALTER TABLE devotional_entries ENABLE ROW LEVEL SECURITY;
+
+-- The calendar is public content
+DROP POLICY IF EXISTS "devotional_entries_select_policy" ON devotional_entries;
+CREATE POLICY "devotional_entries_select_policy" ON devotional_entries
+    FOR SELECT USING (true);
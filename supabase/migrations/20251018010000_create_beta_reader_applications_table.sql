@@ -0,0 +1,40 @@
+-- =====================================================
+-- BETA READER APPLICATIONS TABLE
+-- Validated and scored beta reader applications, one row per application id.
+-- Upserted in batches by "IDEAS FROM PERPLEXITY/beta_reader_ingest.py" from
+-- partner CSV/JSONL exports; scoring follows beta_reader_application_system.json.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS beta_reader_applications (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL DEFAULT 'form',
+
+    -- Raw answers keyed by question id
+    responses JSONB NOT NULL,
+
+    -- Scoring
+    stage_scores JSONB NOT NULL DEFAULT '{}',
+    bonuses INTEGER NOT NULL DEFAULT 0,
+    total_score INTEGER,
+    failed_stage TEXT,
+    classification TEXT NOT NULL CHECK (classification IN (
+        'auto_accept', 'strong_candidate', 'interview_required', 'auto_reject', 'disqualified'
+    )),
+    scoring_digest TEXT NOT NULL,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL
+);
+
+-- Review queues ("strong candidates, best first")
+CREATE INDEX IF NOT EXISTS idx_beta_reader_applications_classification
+    ON beta_reader_applications(classification, total_score DESC);
+
+-- Enable RLS
+ALTER TABLE beta_reader_applications ENABLE ROW LEVEL SECURITY;
+
+-- Applications hold personal answers; only admins may read or manage them
+DROP POLICY IF EXISTS "beta_reader_applications_admin_policy" ON beta_reader_applications;
+CREATE POLICY "beta_reader_applications_admin_policy" ON beta_reader_applications
+    FOR ALL USING (public.is_admin());